@@ -0,0 +1,93 @@
+'''Benchmark of String.compress: memory saved, and the cost of reading a
+   compressed String, for several block sizes, versus a plain String.
+
+Two texts are measured: random words (bench_String.make_text), which
+compress little, and repetitive log lines, the kind of cold data compression
+is meant for.  Reads are random characters (each likely in a block not
+cached), short substrings near one another (mostly in cached blocks) and a
+full search.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_CompressedBuffer [length [block sizes...]]
+
+    length      : characters of the text (default 10_000_000)
+    block sizes : characters per compressed block (default 4096 32768 262144)
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+from benchmarks.bench_String import make_text
+import random
+import sys
+import time
+
+# reads of each kind timed per String
+READS = 2_000
+
+###############################################################################
+
+def make_log(length: int, seed: int = 23) -> str:
+    ''' returns about length characters of log lines, repeating a few
+        templates with varying numbers
+    '''
+    rng   = random.Random(seed)
+    paths = ["/index.html", "/api/v1/users", "/api/v1/orders", "/static/app.js", "/login"]
+    lines, total = [], 0
+    while total < length:
+        line = (f"2024-03-{rng.randrange(1, 29):02} 12:{rng.randrange(60):02}:"
+                f"{rng.randrange(60):02} INFO GET {rng.choice(paths)} "
+                f"status={rng.choice((200, 200, 200, 304, 404))} ms={rng.randrange(300)}\n")
+        lines.append(line)
+        total += len(line)
+    return "".join(lines)[:length]
+
+def time_reads(string: String, rng: random.Random) -> tuple:
+    ''' returns the microseconds per random [] read, per nearby substring
+        read, and the seconds taken by one find of an absent needle
+    '''
+    n = string.len()
+    start = time.perf_counter()
+    for _ in range(READS):
+        string[rng.randrange(n)]
+    random_read = (time.perf_counter() - start) / READS * 1e6
+
+    # READS substrings of up to 80 characters, 100 apart (closer on short texts)
+    step = max(min(100, n // READS), 1)
+    position = rng.randrange(max(1, n - step * READS))
+    start = time.perf_counter()
+    for i in range(READS):
+        low = min(position + step * i, n)
+        str(string.substring(low, min(low + 80, n)))
+    nearby_read = (time.perf_counter() - start) / READS * 1e6
+
+    start = time.perf_counter()
+    string.find("qzxq")
+    return random_read, nearby_read, time.perf_counter() - start
+
+###############################################################################
+
+if __name__ == '__main__':
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    blocks = [int(b) for b in sys.argv[2:]] or [4096, 32768, 262144]
+    print(f"{length} characters")
+    print(f"{'text':<6} {'block':>8} {'MB':>8} {'ratio':>7} {'compress s':>11} {'random us':>10} "
+          f"{'nearby us':>10} {'find s':>8}")
+    for name, text in (('words', make_text(length)), ('logs', make_log(length))):
+        plain = String(text)
+        size  = plain.len() * plain._chars.itemsize
+        print(f"{name:<6} {'plain':>8} {size / 1e6:>8.2f} {1:>7.1f} {0:>11.2f} "
+              + " ".join(f"{t:>10.2f}" if i < 2 else f"{t:>8.3f}"
+                         for i, t in enumerate(time_reads(plain, random.Random(1)))))
+        for block in blocks:
+            start = time.perf_counter()
+            compressed = plain.compress(block)
+            compress_time = time.perf_counter() - start
+            nbytes = compressed._chars.nbytes()
+            random_read, nearby_read, find_time = time_reads(compressed, random.Random(1))
+            print(f"{name:<6} {block:>8} {nbytes / 1e6:>8.2f} {size / nbytes:>7.1f} "
+                  f"{compress_time:>11.2f} {random_read:>10.2f} {nearby_read:>10.2f} "
+                  f"{find_time:>8.3f}")
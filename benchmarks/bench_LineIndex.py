@@ -0,0 +1,59 @@
+'''Benchmark of String.offset_to_line_col, backed by a LineIndex, versus
+   counting the newlines before the offset on every lookup, and of the cost of
+   keeping the index up to date through s[i] = char.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_LineIndex [lines]
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+from benchmarks.bench_String import make_text
+import random
+import sys
+import time
+
+###############################################################################
+
+def scan_line_col(text: str, offset: int) -> tuple:
+    ''' returns the (line, column) of offset by scanning text from the start '''
+    line  = text.count("\n", 0, offset)
+    start = text.rfind("\n", 0, offset) + 1
+    return line, offset - start
+
+def per_call(function, arguments) -> float:
+    ''' returns the mean microseconds of function over arguments '''
+    start = time.perf_counter()
+    for argument in arguments:
+        function(argument)
+    return (time.perf_counter() - start) / len(arguments) * 1e6
+
+###############################################################################
+
+if __name__ == '__main__':
+    lines  = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    text   = make_text(lines * 40)
+    text   = "\n".join(text[i : i + 39] for i in range(0, len(text), 40))
+    string = String(text)
+    offsets = [random.randrange(len(text)) for _ in range(200)]
+
+    start = time.perf_counter()
+    string.line_index()
+    print(f"{lines} lines: index built in {time.perf_counter() - start:.3f} s")
+    assert all(string.offset_to_line_col(i) == scan_line_col(text, i) for i in offsets)
+    print(f"offset_to_line_col  {per_call(string.offset_to_line_col, offsets):>10.1f} µs")
+    print(f"scan from start     {per_call(lambda i: scan_line_col(text, i), offsets):>10.1f} µs")
+
+    def set_newline(i):
+        string[i] = "\n" if string[i] != "\n" else "x"
+    index = string.line_index()
+    print(f"s[i] = char, index  {per_call(set_newline, offsets):>10.1f} µs"
+          f"  (same index kept: {string.line_index() is index})")
+    plain = String(text)
+    def set_plain(i):
+        plain[i] = "\n" if plain[i] != "\n" else "x"
+    print(f"s[i] = char, none   {per_call(set_plain, offsets):>10.1f} µs")
@@ -0,0 +1,96 @@
+'''Benchmark of multi-pattern search: one PatternSet scan versus looping a
+   single-needle search over every keyword, with Pattern on the String and
+   with str.find on the str (whose C search is the baseline to beat).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_PatternSet [text length] [keyword counts...]
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+from code_base.Pattern import Pattern
+from code_base.PatternSet import PatternSet
+import random
+import string
+import sys
+import time
+
+###############################################################################
+
+def make_text(length: int, seed: int = 229) -> str:
+    ''' returns a random log-like str of lower-case words separated by spaces '''
+    rng = random.Random(seed)
+    words = []
+    while sum(map(len, words)) + len(words) < length:
+        words.append("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9))))
+    return " ".join(words)[:length]
+
+def make_keywords(count: int, seed: int = 229) -> list:
+    ''' returns count distinct random keywords of 4 to 8 lower-case letters '''
+    rng = random.Random(seed + count)
+    keywords = set()
+    while len(keywords) < count:
+        keywords.add("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 8))))
+    return sorted(keywords)
+
+def count_with_find(text: str, keyword: str) -> int:
+    ''' returns the number of non-overlapping occurrences of keyword in text,
+        found one after the other with str.find
+    '''
+    found, total = text.find(keyword), 0
+    while found >= 0:
+        total += 1
+        found = text.find(keyword, found + len(keyword))
+    return total
+
+def bench(text_length: int, keyword_count: int) -> dict:
+    ''' times the three approaches on one text, checking that they agree
+
+    Returns:
+        a dict of the measurements, throughputs in characters per second
+    '''
+    text     = String(make_text(text_length))
+    keywords = make_keywords(keyword_count)
+
+    start = time.perf_counter()
+    patterns = PatternSet(keywords)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    multi = patterns.count(text)
+    scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = {k: sum(1 for _ in Pattern(k).finditer(text)) for k in keywords}
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    plain = str(text)
+    baseline = {k: count_with_find(plain, k) for k in keywords}
+    str_loop = time.perf_counter() - start
+
+    # finditer counts non-overlapping matches; random 4+ letter keywords
+    # practically never overlap themselves, but make sure the numbers agree
+    assert multi == single == baseline, "PatternSet, Pattern and str.find disagree"
+    return {'text_length': text_length, 'keywords': keyword_count,
+            'build_s': build, 'patternset_s': scan, 'loop_s': loop, 'str_loop_s': str_loop,
+            'patternset_chars_per_s': text_length / scan,
+            'loop_chars_per_s': text_length / loop,
+            'str_loop_chars_per_s': text_length / str_loop}
+
+###############################################################################
+
+if __name__ == '__main__':
+    text_length = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    counts = [int(c) for c in sys.argv[2:]] or [1, 10, 100, 1000]
+    # speedups of PatternSet over each loop; below 1 means the loop is faster
+    print(f"{'keywords':>8} {'build s':>9} {'PatternSet s':>13} {'Pattern loop s':>15} "
+          f"{'speedup':>8} {'str.find loop s':>16} {'speedup':>8}")
+    for count in counts:
+        r = bench(text_length, count)
+        print(f"{count:>8} {r['build_s']:>9.4f} {r['patternset_s']:>13.4f} "
+              f"{r['loop_s']:>15.4f} {r['loop_s'] / r['patternset_s']:>7.2f}x "
+              f"{r['str_loop_s']:>16.4f} {r['str_loop_s'] / r['patternset_s']:>7.2f}x")
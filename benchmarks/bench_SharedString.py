@@ -0,0 +1,106 @@
+'''Throughput of SharedString under contention, versus one global lock
+   around a plain String.
+
+Reader threads repeatedly read a character, a substring and the length;
+writer threads repeatedly overwrite a character.  Both run together for a
+fixed time, and the reads and writes completed per second are reported, with
+the longest time a single read took, for several mixes of readers and
+writers.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_SharedString [seconds [length]]
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+from code_base.SharedString import SharedString
+from benchmarks.bench_String import make_text
+import random
+import sys
+import threading
+import time
+
+# (readers, writers) mixes measured
+MIXES = ((4, 0), (4, 1), (4, 4), (1, 4), (8, 2))
+
+###############################################################################
+
+class LockedString:
+    '''The baseline: a String behind one lock taken by readers and writers.'''
+
+    def __init__(self, text: str) -> None:
+        self._string = String(text)
+        self._lock   = threading.Lock()
+
+    def read(self, i: int) -> tuple:
+        with self._lock:
+            return self._string[i], self._string.substring(i, i + 50), self._string.len()
+
+    def write(self, i: int, char: str) -> None:
+        with self._lock:
+            self._string[i] = char
+
+class Shared:
+    '''SharedString through the same two calls as LockedString.'''
+
+    def __init__(self, text: str) -> None:
+        self._shared = SharedString(text)
+
+    def read(self, i: int) -> tuple:
+        snapshot = self._shared.snapshot()   # one consistent version, no lock
+        return snapshot[i], snapshot.substring(i, i + 50), snapshot.len()
+
+    def write(self, i: int, char: str) -> None:
+        self._shared[i] = char
+
+###############################################################################
+
+def run(target, readers: int, writers: int, seconds: float, length: int) -> tuple:
+    ''' runs the threads against target for the given time
+
+    Returns:
+        (reads per second, writes per second, longest read in seconds)
+    '''
+    counts = [0] * (readers + writers)
+    longest = [0.0] * readers
+    stop = threading.Event()
+
+    def reader(slot: int) -> None:
+        rng = random.Random(slot)
+        while not stop.is_set():
+            start = time.perf_counter()
+            target.read(rng.randrange(length - 50))
+            longest[slot] = max(longest[slot], time.perf_counter() - start)
+            counts[slot] += 1
+
+    def writer(slot: int) -> None:
+        rng = random.Random(slot)
+        while not stop.is_set():
+            target.write(rng.randrange(length), rng.choice("xyz"))
+            counts[slot] += 1
+
+    threads = [threading.Thread(target = reader, args = (i,)) for i in range(readers)] + \
+              [threading.Thread(target = writer, args = (readers + i,)) for i in range(writers)]
+    for thread in threads: thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads: thread.join()
+    return sum(counts[:readers]) / seconds, sum(counts[readers:]) / seconds, max(longest, default = 0.0)
+
+###############################################################################
+
+if __name__ == '__main__':
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    length  = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    text    = make_text(length)
+    print(f"{'readers':>7} {'writers':>7} {'variant':<13} {'reads/s':>10} {'writes/s':>10} "
+          f"{'worst read ms':>13}")
+    for readers, writers in MIXES:
+        for name, target in (('global lock', LockedString(text)), ('SharedString', Shared(text))):
+            reads, writes, worst = run(target, readers, writers, seconds, length)
+            print(f"{readers:>7} {writers:>7} {name:<13} {reads:>10.0f} {writes:>10.0f} "
+                  f"{worst * 1e3:>13.2f}")
@@ -0,0 +1,250 @@
+'''Benchmark of the core String operations against the built-in str, across
+   input sizes, with a check of how each operation scales.
+
+For every operation and size the best time per call (over REPEAT batches)
+and the peak memory allocated by one call are recorded, for String and for
+the nearest str equivalent.  A power law time ~ size ** exponent is then
+fitted to the sizes >= FIT_FROM, and the run fails (exit status 1) if the
+exponent of a String operation is above its limit: either MAX_EXPONENT
+below, or the exponent stored in a previous --json output given as
+--baseline, plus TOLERANCE.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_String [--max-size N] [--json FILE]
+                                      [--baseline FILE] [operations...]
+
+    --max-size : largest size, a power of 10 (default 10**6; up to 10**7)
+    --json     : also write the results as JSON to FILE ('-' for stdout)
+    --baseline : JSON results of an earlier run to compare exponents with
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+import argparse
+import json
+import math
+import platform
+import random
+import string
+import sys
+import time
+import tracemalloc
+
+# batches timed per measurement, and the time one batch should take
+REPEAT = 5
+BATCH_SECONDS = 0.02
+# bound on the characters held by the fresh arguments of one batch
+BATCH_CHARS = 20_000_000
+# sizes below this are dominated by call overhead and are not fitted
+FIT_FROM = 1_000
+# allowed increase of an exponent over the --baseline one
+TOLERANCE = 0.25
+
+# upper limits on the fitted exponent of each String operation: linear ones
+# must stay about linear; constant-time ones get 0.5, since touching a large
+# freshly built buffer costs some cache misses, while a slip to O(n) gives ~1
+MAX_EXPONENT = {
+    '__init__':    1.25,
+    '__str__':     1.25,
+    'len':         0.5,
+    '__eq__':      1.25,
+    '__getitem__': 0.5,
+    '__setitem__': 0.5,
+    '__add__':     0.5,
+    'substring':   0.5,
+}
+
+###############################################################################
+
+def make_text(size: int, seed: int = 229) -> str:
+    ''' returns a random str of size lower-case letters and spaces '''
+    return "".join(random.Random(seed).choices(string.ascii_lowercase + " ", k = size))
+
+def _copy(text: str) -> str:
+    ''' returns an equal str that is a different object, so comparisons
+        cannot short-cut on identity
+    '''
+    return text.encode('utf-8').decode('utf-8')
+
+def _replace_middle(text: str) -> str:
+    ''' the str equivalent of String.__setitem__: building a new str '''
+    i = len(text) // 2
+    return text[:i] + "x" + text[i + 1:]
+
+# Each case is (fresh, make, run): make(text) returns the argument of run; if
+# fresh is True a new argument is made for every call, outside the timing
+# (for operations that cache or mutate), otherwise one is reused.
+OPERATIONS = {
+    '__init__': (
+        (False, lambda t: t, String),
+        (False, lambda t: t.encode('utf-8'), lambda b: b.decode('utf-8'))),
+    '__str__': (
+        (True, String, str),
+        (False, lambda t: t, str)),
+    'len': (
+        (False, String, lambda s: s.len()),
+        (False, lambda t: t, len)),
+    '__eq__': (
+        (True, lambda t: (String(t), String(t)), lambda p: p[0] == p[1]),
+        (True, lambda t: (_copy(t), _copy(t)), lambda p: p[0] == p[1])),
+    '__getitem__': (
+        (False, String, lambda s: s[s.len() // 2]),
+        (False, lambda t: t, lambda t: t[len(t) // 2])),
+    '__setitem__': (
+        (True, String, lambda s: s.__setitem__(s.len() // 2, "x")),
+        (False, lambda t: t, _replace_middle)),
+    '__add__': (
+        (False, String, lambda s: s + s),
+        (False, lambda t: t, lambda t: t + t)),
+    'substring': (
+        (False, String, lambda s: s.substring(s.len() // 4, 3 * s.len() // 4)),
+        (False, lambda t: t, lambda t: t[len(t) // 4 : 3 * len(t) // 4])),
+}
+
+###############################################################################
+
+def measure(case: tuple, text: str) -> tuple:
+    ''' times one case on one text
+
+    Returns:
+        the best seconds per call over REPEAT batches, and the peak bytes
+        allocated during a single call
+    '''
+    fresh, make, run = case
+    shared = make(text)
+
+    # (1) size the batch so that it takes about BATCH_SECONDS
+    start = time.perf_counter()
+    run(make(text) if fresh else shared)
+    once = max(time.perf_counter() - start, 1e-7)
+    number = max(1, int(BATCH_SECONDS / once))
+    if fresh:
+        number = min(number, max(1, BATCH_CHARS // max(len(text), 1)))
+
+    # (2) best of REPEAT batches; calls on fresh arguments are timed one by
+    # one, as a batch of large new buffers mostly measures cache misses
+    best = math.inf
+    for _ in range(REPEAT):
+        arguments = [make(text) for _ in range(number)] if fresh else [shared] * number
+        if fresh:
+            for argument in arguments:
+                start = time.perf_counter()
+                run(argument)
+                best = min(best, time.perf_counter() - start)
+        else:
+            start = time.perf_counter()
+            for argument in arguments:
+                run(argument)
+            best = min(best, (time.perf_counter() - start) / number)
+        del arguments
+
+    # (3) memory of one call
+    argument = make(text) if fresh else shared
+    tracemalloc.start()
+    result = run(argument)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+def exponent(sizes: list, seconds: list) -> float:
+    ''' returns the least-squares slope of log(seconds) against log(size),
+        over the sizes >= FIT_FROM (or all of them, if fewer than two are)
+    '''
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, seconds) if n >= FIT_FROM]
+    if len(points) < 2:
+        points = [(math.log(n), math.log(t)) for n, t in zip(sizes, seconds)]
+    if len(points) < 2:
+        return float('nan')
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance   = sum((x - mean_x) ** 2 for x, _ in points)
+    return covariance / variance
+
+def run_suite(sizes: list, operations: list) -> dict:
+    ''' measures every operation for String and str at every size
+
+    Returns:
+        a JSON-serializable dict of the raw results and fitted exponents
+    '''
+    results, exponents = [], {}
+    texts = {n: make_text(n) for n in sizes}
+    for name in operations:
+        exponents[name] = {}
+        for implementation, case in zip(('String', 'str'), OPERATIONS[name]):
+            timings = []
+            for n in sizes:
+                seconds, peak = measure(case, texts[n])
+                timings.append(seconds)
+                results.append({'operation': name, 'implementation': implementation,
+                                'size': n, 'seconds': seconds, 'peak_bytes': peak})
+            exponents[name][implementation] = exponent(sizes, timings)
+    return {'python': platform.python_version(), 'sizes': sizes,
+            'results': results, 'exponents': exponents}
+
+def regressions(report: dict, baseline: dict = None) -> list:
+    ''' returns a list of messages, one per String operation whose fitted
+        exponent is above its limit (from baseline if given, else MAX_EXPONENT)
+    '''
+    messages = []
+    for name, fitted in report['exponents'].items():
+        measured = fitted['String']
+        if baseline is not None and name in baseline.get('exponents', {}):
+            limit = baseline['exponents'][name]['String'] + TOLERANCE
+        else:
+            limit = MAX_EXPONENT[name]
+        if measured > limit:
+            messages.append(f"{name}: exponent {measured:.2f} exceeds limit {limit:.2f}")
+    return messages
+
+###############################################################################
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description = "String vs str benchmark")
+    parser.add_argument('operations', nargs = '*')
+    parser.add_argument('--max-size', type = int, default = 10 ** 6)
+    parser.add_argument('--json')
+    parser.add_argument('--baseline')
+    args = parser.parse_args(argv)
+    unknown = set(args.operations) - set(OPERATIONS)
+    if unknown:
+        parser.error(f"unknown operations {sorted(unknown)}; choose from {list(OPERATIONS)}")
+
+    sizes = [10 ** k for k in range(1, round(math.log10(args.max_size)) + 1)]
+    report = run_suite(sizes, args.operations or list(OPERATIONS))
+
+    print(f"{'operation':<12} {'size':>9} {'String us':>11} {'str us':>11} "
+          f"{'String KB':>10} {'str KB':>10}", file = sys.stderr)
+    rows = {(r['operation'], r['implementation'], r['size']): r for r in report['results']}
+    for name in report['exponents']:
+        for n in sizes:
+            mine, native = rows[name, 'String', n], rows[name, 'str', n]
+            print(f"{name:<12} {n:>9} {mine['seconds'] * 1e6:>11.2f} "
+                  f"{native['seconds'] * 1e6:>11.2f} {mine['peak_bytes'] / 1e3:>10.1f} "
+                  f"{native['peak_bytes'] / 1e3:>10.1f}", file = sys.stderr)
+        fitted = report['exponents'][name]
+        print(f"{name:<12} {'exponent':>9} {fitted['String']:>11.2f} {fitted['str']:>11.2f}",
+              file = sys.stderr)
+
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent = 1)
+    elif args.json:
+        with open(args.json, 'w') as file:
+            json.dump(report, file, indent = 1)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    failures = regressions(report, baseline)
+    for message in failures:
+        print("REGRESSION", message, file = sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+'''Benchmark of the full-text indexes in SuffixArray.py: build time, memory
+   footprint and query time, versus scanning the text with Pattern.count.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_SuffixArray [text lengths...]
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+from code_base.Pattern import Pattern
+from code_base.SuffixArray import SuffixArray, FMIndex
+from benchmarks.bench_PatternSet import make_text
+import random
+import sys
+import time
+import tracemalloc
+
+###############################################################################
+
+def measure(build) -> tuple:
+    ''' calls build(), returning its result, the seconds it took and the bytes
+        still allocated by it afterwards (i.e. the footprint of the index,
+        including any text it keeps if build() made that text itself)
+    '''
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - start
+    footprint = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, seconds, footprint
+
+def bench(text_length: int, queries: int = 200) -> dict:
+    ''' builds both indexes on a random text and times count queries
+
+    Returns:
+        a dict of the measurements (seconds and bytes)
+    '''
+    plain = make_text(text_length)
+    text = String(plain)
+    rng = random.Random(text_length)
+    needles = []
+    for _ in range(queries):
+        start = rng.randrange(text_length - 8)
+        needles.append(str(text.substring(start, start + rng.randint(3, 8))))
+
+    # each index gets its own String, so whatever text it keeps is measured
+    suffix_array, sa_build, sa_bytes = measure(lambda: SuffixArray(String(plain)))
+    fm_index, fm_build, fm_bytes = measure(lambda: FMIndex(String(plain)))
+
+    timings = {}
+    for name, count in (('scan', lambda n: Pattern(n).count(text)),
+                        ('suffix_array', suffix_array.count),
+                        ('fm_index', fm_index.count)):
+        start = time.perf_counter()
+        for needle in needles:
+            count(needle)
+        timings[name] = (time.perf_counter() - start) / queries
+
+    return {'text_length': text_length, 'sa_build_s': sa_build, 'sa_bytes': sa_bytes,
+            'fm_build_s': fm_build, 'fm_bytes': fm_bytes,
+            'scan_query_s': timings['scan'], 'sa_query_s': timings['suffix_array'],
+            'fm_query_s': timings['fm_index']}
+
+###############################################################################
+
+if __name__ == '__main__':
+    lengths = [int(n) for n in sys.argv[1:]] or [10_000, 100_000]
+    print(f"{'length':>8} {'SA build s':>10} {'SA MB':>7} {'FM build s':>10} {'FM MB':>7} "
+          f"{'scan q us':>10} {'SA q us':>8} {'FM q us':>8}")
+    for length in lengths:
+        r = bench(length)
+        print(f"{length:>8} {r['sa_build_s']:>10.2f} {r['sa_bytes'] / 1e6:>7.2f} "
+              f"{r['fm_build_s']:>10.2f} {r['fm_bytes'] / 1e6:>7.2f} "
+              f"{r['scan_query_s'] * 1e6:>10.0f} {r['sa_query_s'] * 1e6:>8.0f} "
+              f"{r['fm_query_s'] * 1e6:>8.0f}")
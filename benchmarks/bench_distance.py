@@ -0,0 +1,105 @@
+'''Benchmark of distance.py on long near-duplicate texts: edit distance (with
+   and without a cutoff), LCS length and diff, by character and by line,
+   versus the textbook O(n * m) dynamic program and difflib.
+
+The dynamic program is timed on a short prefix and scaled up quadratically
+to the full length, as running it on 10**5 characters would take hours.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_distance [length [edits...]]
+
+    length : characters per text (default 100_000)
+    edits  : numbers of random single-character edits between the two texts
+             (default 10 100 1000)
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+from code_base import distance
+from benchmarks.bench_PatternSet import make_text
+import difflib
+import random
+import sys
+import time
+
+# characters of the prefix the dynamic program is timed on
+DP_LENGTH = 2_000
+
+###############################################################################
+
+def edit(text: str, edits: int, seed: int = 17) -> str:
+    ''' returns text after edits random single-character insertions,
+        deletions and substitutions (and a newline every 80 characters or
+        so, so that the line diff has lines to compare)
+    '''
+    rng = random.Random(seed)
+    characters = list(text)
+    for _ in range(edits):
+        i, kind = rng.randrange(len(characters)), rng.randrange(3)
+        if kind == 0:
+            characters.insert(i, rng.choice("XYZ"))
+        elif kind == 1:
+            del characters[i]
+        else:
+            characters[i] = rng.choice("XYZ")
+    return "".join(characters)
+
+def with_lines(text: str) -> str:
+    ''' returns text with every 80th space made a newline '''
+    words = text.split(" ")
+    return "".join(word + ("\n" if i % 12 == 11 else " ") for i, word in enumerate(words))
+
+def dynamic_program(a: str, b: str) -> int:
+    ''' the textbook O(n * m) edit distance '''
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y)))
+        previous = current
+    return previous[-1]
+
+def timed(function) -> tuple:
+    ''' returns the result of function() and the seconds it took '''
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+def bench(length: int, edits: int) -> dict:
+    ''' times every function on a text of length characters and an edited
+        copy of it
+
+    Returns:
+        a dict of (result, seconds) per function
+    '''
+    a_text = with_lines(make_text(length))
+    b_text = edit(a_text, edits)
+    a, b = String(a_text), String(b_text)
+
+    results = {
+        'levenshtein':        timed(lambda: a.edit_distance(b)),
+        'levenshtein cutoff': timed(lambda: a.edit_distance(b, max_distance = edits)),
+        'lcs_length':         timed(lambda: distance.lcs_length(a, b)),
+        'diff':               timed(lambda: len(a.diff(b))),
+        'diff lines':         timed(lambda: len(a.diff(b, lines = True))),
+        'difflib lines':      timed(lambda: len(difflib.SequenceMatcher(
+                                  None, a_text.splitlines(True), b_text.splitlines(True),
+                                  autojunk = False).get_opcodes())),
+    }
+    _, seconds = timed(lambda: dynamic_program(a_text[:DP_LENGTH], b_text[:DP_LENGTH]))
+    results['DP (scaled)'] = (None, seconds * (length / DP_LENGTH) ** 2)
+    return results
+
+###############################################################################
+
+if __name__ == '__main__':
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    edit_counts = [int(n) for n in sys.argv[2:]] or [10, 100, 1000]
+    print(f"{'edits':>6} {'function':<20} {'result':>10} {'seconds':>10}")
+    for edits in edit_counts:
+        for name, (result, seconds) in bench(length, edits).items():
+            print(f"{edits:>6} {name:<20} {'' if result is None else result:>10} {seconds:>10.4f}")
@@ -0,0 +1,77 @@
+'''Scaling benchmark of parallel.py: the same searches and transforms of one
+   large String with 1, 2, ... N worker processes.
+
+For each operation the time with every number of workers is printed along
+with the speedup over one worker (which runs in the calling process, with
+no pool or shared memory), and the time of the sequential equivalent:
+Pattern for the searches, str methods for the transforms.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_parallel [length [max workers]]
+
+    length      : characters in the text (default 20_000_000)
+    max workers : largest pool tried (default: the number of cores)
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+from code_base.Pattern import Pattern
+from code_base import parallel
+from benchmarks.bench_PatternSet import make_text
+import os
+import sys
+import time
+
+# needles: one common, one rare, one that can overlap itself
+NEEDLES = ("the", "qzx", "abab")
+TABLE   = str.maketrans("abc", "xyz")
+
+###############################################################################
+
+def timed(function) -> float:
+    ''' returns the best seconds of three calls of function() '''
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def operations(text: String) -> dict:
+    ''' returns, per operation name, (parallel function of workers,
+        sequential function)
+    '''
+    cases = {}
+    for needle in NEEDLES:
+        cases[f'count {needle!r}'] = (lambda w, n = needle: parallel.count(text, n, w),
+                                      lambda n = needle: Pattern(n).count(text))
+    cases["find_all 'the'"] = (lambda w: parallel.find_all(text, "the", w),
+                               lambda: list(Pattern("the").finditer(text)))
+    cases['transform upper'] = (lambda w: parallel.transform(text, str.upper, w),
+                                lambda: String(str(text).upper()))
+    cases['translate'] = (lambda w: parallel.translate(text, TABLE, w),
+                          lambda: String(str(text).translate(TABLE)))
+    return cases
+
+###############################################################################
+
+if __name__ == '__main__':
+    length  = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000_000
+    most    = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    base    = make_text(min(length, 1_000_000)) + " abab"
+    text    = String((base * (length // len(base) + 1))[:length])
+    counts  = [w for w in (1, 2, 4, 8, 16, 32, 64) if w < most] + [most]
+
+    print(f"{length} characters, {os.cpu_count()} cores")
+    print(f"{'operation':<18} {'workers':>7} {'seconds':>9} {'speedup':>8}")
+    for name, (run, sequential) in operations(text).items():
+        single = None
+        for workers in counts:
+            seconds = timed(lambda: run(workers))
+            single  = single or seconds
+            print(f"{name:<18} {workers:>7} {seconds:>9.3f} {single / seconds:>8.2f}")
+        print(f"{name:<18} {'seq':>7} {timed(sequential):>9.3f}")
@@ -0,0 +1,71 @@
+'''Benchmark of serialize.py: saving a corpus of Strings and loading it back,
+   versus pickling their strs and rebuilding the Strings on loading.
+
+The corpus is made of short "token" Strings (around 8 characters each) and
+is also timed as one single String, with one random access after loading.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_serialize [characters [directory]]
+
+    characters : total characters of the corpus (default 20_000_000)
+    directory  : where to write the files (default: a temporary directory)
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+from code_base import serialize
+from benchmarks.bench_String import make_text
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+###############################################################################
+
+def timed(function, *args):
+    ''' returns (seconds taken, result) of function(*args) '''
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+def pickle_dump(strings, path: str) -> None:
+    with open(path, 'wb') as file:
+        pickle.dump([str(s) for s in strings], file, protocol = pickle.HIGHEST_PROTOCOL)
+
+def pickle_load(path: str) -> list:
+    with open(path, 'rb') as file:
+        return [String(s) for s in pickle.load(file)]
+
+###############################################################################
+
+if __name__ == '__main__':
+    length    = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000_000
+    directory = sys.argv[2] if len(sys.argv) > 2 else tempfile.mkdtemp()
+    text      = make_text(length)
+    rng       = random.Random(22)
+    cuts      = sorted(rng.sample(range(1, length), length // 8))
+    tokens    = [text[a:b] for a, b in zip([0] + cuts, cuts + [length])]
+    index     = rng.randrange(len(tokens))
+
+    print(f"{length} characters, {len(tokens)} tokens")
+    print(f"{'corpus':<8} {'format':<10} {'dump s':>8} {'load s':>10} {'access s':>10} {'MB':>8}")
+    for name, corpus in (('tokens', tokens), ('single', String(text))):
+        for format_name, dump, load in (('serialize', serialize.dump, serialize.load),
+                                        ('pickle', pickle_dump, pickle_load)):
+            if name == 'single' and format_name == 'pickle':
+                dump, load = (lambda s, p: pickle_dump([s], p)), (lambda p: pickle_load(p)[0])
+            path = os.path.join(directory, f"{name}.{format_name}")
+            dump_time, _      = timed(dump, corpus, path)
+            load_time, loaded = timed(load, path)
+            access_time, _    = timed(lambda: str(loaded[index] if name == 'tokens' else
+                                                  loaded.substring(index, index + 8)))
+            size = os.path.getsize(path) / 1e6
+            print(f"{name:<8} {format_name:<10} {dump_time:>8.2f} {load_time:>10.6f} "
+                  f"{access_time:>10.6f} {size:>8.1f}")
+            os.remove(path)
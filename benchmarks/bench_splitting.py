@@ -0,0 +1,54 @@
+'''Benchmark of String.split, splitlines and split(any_of = ...) versus going
+   through str: str(s).split() with a String built from each piece.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_splitting [length]
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+from benchmarks.bench_String import make_text
+import re
+import sys
+import time
+import tracemalloc
+
+###############################################################################
+
+def measure(function) -> tuple:
+    ''' returns (seconds, peak MB allocated, number of pieces) for consuming
+        every piece function() generates
+    '''
+    start = time.perf_counter()
+    pieces = sum(1 for _ in function())
+    seconds = time.perf_counter() - start
+    tracemalloc.start()                 # a second run, as tracing slows it down
+    sum(1 for _ in function())
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return seconds, peak, pieces
+
+###############################################################################
+
+if __name__ == '__main__':
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    text   = make_text(length)
+    text   = "\n".join(text[i : i + 70] for i in range(0, len(text), 70))
+    string = String(text)
+
+    print(f"{len(text)} characters")
+    print(f"{'operation':<22} {'variant':<8} {'seconds':>8} {'peak MB':>8} {'pieces':>9}")
+    cases = (('split()',          lambda: string.split(),
+                                  lambda: map(String, str(string).split())),
+             ('splitlines()',     lambda: string.splitlines(),
+                                  lambda: map(String, str(string).splitlines())),
+             ('split(any_of=" \\n")', lambda: string.split(any_of = " \n"),
+                                  lambda: map(String, re.split("[ \n]", str(string)))))
+    for name, views, copies in cases:
+        for variant, function in (('views', views), ('str', copies)):
+            seconds, peak, pieces = measure(function)
+            print(f"{name:<22} {variant:<8} {seconds:>8.3f} {peak:>8.1f} {pieces:>9}")
@@ -0,0 +1,154 @@
+'''Read-only code-point buffer kept in memory compressed, block by block.
+
+A CompressedBuffer stands in for the array.array of code points behind a
+String (see String.compress), like a MappedBuffer does for files: it offers
+the same typecode, itemsize, len(), [] access, slicing (which returns a real
+array) and decode().  The code points are cut into blocks of BLOCK
+characters, each compressed on its own with zlib, so that reading a
+character or a substring only decompresses the block(s) it lies in.
+
+As every block but the last holds exactly BLOCK characters, character i is
+in block i // BLOCK: the block index is just the list of compressed blocks,
+and len() is stored.  The last CACHE blocks decompressed are kept, most
+recently used last, so that nearby reads cost a dict lookup.
+
+Repetitive texts shrink a lot (runs and repeats are what zlib encodes best);
+a block of text with no repeats costs about its own size plus a few bytes.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from array import array
+import zlib
+
+from .codepoints import decode
+
+# characters per compressed block, and number of decompressed blocks kept
+BLOCK = 1 << 15
+CACHE = 8
+
+###############################################################################
+
+class CompressedBuffer:
+    '''Array-like, read-only view of code points stored as compressed blocks.
+
+    Attributes:
+        typecode : the typecode of the arrays returned by slicing
+        itemsize : bytes per code point in those arrays
+        nbytes   : returns the number of bytes the compressed blocks take
+        decode   : returns the str of a range of characters
+    '''
+
+    __slots__ = ('typecode', 'itemsize', '_blocks', '_length', '_block_size', '_cache')
+
+    #####################################################
+    def __init__(self, chars, start: int = 0, end: int = None, block: int = BLOCK,
+                 level: int = 6) -> None:
+        ''' initialization method for the CompressedBuffer class, compressing
+            code points [start, end) of chars one block at a time
+
+        Args:
+            chars: an array.array of code points (or an array-like buffer,
+                such as a MappedBuffer, whose slices are arrays)
+            start: index of the first code point to compress
+            end:   index one past the last one (default: the end of chars)
+            block: number of characters per compressed block
+            level: zlib compression level, 1 (fastest) to 9 (smallest)
+
+        Raises:
+            ValueError: if block is not positive
+        '''
+        if block <= 0:
+            raise ValueError("CompressedBuffer block size must be positive")
+        end = len(chars) if end is None else end
+        self.typecode    = chars.typecode
+        self.itemsize    = array(self.typecode).itemsize
+        self._length     = max(end - start, 0)
+        self._block_size = block
+        self._cache      = {}   # block number -> array, least recently used first
+        window = memoryview(chars) if isinstance(chars, array) else None
+        self._blocks = [zlib.compress(window[lo : lo + block] if window is not None
+                                      else chars[lo : lo + block], level)
+                        for lo in range(start, start + self._length, block)]
+
+    #####################################################
+    def __len__(self) -> int:
+        return self._length
+
+    #####################################################
+    def nbytes(self) -> int:
+        ''' returns the number of bytes taken by the compressed blocks '''
+        return sum(map(len, self._blocks))
+
+    #####################################################
+    def _block(self, number: int) -> array:
+        ''' returns the decompressed code points of one block, through the
+            cache of the last CACHE blocks used
+        '''
+        chars = self._cache.pop(number, None)
+        if chars is None:
+            chars = array(self.typecode)
+            chars.frombytes(zlib.decompress(self._blocks[number]))
+            if len(self._cache) >= CACHE:
+                del self._cache[next(iter(self._cache))]   # least recently used
+        self._cache[number] = chars
+        return chars
+
+    #####################################################
+    def _pieces(self, start: int, end: int):
+        ''' generator over (base, block array, lo, hi) covering characters
+            [start, end), block by block: block[lo:hi] holds characters
+            [base + lo, base + hi)
+        '''
+        size = self._block_size
+        for number in range(start // size, (end - 1) // size + 1 if end > start else 0):
+            base = number * size
+            yield base, self._block(number), max(start - base, 0), min(end - base, size)
+
+    #####################################################
+    def decode(self, start: int, end: int) -> str:
+        ''' returns the str of characters [start, end)
+
+        Args:
+            start: index of the first character (0 <= start <= len)
+            end:   index one past the last character (start <= end <= len)
+
+        Returns:
+            an str of end - start characters
+        '''
+        return decode(self[start:end])
+
+    #####################################################
+    def __getitem__(self, index):
+        ''' overrides the __getitem__ special method
+
+        Args:
+            index: an int (negative counts from the end) or a slice with step 1
+
+        Returns:
+            the int code point at index, or an array.array (of this buffer's
+            typecode) holding a copy of the sliced code points
+
+        Raises:
+            IndexError: if an int index is out of range
+        '''
+        if isinstance(index, slice):
+            start, end, step = index.indices(self._length)
+            if step != 1:
+                raise ValueError("CompressedBuffer slices must have step 1")
+            chars = array(self.typecode)
+            for _, block, lo, hi in self._pieces(start, end):
+                chars.frombytes(memoryview(block)[lo:hi].cast('B'))
+            return chars
+
+        if index < 0: index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("CompressedBuffer index out of range")
+        return self._block(index // self._block_size)[index % self._block_size]
+
+    #####################################################
+    def __repr__(self) -> str:
+        return f'CompressedBuffer({self._length} characters in {len(self._blocks)} blocks, ' \
+               f'{self.nbytes()} bytes)'
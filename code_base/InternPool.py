@@ -0,0 +1,176 @@
+'''Interning: one shared, canonical FrozenString for all equal contents.
+
+Keys, tags and tokens tend to be built over and over with the same contents,
+each String with its own buffer.  An InternPool hands back the same
+FrozenString for every equal text it is given, so duplicates share one
+compact buffer and, as String.__eq__ first checks identity, comparing two
+interned Strings costs one pointer comparison.
+
+The table of canonical Strings is bounded in one of two ways:
+
+    - weak (the default): the pool only holds weak references, so a
+      canonical String disappears from it as soon as nothing else uses it;
+    - LRU: the pool holds at most capacity canonical Strings, forgetting
+      the least recently interned one when full.  Interning a forgotten
+      text again makes a new canonical String, equal to (but no longer
+      identical with) any copy of the old one still in use.
+
+A canonical String owns a compact copy of its characters: interning a short
+substring of a large text does not keep the large text alive.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from array import array
+from collections import OrderedDict
+import threading
+import weakref
+
+from .String import FrozenString
+
+###############################################################################
+
+class InternPool:
+    '''A table of canonical FrozenStrings, one per distinct contents.
+
+    Attributes:
+        intern      : returns the canonical FrozenString equal to a String or str
+        len         : returns the (int) number of canonical Strings held
+        __contains__: True if the pool holds a canonical String equal to a text
+        clear       : forgets every canonical String
+    '''
+
+    __slots__ = ('_capacity', '_table', '_lock')
+
+    #####################################################
+    def __init__(self, capacity: int = None) -> None:
+        ''' initialization method for the InternPool class
+
+        Args:
+            capacity: the int maximum number of canonical Strings kept, least
+                recently interned first out; None (default) keeps them for as
+                long as they are used anywhere else, through weak references
+
+        Raises:
+            ValueError: if capacity is not positive
+        '''
+        if capacity is not None and capacity <= 0:
+            raise ValueError("InternPool capacity must be positive")
+        self._capacity = capacity
+        # LRU: OrderedDict {canonical: canonical}; weak: {hash: [weakref, ...]}
+        self._table = OrderedDict() if capacity is not None else {}
+        self._lock  = threading.RLock()   # re-entered by weakref callbacks
+
+    #####################################################
+    def intern(self, text: 'String | str') -> FrozenString:
+        ''' returns the canonical FrozenString equal to text, making text (or
+            a compact copy of it) the canonical one if there is none yet
+
+        Args:
+            text: a String or str
+
+        Returns:
+            a FrozenString equal to text, the same object for every equal text
+            while it stays in the pool
+        '''
+        if isinstance(text, str):
+            # compare buffers rather than caching a str in canonical Strings;
+            # the probe itself becomes canonical if the text is new
+            key, text = hash(text), FrozenString(text)
+            text._hash = key
+        else:
+            key = hash(text)   # equal Strings and strs hash the same
+        with self._lock:
+            if self._capacity is not None:
+                canonical = self._table.get(text)
+                if canonical is not None:
+                    self._table.move_to_end(canonical)
+                    return canonical
+                canonical = _canonical(text, key)
+                self._table[canonical] = canonical
+                if len(self._table) > self._capacity:
+                    self._table.popitem(last = False)
+                return canonical
+
+            bucket = self._table.get(key, [])
+            for ref in tuple(bucket):
+                canonical = ref()
+                if canonical is not None and canonical == text:
+                    return canonical
+            canonical = _canonical(text, key)
+            bucket.append(weakref.ref(canonical, self._forget(key)))
+            self._table[key] = bucket
+            return canonical
+
+    #####################################################
+    def _forget(self, key: int):
+        ''' returns the weakref callback dropping a dead canonical String of
+            hash key from the weak table
+        '''
+        def forget(ref: weakref.ref) -> None:
+            with self._lock:
+                bucket = self._table.get(key)
+                if bucket is not None and ref in bucket:
+                    bucket.remove(ref)
+                    if not bucket:
+                        del self._table[key]
+        return forget
+
+    #####################################################
+    def len(self) -> int:
+        ''' returns the number of canonical Strings in the pool '''
+        with self._lock:
+            if self._capacity is not None:
+                return len(self._table)
+            return sum(ref() is not None for bucket in self._table.values() for ref in bucket)
+
+    def __len__(self) -> int:
+        return self.len()
+
+    #####################################################
+    def __contains__(self, text: 'String | str') -> bool:
+        ''' returns True if the pool holds a canonical String equal to text,
+            without interning it
+        '''
+        with self._lock:
+            if self._capacity is not None:
+                return text in self._table
+            return any(ref() is not None and ref() == text
+                       for ref in self._table.get(hash(text), ()))
+
+    #####################################################
+    def clear(self) -> None:
+        ''' forgets every canonical String; Strings already handed out are
+            unaffected, but interning equal texts afterwards gives new ones
+        '''
+        with self._lock:
+            self._table.clear()
+
+    #####################################################
+    def __repr__(self) -> str:
+        bound = 'weak' if self._capacity is None else f'capacity = {self._capacity}'
+        return f'InternPool({bound}, {self.len()} Strings)'
+
+###############################################################################
+
+def _canonical(text: 'String | str', key: int) -> FrozenString:
+    ''' returns a FrozenString equal to text to make canonical: text itself
+        if it is a FrozenString owning exactly its buffer, else a compact copy
+        (never a view pinning a larger buffer, nor a rope)
+    '''
+    if type(text) is FrozenString and isinstance(text._chars, array) and text._start == 0 \
+            and text._length == len(text._chars):
+        return text
+    canonical = FrozenString(str(text))
+    canonical._hash = key
+    return canonical
+
+_pool = InternPool()
+
+def intern(text: 'String | str') -> FrozenString:
+    ''' returns the canonical FrozenString equal to text from a process-wide
+        weak InternPool (see InternPool.intern)
+    '''
+    return _pool.intern(text)
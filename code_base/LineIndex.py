@@ -0,0 +1,134 @@
+'''Index of the line starts of a String, for line/column lookups in O(log n).
+
+A LineIndex records, in a sorted array, the offset at which every line of a
+text starts: 0, and one past each newline ("\\n"; a "\\r" before it stays
+at the end of its line).  Converting between offsets and (line, column)
+pairs is then a binary search instead of a scan from the start.
+
+Lines and columns count from 0, like offsets, and a column is a number of
+characters from the start of the line.  The position one past the end of
+the text is valid: it is where a character would be appended.
+
+Building a LineIndex takes one pass over the text, searching newlines with
+str.find over windows decoded from the buffer (see codepoints.finditer), so
+in C and in O(n) whether the String is in memory, mapped from a file or
+compressed; it takes 8 bytes per line.  String.line_index() keeps it up to
+date as single characters are overwritten with [], by inserting or removing
+the one line start concerned; any other edit of the String makes it build a
+new one when next used.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from .codepoints import buffer_of, finditer
+
+###############################################################################
+
+class LineIndex:
+    '''The sorted start offsets of the lines of a String.
+
+    Attributes:
+        line_count        : returns the (int) number of lines
+        offset_to_line_col: returns the (line, column) of an offset
+        line_col_to_offset: returns the offset of a (line, column)
+        line_bounds       : returns the (start, end) offsets of a line
+    '''
+
+    __slots__ = ('_starts', '_length')
+
+    #####################################################
+    def __init__(self, text: 'String | str') -> None:
+        ''' initialization method for the LineIndex class, finding every
+            newline of text
+
+        Args:
+            text: a String or str
+        '''
+        chars, start, end = buffer_of(text)
+        self._starts = array('q', [0])
+        self._starts.extend(found - start + 1 for found in finditer(chars, "\n", start, end))
+        self._length = end - start
+
+    #####################################################
+    def line_count(self) -> int:
+        ''' returns the number of lines: one more than the number of newlines '''
+        return len(self._starts)
+
+    def __len__(self) -> int:
+        return self.line_count()
+
+    #####################################################
+    def offset_to_line_col(self, offset: int) -> tuple:
+        ''' returns the line and column of the character at offset
+
+        Args:
+            offset: an int, 0 <= offset <= length of the text
+
+        Returns:
+            (line, column), two ints counted from 0
+
+        Raises:
+            IndexError: if offset is out of range
+        '''
+        if not 0 <= offset <= self._length:
+            raise IndexError("Offset invalid relative to string length")
+        line = bisect_right(self._starts, offset) - 1
+        return line, offset - self._starts[line]
+
+    #####################################################
+    def line_col_to_offset(self, line: int, column: int) -> int:
+        ''' returns the offset of the character at column of line
+
+        Args:
+            line:   an int line number (negative values count from the end)
+            column: an int, from 0 up to the length of the line (its end,
+                    where its newline is, or the end of the text)
+
+        Returns:
+            an int offset
+
+        Raises:
+            IndexError: if line or column is out of range
+        '''
+        start, end = self.line_bounds(line)
+        if not 0 <= column <= end - start:
+            raise IndexError("Column invalid relative to line length")
+        return start + column
+
+    #####################################################
+    def line_bounds(self, line: int) -> tuple:
+        ''' returns the (start, end) offsets of a line, end being the offset
+            of its newline (or of the end of the text, for the last line)
+
+        Raises:
+            IndexError: if line is out of range
+        '''
+        count = len(self._starts)
+        if line < 0: line += count
+        if not 0 <= line < count:
+            raise IndexError("Line number invalid relative to line count")
+        end = self._starts[line + 1] - 1 if line + 1 < count else self._length
+        return self._starts[line], end
+
+    #####################################################
+    def _update(self, offset: int, old: str, new: str) -> None:
+        ''' updates the index after the character at offset changed from old
+            to new, when either of them is a newline: inserts or removes the
+            start of the line that follows it (O(log n) to find, plus moving
+            the later starts along in the array)
+        '''
+        if (old == "\n") == (new == "\n"):
+            return
+        if new == "\n":
+            self._starts.insert(bisect_left(self._starts, offset + 1), offset + 1)
+        else:
+            del self._starts[bisect_left(self._starts, offset + 1)]
+
+    #####################################################
+    def __repr__(self) -> str:
+        return f'LineIndex({self.line_count()} lines, {self._length} characters)'
@@ -0,0 +1,233 @@
+'''Read-only code-point buffer served lazily from a memory-mapped file.
+
+A MappedBuffer stands in for the array.array of code points behind a String
+(see String.from_file): it offers the same typecode, itemsize, len(), []
+access, slicing (which returns a real array) and decode(), but reads the
+characters out of the mapped file on demand, so opening even a huge file
+costs almost no memory.
+
+Two layouts are supported:
+
+    - direct: encodings where each code point is stored as one fixed-size
+      unsigned integer (latin-1, ascii, and UTF-32 in native byte order);
+      character i simply lives at byte i * itemsize.
+    - indexed: any other stateless encoding (UTF-8, UTF-16 with an explicit
+      byte order, cp1252, ...).  On opening, the file is decoded once, a
+      chunk at a time, recording the byte offset of every BLOCK-th character;
+      a character is then found by decoding the one block that contains it.
+      The index takes 8 bytes per BLOCK characters.
+
+A direct MappedBuffer can also view just a region of a mapped file holding
+code points in any of the three widths (see serialize.py, whose files keep
+many Strings in one such region).
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from array import array
+import codecs
+import mmap
+
+from .codepoints import UCS1, UCS2, UCS4, UTF16, UTF32, typecode_for, encode, widen
+
+# characters per block of the offset index, and bytes per read when building it
+BLOCK = 1024
+CHUNK = 1 << 20
+
+# normalized codec names stored as one fixed-size code point per character
+_DIRECT = {'iso8859-1': UCS1, 'ascii': UCS1, UTF32: UCS4}
+
+# codecs decoding the bytes of a direct buffer, by typecode
+_CODECS = {UCS1: 'latin-1', UCS2: UTF16, UCS4: UTF32}
+
+# codecs whose output depends on a byte order mark, which blocks cannot see
+_WITH_BOM = {'utf-16', 'utf-32', 'utf-8-sig'}
+
+###############################################################################
+
+class MappedBuffer:
+    '''Array-like, read-only view of the code points of a memory-mapped file.
+
+    Attributes:
+        path     : the path of the mapped file
+        encoding : the (normalized) name of the file's encoding
+        typecode : the typecode of the arrays returned by slicing
+        itemsize : bytes per code point in those arrays
+        decode   : returns the str of a range of characters
+    '''
+
+    __slots__ = ('path', 'encoding', 'typecode', 'itemsize', '_map', '_base', '_view',
+                 '_length', '_offsets', '_cached', '_cached_block')
+
+    #####################################################
+    def __init__(self, path: str, encoding: str = 'utf-8') -> None:
+        ''' initialization method for the MappedBuffer class, mapping the file
+            and, for variable-width encodings, building the offset index
+
+        Args:
+            path:     the path of the file to map
+            encoding: the name of the file's text encoding
+
+        Raises:
+            ValueError: for encodings relying on a byte order mark
+            UnicodeDecodeError: if the file is not valid in that encoding
+        '''
+        self.path     = path
+        self.encoding = codecs.lookup(encoding).name
+        if self.encoding in _WITH_BOM:
+            raise ValueError(f"Encoding {encoding!r} needs a byte order mark; "
+                             "give the byte order explicitly (e.g. utf-16-le)")
+
+        with open(path, 'rb') as file:
+            try:
+                self._map = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ)
+            except ValueError:   # empty files cannot be mapped
+                self._map = b''
+        self._base = 0                       # byte offset of character 0 in _map
+        self._cached, self._cached_block = "", -1
+
+        if self.encoding in _DIRECT:
+            self.typecode = _DIRECT[self.encoding]
+            self._view    = memoryview(self._map).cast(self.typecode)
+            self._length  = len(self._view)
+            self._offsets = None
+        else:
+            self._view = None
+            self._build_index()
+        self.itemsize = array(self.typecode).itemsize
+
+    #####################################################
+    @classmethod
+    def _from_region(cls, path: str, source, offset: int, length: int,
+                     typecode: str) -> 'MappedBuffer':
+        ''' builds a direct MappedBuffer over length code points of the given
+            typecode stored in native byte order at byte offset of an already
+            mapped file (internal use only)
+
+        Args:
+            path:     the path of the mapped file
+            source:   the mmap (or bytes-like object) of the file
+            offset:   byte offset of the first code point, a multiple of its size
+            length:   number of code points
+            typecode: 'B', 'H' or the 4-byte typecode, the size of each one
+
+        Returns:
+            a MappedBuffer sharing source
+        '''
+        buffer = cls.__new__(cls)
+        buffer.path, buffer.encoding = path, codecs.lookup(_CODECS[typecode]).name
+        buffer.typecode, buffer.itemsize = typecode, array(typecode).itemsize
+        buffer._map, buffer._base = source, offset
+        buffer._view = memoryview(source)[offset : offset + length * buffer.itemsize].cast(typecode)
+        buffer._length, buffer._offsets = length, None
+        buffer._cached, buffer._cached_block = "", -1
+        return buffer
+
+    #####################################################
+    def _build_index(self) -> None:
+        ''' decodes the whole file once, a CHUNK at a time, recording the byte
+            offset of every BLOCK-th character and the widest code point
+        '''
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        offsets = array('q', [0])
+        length, widest, byte_position = 0, 0, 0   # byte_position: start of text
+        size = len(self._map)
+
+        for chunk_start in range(0, size, CHUNK):
+            final = chunk_start + CHUNK >= size
+            text  = decoder.decode(self._map[chunk_start : chunk_start + CHUNK], final)
+            if text:
+                widest = max(widest, ord(max(text)))
+            # walk to each block boundary falling inside this text
+            done = 0
+            for boundary in range(BLOCK - length % BLOCK, len(text) + 1, BLOCK):
+                if boundary == len(text) and final:
+                    break   # the end of the file is added below
+                byte_position += len(text[done:boundary].encode(self.encoding))
+                offsets.append(byte_position)
+                done = boundary
+            byte_position += len(text[done:].encode(self.encoding))
+            length += len(text)
+
+        offsets.append(size)
+        self._offsets = offsets
+        self._length  = length
+        self.typecode = typecode_for(widest)
+
+    #####################################################
+    def __len__(self) -> int:
+        return self._length
+
+    #####################################################
+    def _block(self, block: int) -> str:
+        ''' returns the decoded characters of one block of the offset index,
+            remembering the last block decoded
+        '''
+        if block != self._cached_block:
+            data = self._map[self._offsets[block] : self._offsets[block + 1]]
+            self._cached, self._cached_block = data.decode(self.encoding), block
+        return self._cached
+
+    #####################################################
+    def decode(self, start: int, end: int) -> str:
+        ''' returns the str of characters [start, end) of the file
+
+        Args:
+            start: index of the first character (0 <= start <= len)
+            end:   index one past the last character (start <= end <= len)
+
+        Returns:
+            an str of end - start characters
+        '''
+        if end <= start:
+            return ""
+        if self._offsets is None:
+            data = self._view[start:end].tobytes()
+            text = data.decode(_CODECS[self.typecode], 'surrogatepass')
+            if len(text) != end - start:
+                # two separate surrogate code points merged by the UTF-16 codec
+                text = "".join(map(chr, self._view[start:end]))
+            return text
+        first, last = start // BLOCK, (end - 1) // BLOCK
+        if first == last:
+            text, base = self._block(first), first * BLOCK
+            return text[start - base : end - base]
+        data = self._map[self._offsets[first] : self._offsets[last + 1]]
+        return data.decode(self.encoding)[start - first * BLOCK : end - first * BLOCK]
+
+    #####################################################
+    def __getitem__(self, index):
+        ''' overrides the __getitem__ special method
+
+        Args:
+            index: an int (negative counts from the end) or a slice with step 1
+
+        Returns:
+            the int code point at index, or an array.array (of this buffer's
+            typecode) holding a copy of the sliced code points
+
+        Raises:
+            IndexError: if an int index is out of range
+        '''
+        if isinstance(index, slice):
+            start, end, step = index.indices(self._length)
+            if step != 1:
+                raise ValueError("MappedBuffer slices must have step 1")
+            chars = array(self.typecode)
+            if self._offsets is None:
+                chars.frombytes(self._view[start:max(start, end)].cast('B'))
+                return chars
+            return widen(encode(self.decode(start, end)), self.typecode)
+
+        if index < 0: index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("MappedBuffer index out of range")
+        if self._offsets is None:
+            return self._view[index]
+        return ord(self._block(index // BLOCK)[index % BLOCK])
+
+    #####################################################
+    def __repr__(self) -> str:
+        return f'MappedBuffer({self.path!r}, {self.encoding!r})'
@@ -0,0 +1,159 @@
+'''Compiled substring patterns for searching String objects.
+
+A Pattern does all the preprocessing for a needle once, so the same needle
+can be searched for in many Strings (or many times in one String) cheaply.
+The search runs in C, without copying the whole String: str.find is run
+over windows of at most a few tens of thousands of characters decoded from
+the String's code-point buffer (see codepoints.find), in memory, from a file
+or compressed alike.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from array import array
+
+from .codepoints import WIDTHS, typecode_for, buffer_of, adjust_indices
+from . import codepoints
+
+###############################################################################
+
+class Pattern:
+    '''A needle compiled once for fast repeated searches in String objects.
+
+    Attributes:
+        needle   : the str being searched for
+        len      : returns the (int) number of characters in the needle
+        find     : returns the lowest index of the needle in a String, or -1
+        rfind    : returns the highest index of the needle in a String, or -1
+        index    : like find, but raises ValueError when not found
+        count    : returns the number of non-overlapping occurrences
+        finditer : generator of the indices of non-overlapping occurrences
+    '''
+
+    __slots__ = ('needle', '_width')
+
+    #####################################################
+    def __init__(self, needle: 'String | str') -> None:
+        ''' initialization method for the Pattern class, doing all of the
+            preprocessing required by the search
+
+        Args:
+            needle: a String or str to search for
+        '''
+        self.needle = str(needle)
+        self._width = typecode_for(max(map(ord, self.needle), default = 0))
+
+    #####################################################
+    def len(self) -> int:
+        ''' returns the number of characters in the needle '''
+        return len(self.needle)
+
+    #####################################################
+    def _search(self, chars: array, lo: int, hi: int) -> int:
+        ''' returns the lowest index i in [lo, hi - len] of the needle in
+            chars, or -1 if it does not occur there
+        '''
+        m = len(self.needle)
+        if m == 0:
+            return lo if lo <= hi else -1
+        if hi - lo < m:
+            return -1
+        return codepoints.find(chars, self.needle, lo, hi)
+
+    #####################################################
+    def _rsearch(self, chars: array, lo: int, hi: int) -> int:
+        ''' returns the highest index i in [lo, hi - len] of the needle in
+            chars, or -1 if it does not occur there
+        '''
+        m = len(self.needle)
+        if m == 0:
+            return hi if lo <= hi else -1
+        if hi - lo < m:
+            return -1
+        return codepoints.rfind(chars, self.needle, lo, hi)
+
+    #####################################################
+    def find(self, text: 'String | str', start: int = 0, end: int = None) -> int:
+        ''' returns the lowest index in text where the needle is found within
+            text[start:end], or -1 (same conventions as str.find)
+
+        Args:
+            text:  a String or str to search in
+            start: an int index where the search starts
+            end:   an int index where the search ends (default: end of text)
+
+        Returns:
+            an int index, relative to the start of text, or -1
+        '''
+        chars, offset, stop = buffer_of(text)
+        start, end = adjust_indices(start, end, stop - offset)
+        if WIDTHS.index(self._width) > WIDTHS.index(chars.typecode):
+            return -1  # the needle has a character that cannot be in text
+        found = self._search(chars, offset + start, offset + end)
+        return found if found < 0 else found - offset
+
+    #####################################################
+    def rfind(self, text: 'String | str', start: int = 0, end: int = None) -> int:
+        ''' returns the highest index in text where the needle is found within
+            text[start:end], or -1 (same conventions as str.rfind)
+
+        Args:
+            text:  a String or str to search in
+            start: an int index where the search starts
+            end:   an int index where the search ends (default: end of text)
+
+        Returns:
+            an int index, relative to the start of text, or -1
+        '''
+        chars, offset, stop = buffer_of(text)
+        start, end = adjust_indices(start, end, stop - offset)
+        if WIDTHS.index(self._width) > WIDTHS.index(chars.typecode):
+            return -1
+        found = self._rsearch(chars, offset + start, offset + end)
+        return found if found < 0 else found - offset
+
+    #####################################################
+    def index(self, text: 'String | str', start: int = 0, end: int = None) -> int:
+        ''' like find, but raises ValueError when the needle is not found
+
+        Raises:
+            ValueError: if the needle does not occur in text[start:end]
+        '''
+        found = self.find(text, start, end)
+        if found < 0:
+            raise ValueError("substring not found")
+        return found
+
+    #####################################################
+    def finditer(self, text: 'String | str', start: int = 0, end: int = None):
+        ''' generator yielding the index of each non-overlapping occurrence of
+            the needle in text[start:end], from left to right
+        '''
+        chars, offset, stop = buffer_of(text)
+        start, end = adjust_indices(start, end, stop - offset)
+        if WIDTHS.index(self._width) > WIDTHS.index(chars.typecode):
+            return
+        if not self.needle:
+            yield from range(start, end + 1)   # "" matches at every index
+            return
+        for found in codepoints.finditer(chars, self.needle, offset + start, offset + end):
+            yield found - offset
+
+    #####################################################
+    def count(self, text: 'String | str', start: int = 0, end: int = None) -> int:
+        ''' returns the number of non-overlapping occurrences of the needle in
+            text[start:end] (same conventions as str.count)
+        '''
+        chars, offset, stop = buffer_of(text)
+        start, end = adjust_indices(start, end, stop - offset)
+        if len(self.needle) == 0:
+            return end - start + 1 if start <= end else 0
+        if WIDTHS.index(self._width) > WIDTHS.index(chars.typecode):
+            return 0
+        return codepoints.count(chars, self.needle, offset + start, offset + end)
+
+    #####################################################
+    def __repr__(self) -> str:
+        return f'Pattern({self.needle!r})'
@@ -0,0 +1,131 @@
+'''Multi-pattern matching over String objects (Aho-Corasick).
+
+A PatternSet compiles any number of needles into a single automaton, after
+which a String is scanned once, in time proportional to its length plus the
+number of matches, no matter how many needles there are.  Searching for each
+needle separately with Pattern would instead cost one pass per needle; as
+those passes run in C while the automaton is walked in python, looping is
+still faster up to a few hundred needles (see benchmarks/bench_PatternSet.py).
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from collections import deque
+
+from .codepoints import buffer_of, adjust_indices
+
+###############################################################################
+
+class PatternSet:
+    '''A set of needles compiled into an Aho-Corasick automaton.
+
+    The automaton is a trie of the needles' code points (state 0 is the root)
+    where each state also has a failure link to the state for its longest
+    proper suffix that is in the trie, and a list of the needles ending there.
+
+    Attributes:
+        patterns : tuple of the distinct needles, as str, in insertion order
+        len      : returns the (int) number of distinct needles
+        scan     : generator of (needle, index) for every match in a String
+        count    : returns a dict mapping each needle to its number of matches
+    '''
+
+    __slots__ = ('patterns', '_goto', '_fail', '_output')
+
+    #####################################################
+    def __init__(self, patterns) -> None:
+        ''' initialization method for the PatternSet class, building the
+            automaton in time proportional to the total length of the needles
+
+        Args:
+            patterns: an iterable of String or str needles; duplicates are
+                ignored
+
+        Raises:
+            ValueError: if one of the needles is empty
+        '''
+        self.patterns = tuple(dict.fromkeys(str(p) for p in patterns))
+        self._goto    = [{}]    # per state: code point -> next state
+        self._output  = [()]    # per state: indices of needles ending there
+
+        # (1) build the trie
+        for number, pattern in enumerate(self.patterns):
+            if len(pattern) == 0:
+                raise ValueError("PatternSet needles cannot be empty")
+            chars, start, end = buffer_of(pattern)
+            state = 0
+            for code in chars[start:end]:
+                following = self._goto[state].get(code)
+                if following is None:
+                    following = len(self._goto)
+                    self._goto[state][code] = following
+                    self._goto.append({})
+                    self._output.append(())
+                state = following
+            self._output[state] = (number,)
+
+        # (2) failure links, breadth first so that shorter suffixes are done
+        # first; each state also inherits the outputs of its failure state
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for code, following in self._goto[state].items():
+                queue.append(following)
+                fallback = self._fail[state]
+                while fallback and code not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[following] = self._goto[fallback].get(code, 0)
+                self._output[following] += self._output[self._fail[following]]
+
+    #####################################################
+    def len(self) -> int:
+        ''' returns the number of distinct needles in the set '''
+        return len(self.patterns)
+
+    #####################################################
+    def scan(self, text: 'String | str', start: int = 0, end: int = None):
+        ''' generator scanning text[start:end] once, yielding (needle, index)
+            for every occurrence of every needle, overlapping ones included
+
+        Matches are yielded in order of where they end; matches ending at the
+        same position come longest first.
+
+        Args:
+            text:  a String or str to scan
+            start: an int index where the scan starts
+            end:   an int index where the scan ends (default: end of text)
+
+        Returns:
+            a generator of (str, int) tuples, the int being relative to the
+            start of text
+        '''
+        chars, offset, stop = buffer_of(text)
+        start, end = adjust_indices(start, end, stop - offset)
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self.patterns
+
+        state = 0
+        for i in range(offset + start, offset + end):
+            code = chars[i]
+            while state and code not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(code, 0)
+            for number in output[state]:
+                pattern = patterns[number]
+                yield pattern, i - offset - len(pattern) + 1
+
+    #####################################################
+    def count(self, text: 'String | str', start: int = 0, end: int = None) -> dict:
+        ''' returns a dict mapping each needle to the number of (possibly
+            overlapping) times it occurs in text[start:end]
+        '''
+        counts = dict.fromkeys(self.patterns, 0)
+        for pattern, _ in self.scan(text, start, end):
+            counts[pattern] += 1
+        return counts
+
+    #####################################################
+    def __repr__(self) -> str:
+        return f'PatternSet({list(self.patterns)!r})'
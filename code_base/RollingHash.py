@@ -0,0 +1,228 @@
+'''Polynomial rolling hashes of a String, for comparing its substrings in O(1)
+   without copying them.
+
+The hash of every prefix of the text is stored, so the fingerprint of any
+substring comes from two of them in O(1):
+
+    H(text[i:j]) = (P[j] - P[i] * BASE ** (j - i)) mod M
+
+Two independent hashes are kept, modulo two primes near 2 ** 61 and 10 ** 18,
+with bases drawn at random when the module is loaded: two different
+substrings have the same pair of fingerprints with probability about
+n / 2 ** 120, negligible even for huge texts, and (as the bases are secret)
+no input can be crafted to collide.  Fingerprints are therefore only
+comparable within one run of the program.
+
+Building a RollingHash takes O(n) time and 16 bytes per character.  The
+powers of the bases are looked up in tables shared by all RollingHash
+objects, which grow with the texts hashed but never beyond POWERS_MAX
+entries (16 bytes each); longer substrings get their power from pow() in
+O(log n) multiplications, so one huge text does not pin a table as long as
+itself for the rest of the program.  A RollingHash hashes the text as it
+was when built: later edits to the String are not seen, and
+String.rolling_hash() builds a new one after an edit.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from array import array
+import itertools
+import random
+
+from .codepoints import buffer_of, copy
+
+# the two prime moduli, and a random base for each
+MODULI = ((1 << 61) - 1, 10 ** 18 + 9)
+BASES  = tuple(random.SystemRandom().randrange(1 << 20, modulus - 1) for modulus in MODULI)
+
+# BASES[k] ** i % MODULI[k] at index i, grown as longer texts are hashed up
+# to POWERS_MAX entries; higher powers are computed with pow() when needed
+POWERS_MAX = 1 << 16
+_powers = tuple(array('Q', [1]) for _ in MODULI)
+
+###############################################################################
+
+def _grow_powers(length: int) -> None:
+    ''' makes the tables of powers of the bases cover exponents up to length
+        (or up to POWERS_MAX - 1, whichever is smaller)
+    '''
+    length = min(length, POWERS_MAX - 1)
+    for powers, base, modulus in zip(_powers, BASES, MODULI):
+        if len(powers) <= length:
+            more = itertools.accumulate(itertools.repeat(base, length + 1 - len(powers)),
+                                        lambda power, base: power * base % modulus,
+                                        initial = powers[-1])
+            next(more)   # the initial value, already in the table
+            powers.extend(more)
+
+def _powers_of(exponent: int) -> tuple:
+    ''' returns (BASES[0] ** exponent % MODULI[0], BASES[1] ** exponent % MODULI[1]) '''
+    powers1, powers2 = _powers
+    if exponent < len(powers1):
+        return powers1[exponent], powers2[exponent]
+    return pow(BASES[0], exponent, MODULI[0]), pow(BASES[1], exponent, MODULI[1])
+
+###############################################################################
+
+class RollingHash:
+    '''Rolling-hash fingerprints of every substring of a String.
+
+    Attributes:
+        len              : returns the (int) number of characters hashed
+        fingerprint      : returns the fingerprint of a substring, in O(1)
+        substring_equals : compares two substrings, of this or another text, in O(1)
+        common_prefix_length: returns the length of the longest common prefix
+                            of two suffixes, in O(log n)
+        duplicate_windows: returns the starts of all the windows of a given
+                            width that occur more than once (Rabin-Karp)
+    '''
+
+    __slots__ = ('_prefixes', '_length')
+
+    #####################################################
+    def __init__(self, text: 'String | str') -> None:
+        ''' initialization method for the RollingHash class, hashing every
+            prefix of text in O(n)
+
+        Args:
+            text: a String or str
+        '''
+        chars, start, end = buffer_of(text)
+        codes = copy(chars, start, end) if (start, end) != (0, len(chars)) else chars
+        self._length = end - start
+        # code points are hashed plus one, so that a leading NUL still counts
+        self._prefixes = tuple(
+            array('Q', itertools.accumulate(codes, lambda h, code: (h * base + code + 1) % modulus,
+                                            initial = 0))
+            for base, modulus in zip(BASES, MODULI))
+        _grow_powers(self._length)
+
+    #####################################################
+    def len(self) -> int:
+        ''' returns the number of characters hashed '''
+        return self._length
+
+    #####################################################
+    def fingerprint(self, start: int, end: int) -> tuple:
+        ''' returns the fingerprint of the characters in [start, end), which
+            is equal for equal substrings (of any text) and, but for a
+            negligible chance, different for different ones
+
+        Args:
+            start: an int index of the first character
+            end:   an int index one past the last character
+
+        Returns:
+            a tuple of two ints
+
+        Raises:
+            IndexError: if [start, end) is not a range of this text
+        '''
+        if not 0 <= start <= end <= self._length:
+            raise IndexError("Index value invalid relative to string length")
+        return self._fingerprint(start, end)
+
+    def _fingerprint(self, start: int, end: int) -> tuple:
+        (first, second), (power1, power2) = self._prefixes, _powers_of(end - start)
+        return ((first[end]  - first[start]  * power1) % MODULI[0],
+                (second[end] - second[start] * power2) % MODULI[1])
+
+    #####################################################
+    def substring_equals(self, i: int, j: int, length: int, other: 'RollingHash' = None) -> bool:
+        ''' returns True if the length characters starting at i equal those
+            starting at j (of other, if given), by their fingerprints in O(1)
+
+        Args:
+            i:      an int index in this text
+            j:      an int index in this text, or in other
+            length: the int number of characters compared
+            other:  an optional RollingHash of another text
+
+        Returns:
+            True if the substrings are equal; False o/w
+
+        Raises:
+            IndexError: if either substring does not fit in its text
+        '''
+        other = self if other is None else other
+        if length < 0 or not (0 <= i <= self._length - length and 0 <= j <= other._length - length):
+            raise IndexError("Index value invalid relative to string length")
+        return self._fingerprint(i, i + length) == other._fingerprint(j, j + length)
+
+    #####################################################
+    def common_prefix_length(self, i: int, j: int, other: 'RollingHash' = None) -> int:
+        ''' returns the length of the longest common prefix of the suffixes
+            starting at i and at j (of other, if given), by galloping and then
+            bisecting over their lengths: O(log n) fingerprint comparisons
+
+        Args:
+            i:     an int index in this text
+            j:     an int index in this text, or in other
+            other: an optional RollingHash of another text
+
+        Returns:
+            an int length
+
+        Raises:
+            IndexError: if i or j is not an index of its text (or its end)
+        '''
+        other = self if other is None else other
+        if not (0 <= i <= self._length and 0 <= j <= other._length):
+            raise IndexError("Index value invalid relative to string length")
+        if i == j and other is self:
+            return self._length - i
+        low, high = 0, min(self._length - i, other._length - j)
+        step = 1
+        while low < high:               # gallop: try low + 1, + 2, + 4, ...
+            probe = min(low + step, high)
+            if self._fingerprint(i, i + probe) != other._fingerprint(j, j + probe):
+                high = probe - 1
+                break
+            low, step = probe, step * 2
+        while low < high:               # then bisect in (low, high]
+            middle = (low + high + 1) // 2
+            if self._fingerprint(i, i + middle) == other._fingerprint(j, j + middle):
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    #####################################################
+    def duplicate_windows(self, width: int) -> list:
+        ''' finds every window of width characters that occurs more than once
+            (Rabin-Karp), without building any substring
+
+        Args:
+            width: the int length of the windows, at least 1
+
+        Returns:
+            a list with, for each repeated window, the increasing list of
+            its starting positions; windows are in order of first occurrence
+
+        Raises:
+            ValueError: if width is less than 1
+        '''
+        if width < 1:
+            raise ValueError("The window width must be at least 1")
+        if width > self._length:
+            return []
+        (first, second), (power1, power2) = self._prefixes, _powers_of(width)
+        modulus1, modulus2 = MODULI
+        keys = zip([(after - before * power1) % modulus1 for after, before in zip(first[width:], first)],
+                   [(after - before * power2) % modulus2 for after, before in zip(second[width:], second)])
+        starts = {}
+        for start, key in enumerate(keys):
+            found = starts.get(key)
+            if found is None:
+                starts[key] = start
+            elif isinstance(found, int):
+                starts[key] = [found, start]
+            else:
+                found.append(start)
+        return [found for found in starts.values() if not isinstance(found, int)]
+
+    #####################################################
+    def __repr__(self) -> str:
+        return f'RollingHash(<{self._length} characters>)'
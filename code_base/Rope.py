@@ -0,0 +1,172 @@
+'''Balanced rope (concatenation tree) used by String to make __add__ cheap.
+
+A rope is either a leaf or a Concat node joining two ropes.  Leaves are flat
+String objects which are never modified once placed in a rope, so ropes can
+freely share subtrees with one another.  The tree is kept height-balanced in
+the manner of an AVL tree, which bounds its height to O(log n) and therefore
+the cost of concat, char_at and sub_rope as well.
+
+The functions here only rely on the following operations of a leaf:
+    len(), [] access, substring(start, end), + (for merging small leaves)
+and str() for iterating over text, so this module does not import String.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+# Leaves shorter than this are merged (copied) rather than linked, so that
+# appending many small pieces does not produce a tree of tiny leaves.
+LEAF_SIZE = 512
+
+###############################################################################
+
+class Concat:
+    ''' internal node of a rope, joining a left and a right rope
+
+    Attributes:
+        left  : the rope holding the first part of the text
+        right : the rope holding the second part of the text
+        length: total number of characters below this node
+        height: 1 + the height of the taller child (leaves have height 0)
+    '''
+
+    __slots__ = ('left', 'right', 'length', 'height')
+
+    def __init__(self, left, right) -> None:
+        self.left   = left
+        self.right  = right
+        self.length = length(left) + length(right)
+        self.height = 1 + max(height(left), height(right))
+
+###############################################################################
+
+def length(node) -> int:
+    ''' returns the number of characters in a rope (leaf or Concat) '''
+    return node.length if isinstance(node, Concat) else node.len()
+
+def height(node) -> int:
+    ''' returns the height of a rope; leaves have height 0 '''
+    return node.height if isinstance(node, Concat) else 0
+
+#####################################################
+def _balance(left, right) -> Concat:
+    ''' joins two ropes whose heights differ by at most two, rotating once
+        (or twice) to restore the AVL balance condition if needed
+    '''
+    if height(right) > height(left) + 1:
+        if height(right.left) > height(right.right):  # double rotation
+            right = Concat(right.left.left, Concat(right.left.right, right.right))
+        return Concat(Concat(left, right.left), right.right)
+    if height(left) > height(right) + 1:
+        if height(left.right) > height(left.left):    # double rotation
+            left = Concat(Concat(left.left, left.right.left), left.right.right)
+        return Concat(left.left, Concat(left.right, right))
+    return Concat(left, right)
+
+#####################################################
+def concat(left, right):
+    ''' returns a balanced rope for the text of left followed by right
+
+    Only the O(log n) nodes along one spine of the taller rope are rebuilt;
+    everything else is shared with the two arguments, which remain unchanged.
+
+    Args:
+        left:  a rope (leaf or Concat)
+        right: a rope (leaf or Concat)
+
+    Returns:
+        a rope representing the concatenation
+    '''
+    if length(left) == 0:  return right
+    if length(right) == 0: return left
+
+    left_height, right_height = height(left), height(right)
+    if left_height > right_height + 1:
+        # walk down the right spine of left until the heights are comparable
+        return _balance(left.left, concat(left.right, right))
+    if right_height > left_height + 1:
+        return _balance(concat(left, right.left), right.right)
+
+    if left_height == right_height == 0 and length(left) + length(right) <= LEAF_SIZE:
+        return left + right   # two small leaves: merge into a single flat leaf
+    return Concat(left, right)
+
+#####################################################
+def char_at(node, index: int) -> str:
+    ''' returns the character at a (non-negative, in range) index of a rope '''
+    while isinstance(node, Concat):
+        left_length = length(node.left)
+        if index < left_length:
+            node = node.left
+        else:
+            node = node.right
+            index -= left_length
+    return node[index]
+
+#####################################################
+def sub_rope(node, start: int, end: int):
+    ''' returns a rope for the characters in [start, end) of node, sharing
+        every leaf lying fully inside the range
+
+    Args:
+        node:  a rope (leaf or Concat)
+        start: a non-negative int index of the first character
+        end:   an int index one past the last character (start <= end <= length)
+
+    Returns:
+        a rope (leaf or Concat) of end - start characters
+    '''
+    if start == 0 and end == length(node):
+        return node
+    if not isinstance(node, Concat):
+        return node.substring(start, end)
+
+    left_length = length(node.left)
+    if end <= left_length:
+        return sub_rope(node.left, start, end)
+    if start >= left_length:
+        return sub_rope(node.right, start - left_length, end - left_length)
+    return concat(sub_rope(node.left, start, left_length),
+                  sub_rope(node.right, 0, end - left_length))
+
+#####################################################
+def overwrite(node, start: int, piece):
+    ''' returns a rope for node with the characters from start on replaced by
+        the leaf piece, copying only the path down to the one leaf they lie
+        in: an overwrite costs O(log n) plus at most LEAF_SIZE characters,
+        against the three splits and two joins of a general replacement
+
+    Args:
+        node:  a rope (leaf or Concat)
+        start: a non-negative int index of the first character to replace
+        piece: a leaf with start + length(piece) <= length(node)
+
+    Returns:
+        a rope (leaf or Concat) of the same length as node, or None when the
+        characters to replace span more than one leaf
+    '''
+    if not isinstance(node, Concat):
+        return concat(concat(sub_rope(node, 0, start), piece),
+                      sub_rope(node, start + length(piece), length(node)))
+
+    left_length = length(node.left)
+    if start + length(piece) <= left_length:
+        left = overwrite(node.left, start, piece)
+        return None if left is None else concat(left, node.right)
+    if start >= left_length:
+        right = overwrite(node.right, start - left_length, piece)
+        return None if right is None else concat(node.left, right)
+    return None
+
+#####################################################
+def leaves(node):
+    ''' generator yielding the leaves of a rope from left to right '''
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Concat):
+            stack.append(node.right)
+            stack.append(node.left)
+        elif node.len() > 0:
+            yield node
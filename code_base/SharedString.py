@@ -0,0 +1,188 @@
+'''A String shared between threads: readers never lock, writers take turns.
+
+A plain String is not safe to use from several threads at once: an edit
+updates several fields one after the other (and may swap its buffer for a
+copy), so a thread reading at the same time can see half of it.  A
+SharedString instead publishes immutable versions:
+
+    - the current version is a FrozenString, stored together with its epoch
+      (the number of edits so far) in a single attribute, which is replaced
+      as a whole;
+    - a reader takes that pair with one attribute read, without any lock,
+      and works on a version that can never change under it;
+    - writers take turns through a lock: each builds the next version from
+      the current one by editing a copy of its rope, which shares every
+      piece the edit leaves alone (O(log n) per edit, see Rope.py), and then
+      publishes it with one assignment.
+
+This is read-copy-update: readers are never blocked by writers or by each
+other, and always see a whole version.  A FrozenString may still fill in its
+caches (its str, hash or flattened buffer) on first use, but those are the
+same whichever thread computes them, and each is stored in a consistent
+order, so readers sharing a version cannot disturb one another.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from contextlib import contextmanager
+import threading
+
+from .String import String, FrozenString, frozen
+
+###############################################################################
+
+class SharedString:
+    '''A String that threads can read without locks while others edit it.
+
+    Attributes:
+        snapshot     : returns the current version, a FrozenString
+        epoch        : returns the number of edits published so far
+        len          : returns the (int) number of characters of the current version
+        __str__, __eq__, __getitem__, substring, find, count, __contains__:
+                       as for String, each on the current version
+        __setitem__  : overwrites one character, publishing a new version
+        insert, delete, replace_range: edit as String does, publishing a new version
+        edit         : context manager making several edits one new version
+    '''
+
+    __slots__ = ('_state', '_lock')
+
+    #####################################################
+    def __init__(self, text: 'String | str') -> None:
+        ''' initialization method for the SharedString class
+
+        Args:
+            text: a String or str, the initial contents
+        '''
+        self._state = (0, frozen(text))  # (epoch, version), replaced as a whole
+        self._lock  = threading.Lock()   # taken by writers only
+
+    #####################################################
+    def snapshot(self) -> FrozenString:
+        ''' returns the current version, which stays unchanged however the
+            SharedString is edited afterwards; several reads that must agree
+            with one another should all be made on one snapshot
+        '''
+        return self._state[1]
+
+    #####################################################
+    def epoch(self) -> int:
+        ''' returns the number of edits published so far '''
+        return self._state[0]
+
+    #####################################################
+    def len(self) -> int:
+        ''' returns the number of characters in the current version '''
+        return self._state[1].len()
+
+    #####################################################
+    def __str__(self) -> str:
+        ''' returns an str version of the current version '''
+        return str(self._state[1])
+
+    #####################################################
+    def __eq__(self, other) -> bool:
+        ''' compares the current version with a String, str or SharedString '''
+        if isinstance(other, SharedString):
+            other = other.snapshot()
+        return self._state[1].__eq__(other)
+
+    __hash__ = None   # changes with every edit, like a String being edited
+
+    #####################################################
+    def __getitem__(self, index):
+        ''' returns a character or slice of the current version '''
+        return self._state[1][index]
+
+    #####################################################
+    def substring(self, start: int, end: int) -> FrozenString:
+        ''' returns a substring of the current version, which stays unchanged '''
+        return self._state[1].substring(start, end)
+
+    #####################################################
+    def find(self, sub, start: int = 0, end: int = None) -> int:
+        ''' returns the lowest index of sub in the current version, or -1 '''
+        return self._state[1].find(sub, start, end)
+
+    #####################################################
+    def count(self, sub, start: int = 0, end: int = None) -> int:
+        ''' returns the number of non-overlapping occurrences of sub in the
+            current version
+        '''
+        return self._state[1].count(sub, start, end)
+
+    #####################################################
+    def __contains__(self, sub) -> bool:
+        ''' allows checking for sub in the current version with the in operator '''
+        return sub in self._state[1]
+
+    #####################################################
+    @contextmanager
+    def edit(self):
+        ''' context manager for making several edits that readers see all at
+            once, as a single new version: its value is a String holding the
+            current version, to be edited in place; the result is published
+            when the block ends, or dropped if the block raises
+
+        replace_range, insert and delete on the draft cost O(log n) each, as
+        they share the rope of the current version; assigning characters with
+        [] copies a flat text once.
+
+        Other writers wait until the block ends, so it should be short.
+        '''
+        with self._lock:
+            epoch, current = self._state
+            draft = String._from_rope(current._as_rope())
+            yield draft
+            self._state = (epoch + 1, draft.freeze())
+
+    #####################################################
+    def replace_range(self, start: int, end: int, text: 'String | str') -> int:
+        ''' replaces the characters in [start, end) by text (python slicing
+            rules for start and end), as a new version
+
+        Returns:
+            the int epoch of the new version
+        '''
+        with self.edit() as draft:
+            draft.replace_range(start, end, text)
+            epoch = self._state[0] + 1   # still under the lock
+        return epoch
+
+    #####################################################
+    def insert(self, index: int, text: 'String | str') -> int:
+        ''' inserts text before position index (like list.insert), as a new
+            version; returns its epoch
+        '''
+        return self.replace_range(index, index, text)
+
+    #####################################################
+    def delete(self, start: int, end: int) -> int:
+        ''' removes the characters in [start, end), as a new version; returns
+            its epoch
+        '''
+        return self.replace_range(start, end, "")
+
+    #####################################################
+    def __setitem__(self, index: int, char: str) -> None:
+        ''' overrides the __setitem__ special method: overwrites one character,
+            as a new version
+
+        Raises:
+            IndexError: if the index value is invalid relative to String length
+            ValueError: if char is not exactly one character long
+        '''
+        with self.edit() as draft:
+            if index < 0: index += draft.len()
+            if not 0 <= index < draft.len():
+                raise IndexError("Index value invalid relative to string length")
+            if len(char) != 1:
+                raise ValueError("Only a single character can be assigned")
+            draft.replace_range(index, index + 1, char)
+
+    #####################################################
+    def __repr__(self) -> str:
+        epoch, current = self._state
+        return f'SharedString({str(current)!r}, epoch = {epoch})'
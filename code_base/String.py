@@ -1,19 +1,79 @@
+from array import array
+import itertools
+import operator
+
+from . import Rope
+from . import distance
+from . import splitting
+from .Pattern import Pattern
+from .RollingHash import RollingHash
+from .LineIndex import LineIndex
+from .MappedBuffer import MappedBuffer, CHUNK as MAPPED_CHUNK
+from .CompressedBuffer import CompressedBuffer, BLOCK as COMPRESSED_BLOCK
+from .codepoints import UCS1, WIDTHS, typecode_for, encode, decode, widen, copy, join, buffer_of
+
 class String:
     '''DCS 229 implementation of a version of the built-in str class.
 
     This class implements a simple version corresponding to the str class,
     where a String object consists of a sequence of characters.
 
+    The characters are kept in a compact array of code points (_chars) using
+    1, 2 or 4 bytes per character depending on the widest character present,
+    rather than in a list of one-character str objects.  Concatenating long
+    Strings produces a balanced rope (_rope, see Rope.py) instead of copying
+    both buffers; the rope is flattened back into _chars only when needed.
+
     Attributes:
         __str__    : returns an str version of this String object
         len        : returns the (int) number of characters in this String
         is_empty   : returns True if this String is an empty string; False o/w
         __eq__     : allows comparison of this String vs. either a String or str
-        __getitem__: allows fetching a character using [] notation
-        __setitem__: allows overwriting a character using [] assignment
+        __getitem__: allows fetching a character using [] notation, or a slice
+                        (a view, for a step of 1)
+        __len__    : allows len(s), the same as s.len()
+        __iter__   : iterates over the characters, as does __reversed__ backwards
+        codepoints : returns a read-only memoryview of the code points (also
+                        exported through the buffer protocol on Python 3.12+)
+        __setitem__: allows overwriting a character using [] assignment, and
+                        many at once with slices or sequences of indices
+        set_items  : overwrites many characters given as (index, char) pairs
+        translate  : rewrites every character through a table, in place
         __add__    : returns a new String object that is the concatenation of
                         this String object and a given String or str object
         substring  : returns a new String object by specifying substring indices
+        insert     : inserts a String or str at an index, in place
+        delete     : removes the characters in a range, in place
+        replace_range: replaces the characters in a range by a String or str
+        from_file  : returns a String reading its characters lazily from a file
+        compress   : returns a String with the same contents, kept compressed in
+                        memory block by block
+        __hash__   : allows using a String as a dict key or set member
+        freeze     : returns an immutable FrozenString with the same characters
+        find       : returns the lowest index of a substring, or -1
+        rfind      : returns the highest index of a substring, or -1
+        index      : like find, but raises ValueError when not found
+        count      : returns the number of non-overlapping occurrences of a substring
+        __contains__: allows checking for a substring using the in operator
+        split      : generates the pieces separated by a substring (or any of
+                        some characters, or whitespace), as views
+        rsplit     : like split, with the splits counted from the right
+        splitlines : generates the lines, as views, like str.splitlines
+        partition  : returns (before, sep, after) around the first sep, as views
+        rpartition : returns (before, sep, after) around the last sep, as views
+        edit_distance: returns the Levenshtein distance to a String or str
+        lcs        : returns a longest common subsequence with a String or str
+        diff       : returns the differences from a String or str, as opcodes
+        rolling_hash: returns the RollingHash of this String (built once)
+        substring_equals: compares two substrings in O(1), by rolling hash
+        common_prefix_length: returns the length of the common prefix of two
+                        suffixes in O(log n), by rolling hash
+        duplicate_windows: returns the starts of repeated windows of a width
+        line_index : returns the LineIndex of the line starts (built once)
+        line_count : returns the number of lines
+        offset_to_line_col: returns the (line, column) of an offset
+        line_col_to_offset: returns the offset of a (line, column)
+        line       : returns a line without its newline, as a view
 
 
         Authors: Anh Than      (athan@bates.edu)
@@ -38,7 +98,8 @@ class String:
           approach) for convenience and brevity.
     '''
 
-    __slots__ = ('_chars')
+    __slots__ = ('_chars', '_start', '_length', '_rope', '_shared', '_str', '_hash', '_rolling',
+                 '_lines')
 
     #####################################################
     def __init__(self, string: str) -> None:
@@ -50,7 +111,155 @@ class String:
         Returns:
             None
         '''
-        self._chars = [c for c in string]  # a list of characters in the str
+        self._chars  = encode(string)    # a compact array of code points in the str
+        self._start  = 0                  # this String is _chars[_start:_start + _length]
+        self._length = len(self._chars)
+        self._rope   = None               # concatenation tree, when not flat
+        self._shared = False              # True when _chars is also used elsewhere
+        self._str    = None               # cached str version, reset by __setitem__
+        self._hash   = None               # cached hash value, reset by __setitem__
+        self._rolling = None              # cached RollingHash, reset by __setitem__
+        self._lines   = None              # cached LineIndex, updated by __setitem__
+
+    #####################################################
+    @classmethod
+    def _from_array(cls, chars: array, start: int = 0, length: int = None,
+                    shared: bool = False) -> 'String':
+        ''' builds a String directly around (a window of) an existing
+            code-point array, without copying it (internal use only)
+
+        Args:
+            chars:  an array.array of code points
+            start:  index in chars of the first character of the String
+            length: number of characters in the String (default: to the end)
+            shared: True if chars is also referenced by another String, in
+                which case it is copied before being written to
+
+        Returns:
+            a String object backed by chars
+        '''
+        new_string = cls.__new__(cls)
+        new_string._chars  = chars
+        new_string._start  = start
+        new_string._length = len(chars) - start if length is None else length
+        new_string._rope   = None
+        new_string._shared = shared
+        new_string._str    = None
+        new_string._hash   = None
+        new_string._rolling = None
+        new_string._lines   = None
+        return new_string
+
+    #####################################################
+    @classmethod
+    def from_file(cls, path: str, encoding: str = 'utf-8') -> 'String':
+        ''' returns a String whose characters are read lazily from a memory
+            mapped file rather than loaded into memory; [] access, len,
+            substring, == and searching all work straight from the mapping,
+            and the file is only copied into memory by __setitem__
+
+        Fixed-width encodings (latin-1, ascii, native UTF-32) open instantly;
+        other encodings such as UTF-8 are decoded once on opening to build a
+        small index of character offsets (see MappedBuffer.py).
+
+        Args:
+            path:     the path of a text file
+            encoding: the name of the file's text encoding
+
+        Returns:
+            a String object with the contents of the file
+        '''
+        chars = MappedBuffer(path, encoding)
+        return cls._from_array(chars, 0, len(chars), shared = True)
+
+    #####################################################
+    @classmethod
+    def _from_rope(cls, node) -> 'String':
+        ''' wraps a rope (see Rope.py) in a new String (internal use only)
+
+        Args:
+            node: a Rope.Concat node or a flat String leaf
+
+        Returns:
+            a String object representing the text of the rope
+        '''
+        if not isinstance(node, Rope.Concat):
+            # never hand out the leaf itself, as ropes rely on it not changing
+            return cls._from_array(node._chars, node._start, node._length, shared = True)
+        new_string = cls.__new__(cls)
+        new_string._chars  = None
+        new_string._start  = 0
+        new_string._length = node.length
+        new_string._rope   = node
+        new_string._shared = False
+        new_string._str    = None
+        new_string._hash   = None
+        new_string._rolling = None
+        new_string._lines   = None
+        return new_string
+
+    #####################################################
+    def _view(self, start: int, end: int) -> 'String':
+        ''' returns a flat String viewing characters [start, end) of this flat
+            String, sharing (copy-on-write) this String's buffer
+        '''
+        self._shared = True
+        return String._from_array(self._chars, self._start + start, end - start, shared = True)
+
+    #####################################################
+    def _as_rope(self):
+        ''' returns this String's content as a rope: either its tree, or a
+            leaf viewing its (now copy-on-write) buffer
+        '''
+        rope = self._rope   # read once: a concurrent reader may flatten it
+        if rope is not None:
+            return rope
+        return self._view(0, self._length)
+
+    #####################################################
+    def _assign(self, node) -> None:
+        ''' makes this String hold the text of a rope, in place: a Concat is
+            kept as this String's rope, a leaf's buffer is shared copy-on-write
+        '''
+        if isinstance(node, Rope.Concat):
+            self._chars, self._start, self._length = None, 0, node.length
+            self._rope, self._shared = node, False
+        else:
+            self._chars, self._start, self._length = node._chars, node._start, node._length
+            self._rope, self._shared = None, True
+        self._str = self._hash = self._rolling = self._lines = None  # the cached forms are now stale
+
+    #####################################################
+    def _window(self) -> array:
+        ''' returns the code points of this flat String as an array: the buffer
+            itself when the String spans all of it, otherwise a copy of the
+            window (the result must not be modified)
+        '''
+        if self._start == 0 and self._length == len(self._chars) and \
+                isinstance(self._chars, array):
+            return self._chars
+        return copy(self._chars, self._start, self._start + self._length)
+
+    #####################################################
+    def _flatten(self) -> None:
+        ''' makes sure this String is stored in a single contiguous buffer,
+            collapsing any rope into _chars
+        '''
+        rope = self._rope
+        if rope is not None:
+            leaves   = list(Rope.leaves(rope))
+            typecode = max((leaf._chars.typecode for leaf in leaves),
+                           key = WIDTHS.index, default = UCS1)
+            chars = join((leaf._window() for leaf in leaves), typecode)
+            self._chars, self._start, self._rope, self._shared = chars, 0, None, False
+
+    #####################################################
+    def _buffer(self) -> tuple:
+        ''' flattens this String if needed and returns (chars, start, end),
+            the buffer and the bounds of this String's window inside it
+        '''
+        self._flatten()
+        return self._chars, self._start, self._start + self._length
 
     #####################################################
     def __str__(self) -> str:
@@ -59,8 +268,34 @@ class String:
         Returns:
             an str version of the String object contents
         '''
-        string = "".join(self._chars) # combines characters from self._char into str
-        return string
+        if self._str is None:  # only build the str once until the next __setitem__
+            rope = self._rope
+            if rope is not None:
+                self._str = "".join(str(leaf) for leaf in Rope.leaves(rope))
+            elif isinstance(self._chars, array):
+                # decodes the contiguous window of the buffer in a single pass
+                self._str = decode(self._chars, self._start, self._start + self._length)
+            else:
+                # not kept for file-backed or compressed buffers, which would
+                # then stay resident in memory as a whole
+                return decode(self._chars, self._start, self._start + self._length)
+        return self._str
+
+    #####################################################
+    def __hash__(self) -> int:
+        ''' overrides the __hash__ special method so Strings can be used as
+            dict keys and set members; equal Strings and strs hash the same
+
+        Note that, like a list used as a key, a String must not be changed
+        with __setitem__ while stored in a dict or set -- use freeze() to
+        get a FrozenString that cannot be changed.
+
+        Returns:
+            an int hash value, cached until the next __setitem__
+        '''
+        if self._hash is None:
+            self._hash = hash(self.__str__())
+        return self._hash
 
     #####################################################
     def len(self) -> int:
@@ -69,7 +304,17 @@ class String:
         Returns:
             an int representing the number of character in the String
         '''
-        return len(self._chars) # use length function to find lenth of character list
+        return self._length # kept up to date for flat Strings, views and ropes alike
+
+    #####################################################
+    def __len__(self) -> int:
+        ''' overrides the __len__ special method, so that len() works on a
+            String as on an str
+
+        Returns:
+            an int representing the number of characters in the String
+        '''
+        return self._length
 
     #####################################################
     def is_empty(self) -> bool:
@@ -95,57 +340,319 @@ class String:
             True if the two objects contain exactly the same characters in
             the same order; False o/w
         '''
+        if self is other:   # e.g. two canonical Strings from an InternPool
+            return True
         # Make sure to allow for comparison when other is either String or str
-        other_string = other.__str__() if isinstance(other, String) else other
+        if isinstance(other, str):
+            # Compare the number of characters in each string
+            if self.len() != len(other): return False
+            if self._str is not None or self._rope is not None or isinstance(self._chars, array):
+                return self.__str__() == other
+            # file-backed or compressed: compare a decoded chunk at a time
+            for i in range(0, self._length, MAPPED_CHUNK):
+                end = min(i + MAPPED_CHUNK, self._length)
+                if not other.startswith(decode(self._chars, self._start + i, self._start + end), i):
+                    return False
+            return True
+        if not isinstance(other, String):
+            return NotImplemented
 
-        # Compare the number of characters in each string
-        if self.len() != len(other_string): return False
+        if self.len() != other.len(): return False
 
-        # Bail out when there is a different different character
-        for index, c in enumerate(self._chars):
-            if other_string[index] != c: return False
+        # use the cached hashes and strs, when both Strings have them
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        if self._str is not None and other._str is not None:
+            return self._str == other._str
+
+        self._flatten(); other._flatten()
+        if isinstance(self._chars, array) and isinstance(other._chars, array):
+            # arrays compare element-wise (and memcmp when widths match)
+            return self._window() == other._window()
 
+        # file-backed: compare a chunk at a time instead of loading it all
+        for i in range(0, self._length, MAPPED_CHUNK):
+            end = min(i + MAPPED_CHUNK, self._length)
+            if copy(self._chars, self._start + i, self._start + end) != \
+                    copy(other._chars, other._start + i, other._start + end):
+                return False
         return True
 
     #####################################################
-    def __getitem__(self, index: int) -> str:
+    def __getitem__(self, index: 'int | slice') -> 'str | String':
         ''' overrides the __getitem__ special method, allowing [] access
-            into a String object to access a single character (str)
+            into a String object to access a single character (str), or a
+            slice of it (a String)
 
         Args:
-            index: an integer indicating the position of the character to fetch
+            index: an integer indicating the position of the character to
+                fetch, or a slice; s[a:b] is s.substring(a, b), a view sharing
+                this String's storage, while a slice with a step is a copy
 
         Returns:
-            the character (a str in Python) at the indicated position
+            the character (a str in Python) at the indicated position, or a
+            String of the sliced characters
 
         Raises:
             IndexError: if the index value is invalid relative to String length
         '''
+        if isinstance(index, slice):
+            if index.step is None or index.step == 1:
+                return self.substring(*slice(index.start, index.stop).indices(self.len())[:2])
+            return String(str(self)[index])
         if self.len() == 0:
             raise IndexError("String is empty") # check for empty string
-        elif index > self.len():
+        if index < 0: index += self.len()  # python-style negative indexing
+        if not 0 <= index < self.len():
             raise IndexError("Index out of list range") # check for index out of range
+        rope = self._rope
+        if rope is not None:
+            return Rope.char_at(rope, index)
         else:
-            return self._chars[index]
+            return chr(self._chars[self._start + index])
 
     #####################################################
-    def __setitem__(self, index: int, char: str) -> None:
+    def __iter__(self):
+        ''' overrides the __iter__ special method: returns an iterator over the
+            characters of this String, running over the buffer (or the rope's
+            leaves) directly rather than indexing one character at a time
+        '''
+        if self._str is not None:
+            return iter(self._str)
+        rope = self._rope
+        if rope is not None:
+            return itertools.chain.from_iterable(map(iter, Rope.leaves(rope)))
+        if isinstance(self._chars, array):
+            return map(chr, memoryview(self._chars)[self._start : self._start + self._length])
+        return self._iter_mapped(range(0, self._length, MAPPED_CHUNK), 1)
+
+    #####################################################
+    def __reversed__(self):
+        ''' overrides the __reversed__ special method: returns an iterator over
+            the characters of this String from last to first
+        '''
+        if self._str is not None:
+            return reversed(self._str)
+        rope = self._rope
+        if rope is not None:
+            leaves = list(Rope.leaves(rope))
+            return itertools.chain.from_iterable(map(reversed, reversed(leaves)))
+        if isinstance(self._chars, array):
+            window = memoryview(self._chars)[self._start : self._start + self._length]
+            return map(chr, reversed(window))
+        return self._iter_mapped(reversed(range(0, self._length, MAPPED_CHUNK)), -1)
+
+    #####################################################
+    def _iter_mapped(self, chunk_starts, step: int):
+        ''' generator over the characters of a file-backed String, decoding
+            one chunk at a time (forwards for step 1, backwards for step -1)
+        '''
+        for chunk_start in chunk_starts:
+            chunk_end = min(chunk_start + MAPPED_CHUNK, self._length)
+            yield from self._chars.decode(self._start + chunk_start, self._start + chunk_end)[::step]
+
+    #####################################################
+    def codepoints(self) -> memoryview:
+        ''' returns a read-only memoryview of the code points of this String
+            (format 'B', 'H' or 'I'/'L', for 1, 2 or 4 bytes per character),
+            so that NumPy and other buffer consumers can read it without a
+            copy, e.g. numpy.asarray(s.codepoints())
+
+        A rope is flattened first, and a file-backed String in a variable
+        width encoding such as UTF-8 has to be read into memory.  The buffer
+        is marked shared, so later writes to this String copy it first and
+        the view keeps showing the characters it was made from.
+
+        Returns:
+            a memoryview of len(self) items
+        '''
+        self._flatten()
+        chars, start, end = self._chars, self._start, self._start + self._length
+        if isinstance(chars, MappedBuffer) and chars._view is not None:
+            chars = chars._view
+        elif not isinstance(chars, array):   # no fixed-width layout to view
+            chars, start, end = copy(chars, start, end), 0, end - start
+        self._shared = True
+        return memoryview(chars)[start:end].toreadonly()
+
+    #####################################################
+    def __buffer__(self, flags: int) -> memoryview:
+        ''' the buffer protocol (Python 3.12+): memoryview(s), numpy.asarray(s)
+            and the like read the code points as returned by codepoints()
+        '''
+        return self.codepoints()
+
+    #####################################################
+    def __setitem__(self, index, char: 'String | str') -> None:
         ''' overrides the __setitem__ special method, allowing one to overwrite
-            a character at a specific index in the String
+            a character at a specific index in the String, or many characters
+            at once:
+
+                s[i] = c            one character
+                s[a:b] = text       a slice; with step 1 text may have any length
+                                    and the String grows or shrinks, like a list
+                s[a:b:k] = text     an extended slice, and either one character
+                                    per position or a single character for
+                                    all of them (s[::2] = 'x')
+                s[indices] = text   a list, tuple, range or numpy array of int
+                                    indices (or a numpy bool mask), and again
+                                    one character per index or a single
+                                    character for all of them
+
+            Bulk assignments check the indices, copy (copy-on-write) or widen
+            the buffer at most once, and then write in a single pass.
 
         Args:
-            index: an integer indicating the position of the character to overwrite
+            index: an int, a slice, or a sequence of int indices
+            char: a single-character str (or String) to store at that position,
+                or the characters to store at the selected positions
 
         Returns:
             None
 
         Raises:
             IndexError: if the index value is invalid relative to String length
+            ValueError: if char is not exactly one character long, or the
+                number of characters does not match the number of positions
         '''
-        if self.len() < index:
+        if isinstance(index, slice):
+            self._set_slice(index, char)
+            return
+        if not isinstance(index, int):
+            try:
+                index = operator.index(index)   # e.g. a numpy integer
+            except TypeError:
+                self._set_many(index, char)
+                return
+        if index < 0: index += self.len()  # python-style negative indexing
+        if not 0 <= index < self.len():
             raise IndexError("Index value invalid relative to string length")
+        if len(str(char)) != 1:
+            raise ValueError("Only a single character can be assigned")
+        lines = self._lines   # updated in place below, rather than rebuilt
+        if lines is not None:
+            lines._update(index, self[index], str(char))
+        if self._rope is not None:
+            # splice the character into the rope rather than flattening it
+            self.replace_range(index, index + 1, char)
         else:
-            self._chars[index] = char
+            code = ord(str(char))
+            self._make_writable(typecode_for(code))
+            self._chars[self._start + index] = code
+        self._lines = lines
+
+    #####################################################
+    def _make_writable(self, typecode: str) -> None:
+        ''' flattens this String and makes sure it owns a buffer at least as
+            wide as typecode, which can then be written to in place
+        '''
+        self._flatten()
+        self._str = self._hash = self._rolling = self._lines = None  # the cached forms are now stale
+        # copy-on-write: never write into a buffer another String is looking
+        # at, and widen the buffer first if the new characters do not fit
+        typecode = max(self._chars.typecode, typecode, key = WIDTHS.index)
+        if self._shared or typecode != self._chars.typecode:
+            chars = copy(self._chars, self._start, self._start + self._length)
+            self._chars, self._start, self._shared = widen(chars, typecode), 0, False
+
+    #####################################################
+    def _set_slice(self, index: slice, text: 'String | str') -> None:
+        ''' assigns text to a slice of this String (see __setitem__) '''
+        start, stop, step = index.indices(self.len())
+        if step == 1:
+            stop = max(start, stop)
+            text = text if isinstance(text, String) else String(text)
+            if text.len() != stop - start or self._rope is not None:
+                self.replace_range(start, stop, text)
+                return
+            positions = range(start, stop)
+        else:
+            positions = range(start, stop, step)
+        self._write(positions, text)
+
+    #####################################################
+    def _set_many(self, indices, chars: 'String | str') -> None:
+        ''' assigns chars to the positions in a sequence (or numpy array) of
+            indices of this String (see __setitem__)
+        '''
+        n = self.len()
+        if hasattr(indices, 'dtype'):   # a numpy array: check it without a loop
+            if indices.dtype.kind == 'b':
+                if indices.shape != (n,):
+                    raise IndexError("Boolean mask must have one entry per character")
+                indices = indices.nonzero()[0]
+            indices = indices.astype('int64')
+            indices[indices < 0] += n
+            if len(indices) and (indices.min() < 0 or indices.max() >= n):
+                raise IndexError("Index value invalid relative to string length")
+        elif not isinstance(indices, range):
+            indices = [i + n if i < 0 else i for i in indices]
+            if indices and (min(indices) < 0 or max(indices) >= n):
+                raise IndexError("Index value invalid relative to string length")
+        self._write(indices, chars)
+
+    #####################################################
+    def _write(self, positions, text: 'String | str') -> None:
+        ''' writes the characters of text (or its single character, repeated)
+            to positions of this String, given as a range or as a sequence or
+            numpy array of checked, non-negative ints, in one pass
+        '''
+        chars, start, end = buffer_of(text)
+        if end - start == 1 and len(positions) != 1:
+            codes = array(chars.typecode, [chars[start]]) * len(positions)
+        elif end - start == len(positions):
+            codes = copy(chars, start, end)
+        else:
+            raise ValueError(f"Cannot assign {end - start} characters to "
+                             f"{len(positions)} positions")
+        if len(codes) == 0:
+            return
+        self._make_writable(typecode_for(max(codes)))
+        codes = widen(codes, self._chars.typecode)
+        if codes.typecode != self._chars.typecode:   # narrower than the buffer
+            codes = array(self._chars.typecode, codes)
+
+        base = self._start
+        if isinstance(positions, range):
+            # array slices take care of the whole (extended) slice at once; a
+            # negative step may stop just before the buffer's first item
+            stop = base + positions.stop
+            self._chars[base + positions.start : stop if stop >= 0 else None : positions.step] = codes
+        elif hasattr(positions, 'dtype'):
+            # numpy fancy assignment straight into the buffer
+            import numpy as np
+            view = np.frombuffer(self._chars, dtype = np.dtype(self._chars.typecode))
+            view[base + positions] = np.frombuffer(codes, dtype = view.dtype)
+        else:
+            buffer = self._chars
+            for position, code in zip(positions, codes):
+                buffer[base + position] = code
+
+    #####################################################
+    def set_items(self, pairs) -> None:
+        ''' overwrites many characters in one pass, given as (index, char)
+            pairs; the same as s[indices] = chars
+
+        Args:
+            pairs: an iterable of (int index, single-character str) pairs
+
+        Raises:
+            IndexError: if an index is invalid relative to String length
+        '''
+        pairs = list(pairs)
+        self[[index for index, _ in pairs]] = "".join(char for _, char in pairs)
+
+    #####################################################
+    def translate(self, table) -> None:
+        ''' rewrites every character of this String through table in a single
+            pass, in place; table is as for str.translate (e.g. made by
+            str.maketrans): it maps code points to a code point, an str
+            (possibly empty or longer than one character) or None (delete)
+
+        Args:
+            table: a dict (or anything with __getitem__) keyed by code points
+        '''
+        self.replace_range(0, self.len(), str(self).translate(table))
 
     #####################################################
     def __add__(self, other: 'String | str') -> 'String':
@@ -159,52 +666,471 @@ class String:
         Returns:
             a String object represent the concatenation of the two strings
         '''
-        #Create a new string to not modify the current one
-        new_char_array = self._chars[:] #Slice to copy
-        other_string  = other.__str__() if isinstance(other, String) else other #Check instance
-        other_char_array = [c for c in other_string]
+        other = other if isinstance(other, String) else String(other) #Check instance
+
+        # Long results become a rope sharing both operands: O(log n) instead of
+        # copying everything, which made repeated + quadratic
+        if self._rope is not None or other._rope is not None or \
+                self.len() + other.len() > Rope.LEAF_SIZE:
+            return String._from_rope(Rope.concat(self._as_rope(), other._as_rope()))
 
-        new_char_array.extend(other_char_array)
+        # Both buffers need the same width before they can be joined
+        typecode = max(self._chars.typecode, other._chars.typecode, key=WIDTHS.index)
 
-        return String(new_char_array)
+        # joining builds a new array, leaving both operands unchanged
+        return String._from_array(join((self._window(), other._window()), typecode))
 
     #####################################################
     def substring(self, start: int, end: int) -> 'String':
-        ''' returns the String object that represents the sub-string of the curernt String object.
-
-        Args:
-            start: an int object to represent the starting index
-            end: an int object to represent the ending index
-
-        Returns:
-            a String object that contains the desired substring
-
-        The start and end can be NEGATIVE value, it will obey the rule from python array slicing
-
-        We had a lot of dicssion about this method. At first we were doing to consider
-        negative indexes, which would require us to make assumptions about what the user
-        wanted when they entered a start that was larger than an end. We also were going
-        to consider the case in which a user inputted a mixed start/end index. However,
-        for the sake of simlicity we decided that the user would be aware of the constraints
-        before using the program. This is why the actual method is implemented using only
-        one line of code.
-        '''
-        # if start - end == 1:
-        #     # We assume the user is smart enough to know that substring(-3,-4)
-        #     # means that the start and end are the same
-        #     return String("")
-        # elif start < 0 and end <0:
-        #     if start > end:
-        #         new_chars = reversed(chars[])
-        #         return String("".join(new_chars))
-        #     else:
-        #         new_chars = chars[start:end]
-        #         return String("".join(new_chars))
-        # elif start >= 0 and end >= 0:
-        #         if start > end:
-        #             raise ValueError("Start index cannot be larger than or equal to end index")
-        #         else:
-        #             return String("".join(new_chars))
-
-        #slice will return a copy of that array
-        return String("".join(self._chars[start:end]))
+        ''' returns the characters in [start, end) of this String as a String
+            viewing the same buffer: no characters are copied, in O(1) (or
+            O(log n) pieces for a rope), and the buffer is only copied when
+            either String is later written to (copy-on-write)
+
+        Args:
+            start: an int index of the first character; negative and
+                out-of-range values follow python slicing rules
+            end:   an int index one past the last character, likewise
+
+        Returns:
+            a String of the characters from start up to end (empty if end is
+            not after start)
+        '''
+        # python slicing rules for negative and out-of-range indices
+        start, end, _ = slice(start, end).indices(self.len())
+        end = max(start, end)
+
+        rope = self._rope
+        if rope is not None:
+            return String._from_rope(Rope.sub_rope(rope, start, end))
+
+        # a view sharing this String's buffer: no characters are copied until
+        # either String is written to with __setitem__
+        return self._view(start, end)
+
+    #####################################################
+    def replace_range(self, start: int, end: int, text: 'String | str') -> None:
+        ''' replaces the characters in [start, end) of this String by text, in
+            place; start and end follow python slicing rules
+
+        The String becomes a rope of pieces viewing the unchanged parts of
+        its old buffer(s) and the buffer of text, so an edit costs O(log n)
+        plus the length of text (at most LEAF_SIZE more when small pieces
+        get merged), whatever the length of the String.
+
+        Args:
+            start: an int index of the first character to replace
+            end:   an int index one past the last character to replace
+            text:  a String or str to put in their place
+        '''
+        start, end, _ = slice(start, end).indices(self.len())
+        end = max(start, end)
+        text = text if isinstance(text, String) else String(text)
+        node = self._as_rope()
+        if isinstance(node, Rope.Concat) and 0 < text._length == end - start \
+                and text._rope is None:
+            # same length: copy only the path to the leaf holding the range
+            edited = Rope.overwrite(node, start, text._as_rope())
+            if edited is not None:
+                self._assign(edited)
+                return
+        self._assign(Rope.concat(Rope.concat(Rope.sub_rope(node, 0, start), text._as_rope()),
+                                 Rope.sub_rope(node, end, self._length)))
+
+    #####################################################
+    def insert(self, index: int, text: 'String | str') -> None:
+        ''' inserts text before position index of this String, in place (like
+            list.insert, out-of-range indices insert at either end)
+
+        Args:
+            index: an int position; negative values count from the end
+            text:  a String or str to insert
+        '''
+        self.replace_range(index, index, text)
+
+    #####################################################
+    def delete(self, start: int, end: int) -> None:
+        ''' removes the characters in [start, end) of this String, in place;
+            start and end follow python slicing rules
+
+        Args:
+            start: an int index of the first character to remove
+            end:   an int index one past the last character to remove
+        '''
+        self.replace_range(start, end, "")
+
+    #####################################################
+    def freeze(self) -> 'FrozenString':
+        ''' returns an immutable FrozenString with the same contents, sharing
+            this String's storage (copy-on-write) rather than copying it
+
+        Returns:
+            a FrozenString object equal to this String
+        '''
+        rope = self._rope
+        if rope is not None:
+            frozen = FrozenString._from_rope(rope)
+        else:
+            self._shared = True
+            frozen = FrozenString._from_array(self._chars, self._start, self._length, shared = True)
+        frozen._str, frozen._hash, frozen._rolling = self._str, self._hash, self._rolling
+        return frozen
+
+    #####################################################
+    def compress(self, block: int = COMPRESSED_BLOCK, level: int = 6) -> 'String':
+        ''' returns a String with the same contents, kept in memory as blocks
+            compressed with zlib (see CompressedBuffer.py): len is still O(1),
+            and [] access and substrings only decompress the blocks they
+            touch, a few of which are cached
+
+        Meant for large, repetitive texts that are rarely read.  Like a
+        file-backed String, the result is read only in place: writing to it
+        decompresses a copy first.
+
+        Args:
+            block: number of characters per compressed block
+            level: zlib compression level, 1 (fastest) to 9 (smallest)
+
+        Returns:
+            a String object equal to this String
+        '''
+        chars, start, end = self._buffer()
+        compressed = CompressedBuffer(chars, start, end, block, level)
+        return type(self)._from_array(compressed, 0, len(compressed), shared = True)
+
+    #####################################################
+    def find(self, sub: 'String | str | Pattern', start: int = 0, end: int = None) -> int:
+        ''' returns the lowest index in this String where sub is found within
+            the slice [start:end], or -1 if it is not found
+
+        Args:
+            sub:   a String, str or compiled Pattern to search for; passing a
+                Pattern avoids redoing its preprocessing on every call
+            start: an int index where the search starts
+            end:   an int index where the search ends (default: the end)
+
+        Returns:
+            an int index, or -1 if sub is not found
+        '''
+        pattern = sub if isinstance(sub, Pattern) else Pattern(sub)
+        return pattern.find(self, start, end)
+
+    #####################################################
+    def rfind(self, sub: 'String | str | Pattern', start: int = 0, end: int = None) -> int:
+        ''' returns the highest index in this String where sub is found within
+            the slice [start:end], or -1 if it is not found
+
+        Args:
+            sub:   a String, str or compiled Pattern to search for
+            start: an int index where the search starts
+            end:   an int index where the search ends (default: the end)
+
+        Returns:
+            an int index, or -1 if sub is not found
+        '''
+        pattern = sub if isinstance(sub, Pattern) else Pattern(sub)
+        return pattern.rfind(self, start, end)
+
+    #####################################################
+    def index(self, sub: 'String | str | Pattern', start: int = 0, end: int = None) -> int:
+        ''' like find, but raises ValueError when sub is not found
+
+        Args:
+            sub:   a String, str or compiled Pattern to search for
+            start: an int index where the search starts
+            end:   an int index where the search ends (default: the end)
+
+        Returns:
+            the lowest int index where sub is found
+
+        Raises:
+            ValueError: if sub is not found
+        '''
+        pattern = sub if isinstance(sub, Pattern) else Pattern(sub)
+        return pattern.index(self, start, end)
+
+    #####################################################
+    def count(self, sub: 'String | str | Pattern', start: int = 0, end: int = None) -> int:
+        ''' returns the number of non-overlapping occurrences of sub within
+            the slice [start:end]
+
+        Args:
+            sub:   a String, str or compiled Pattern to search for
+            start: an int index where the search starts
+            end:   an int index where the search ends (default: the end)
+
+        Returns:
+            an int count of the occurrences
+        '''
+        pattern = sub if isinstance(sub, Pattern) else Pattern(sub)
+        return pattern.count(self, start, end)
+
+    #####################################################
+    def __contains__(self, sub: 'String | str | Pattern') -> bool:
+        ''' overrides the __contains__ special method, allowing use of the in
+            operator to check for a substring
+
+        Args:
+            sub: a String, str or compiled Pattern to search for
+
+        Returns:
+            True if sub occurs in this String; False o/w
+        '''
+        return self.find(sub) != -1
+
+    #####################################################
+    def split(self, sep: 'String | str' = None, maxsplit: int = -1,
+              any_of: 'String | str' = None):
+        ''' returns a generator over the pieces of this String separated by
+            sep, like str.split, each a view sharing this String's buffer (see
+            splitting.py)
+
+        Args:
+            sep:      a String or str separating the pieces; None (default)
+                      splits at runs of whitespace, dropping empty pieces
+            maxsplit: the maximum number of splits, the rest making the last
+                      piece; -1 (default) for no limit
+            any_of:   a String or str of delimiter characters, each of which
+                      separates two pieces (instead of sep)
+
+        Raises:
+            ValueError: if sep or any_of is empty, or both are given
+        '''
+        return splitting.split(self, sep, maxsplit, any_of)
+
+    #####################################################
+    def rsplit(self, sep: 'String | str' = None, maxsplit: int = -1,
+               any_of: 'String | str' = None):
+        ''' like split, but with at most maxsplit splits made from the right,
+            like str.rsplit; the pieces are still generated from left to right
+        '''
+        return splitting.rsplit(self, sep, maxsplit, any_of)
+
+    #####################################################
+    def splitlines(self, keepends: bool = False):
+        ''' returns a generator over the lines of this String, like
+            str.splitlines, each a view sharing this String's buffer
+
+        Args:
+            keepends: True to keep the line boundary at the end of each line
+        '''
+        return splitting.splitlines(self, keepends)
+
+    #####################################################
+    def partition(self, sep: 'String | str') -> tuple:
+        ''' returns (before, sep, after) split at the first occurrence of sep,
+            like str.partition, as views sharing this String's buffer
+
+        Raises:
+            ValueError: if sep is empty
+        '''
+        return splitting.partition(self, sep)
+
+    #####################################################
+    def rpartition(self, sep: 'String | str') -> tuple:
+        ''' returns (before, sep, after) split at the last occurrence of sep,
+            like str.rpartition, as views sharing this String's buffer
+
+        Raises:
+            ValueError: if sep is empty
+        '''
+        return splitting.partition(self, sep, from_right = True)
+
+    #####################################################
+    def edit_distance(self, other: 'String | str', max_distance: int = None) -> int:
+        ''' returns the Levenshtein distance between this String and other:
+            the fewest single-character insertions, deletions and
+            substitutions turning one into the other (see distance.levenshtein)
+
+        Args:
+            other:        a String or str
+            max_distance: if given, stop as soon as the distance is known to be
+                          larger, and return max_distance + 1
+
+        Returns:
+            an int distance
+        '''
+        return distance.levenshtein(self, other, max_distance)
+
+    #####################################################
+    def lcs(self, other: 'String | str') -> 'String':
+        ''' returns a longest common subsequence of this String and other,
+            made of views of this String joined as a rope
+
+        Args:
+            other: a String or str
+
+        Returns:
+            a String object
+        '''
+        result = String("")
+        for tag, i1, i2, _, _ in distance.diff(self, other):
+            if tag == 'equal':
+                result = result + self.substring(i1, i2)
+        return result
+
+    #####################################################
+    def diff(self, other: 'String | str', lines: bool = False) -> list:
+        ''' returns the differences between this String and other, as
+            difflib-style opcodes (see distance.diff)
+
+        Args:
+            other: a String or str
+            lines: True to compare line by line rather than by character
+
+        Returns:
+            a list of (tag, i1, i2, j1, j2) tuples, tag being 'equal',
+            'replace', 'delete' or 'insert', meaning that self[i1:i2] is equal
+            to, or is to be replaced by, other[j1:j2]
+        '''
+        return distance.diff(self, other, lines)
+
+    #####################################################
+    def rolling_hash(self) -> RollingHash:
+        ''' returns the RollingHash of this String's characters, built in O(n)
+            on the first call and kept until the String is changed
+
+        Returns:
+            a RollingHash object
+        '''
+        if self._rolling is None:
+            self._rolling = RollingHash(self)
+        return self._rolling
+
+    #####################################################
+    def substring_equals(self, i: int, j: int, length: int) -> bool:
+        ''' returns True if the length characters starting at i equal those
+            starting at j, comparing rolling-hash fingerprints in O(1)
+            instead of building and comparing substrings
+
+        Args:
+            i:      an int index of the first substring
+            j:      an int index of the second substring
+            length: the int number of characters compared
+
+        Returns:
+            True if the substrings are equal; False o/w
+
+        Raises:
+            IndexError: if either substring does not fit in this String
+        '''
+        return self.rolling_hash().substring_equals(i, j, length)
+
+    #####################################################
+    def common_prefix_length(self, i: int, j: int) -> int:
+        ''' returns the length of the longest common prefix of the suffixes
+            starting at i and j, by binary search over rolling-hash
+            fingerprints in O(log n)
+
+        Raises:
+            IndexError: if i or j is not an index of this String (or its end)
+        '''
+        return self.rolling_hash().common_prefix_length(i, j)
+
+    #####################################################
+    def duplicate_windows(self, width: int) -> list:
+        ''' returns, for each window of width characters occurring more than
+            once, the list of its starting positions (see
+            RollingHash.duplicate_windows)
+
+        Raises:
+            ValueError: if width is less than 1
+        '''
+        return self.rolling_hash().duplicate_windows(width)
+
+    #####################################################
+    def line_index(self) -> LineIndex:
+        ''' returns the LineIndex of this String's line starts, built in O(n)
+            on the first call; overwriting one character with [] keeps it up
+            to date in O(log n), any other edit makes it built again
+
+        Returns:
+            a LineIndex object
+        '''
+        if self._lines is None:
+            self._lines = LineIndex(self)
+        return self._lines
+
+    #####################################################
+    def line_count(self) -> int:
+        ''' returns the number of lines: one more than the number of newlines '''
+        return self.line_index().line_count()
+
+    #####################################################
+    def offset_to_line_col(self, offset: int) -> tuple:
+        ''' returns the (line, column) of the character at offset, both
+            counted from 0, in O(log n) (see LineIndex.py)
+
+        Raises:
+            IndexError: unless 0 <= offset <= len(self)
+        '''
+        return self.line_index().offset_to_line_col(offset)
+
+    #####################################################
+    def line_col_to_offset(self, line: int, column: int) -> int:
+        ''' returns the offset of the character at column of line, both
+            counted from 0, in O(log n) (see LineIndex.py)
+
+        Raises:
+            IndexError: if line or column is out of range
+        '''
+        return self.line_index().line_col_to_offset(line, column)
+
+    #####################################################
+    def line(self, number: int) -> 'String':
+        ''' returns line number (counted from 0; negative values count from
+            the end) without its newline, as a view of this String
+
+        Raises:
+            IndexError: if number is out of range
+        '''
+        start, end = self.line_index().line_bounds(number)
+        return self.substring(start, end)
+
+###############################################################################
+
+class FrozenString(String):
+    '''Immutable variant of String, safe to use as a dict key or set member.
+
+    A FrozenString supports every String operation except __setitem__, which
+    raises a TypeError (like item assignment on an str).  Its str version and
+    hash are computed at most once.
+
+    Attributes:
+        freeze : returns this FrozenString itself
+    '''
+
+    __slots__ = ('__weakref__',)   # so InternPool can hold FrozenStrings weakly
+
+    #####################################################
+    def __setitem__(self, index: int, char: str) -> None:
+        ''' overrides String.__setitem__ to forbid modification
+
+        Raises:
+            TypeError: always, as a FrozenString cannot be changed
+        '''
+        raise TypeError("'FrozenString' object does not support item assignment")
+
+    #####################################################
+    def replace_range(self, start: int, end: int, text: 'String | str') -> None:
+        ''' overrides String.replace_range (and so insert and delete) to
+            forbid modification
+
+        Raises:
+            TypeError: always, as a FrozenString cannot be changed
+        '''
+        raise TypeError("'FrozenString' object does not support editing")
+
+    #####################################################
+    def freeze(self) -> 'FrozenString':
+        ''' returns this FrozenString, which is already immutable '''
+        return self
+
+###############################################################################
+
+def frozen(text: 'String | str') -> FrozenString:
+    ''' returns an immutable version of text: text.freeze() for a String,
+        which shares its storage copy-on-write, or a new FrozenString of an
+        str
+    '''
+    return text.freeze() if isinstance(text, String) else FrozenString(text)
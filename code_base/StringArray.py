@@ -0,0 +1,227 @@
+'''Columnar container for many strings, with NumPy-vectorized operations.
+
+A StringArray keeps all of its strings in one contiguous code-point buffer
+(the same compact 1/2/4-byte layout a String uses) together with an array of
+start offsets and an array of end offsets, much like Apache Arrow's string
+columns.  Lengths, comparisons, substrings and emptiness checks are computed
+for every element at once with NumPy, instead of one String at a time.
+
+Requires NumPy.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from array import array
+
+import numpy as np
+
+from .String import String
+from .codepoints import UCS1, UCS2, encode, buffer_of
+
+# numpy dtypes matching the code-point buffer typecodes
+_DTYPES = {UCS1: np.uint8, UCS2: np.uint16}
+
+# bound on the temporary (element x character) index matrices in __eq__
+_CHUNK = 1 << 20
+
+###############################################################################
+
+class StringArray:
+    '''A column of strings stored in one shared code-point buffer.
+
+    Element i is the code points _data[_starts[i]:_ends[i]].  An array built
+    from strings has _ends[i] == _starts[i + 1] (a single offsets array); a
+    substring of it shares the buffer and only has new offsets.
+
+    Attributes:
+        len      : returns the (int) number of strings in the array
+        lengths  : returns a numpy array of the number of characters per string
+        is_empty : returns a numpy bool mask of the empty strings
+        __eq__   : compares every string with an str/String, or pairwise with
+                   another StringArray, returning a numpy bool mask
+        __getitem__: an int gives a String view; a slice, mask or index array
+                   gives a StringArray sharing the buffer
+        substring: returns a StringArray of the [start:end] slice of every string
+        to_list  : returns a list of str
+    '''
+
+    __slots__ = ('_chars', '_data', '_starts', '_ends')
+
+    #####################################################
+    def __init__(self, strings) -> None:
+        ''' initialization method for the StringArray class
+
+        Args:
+            strings: an iterable of str or String objects
+        '''
+        strings = [str(s) for s in strings]
+        offsets = np.zeros(len(strings) + 1, dtype = np.int64)
+        np.cumsum([len(s) for s in strings], out = offsets[1:])
+        self._set(encode("".join(strings)), offsets[:-1], offsets[1:])
+
+    #####################################################
+    def _set(self, chars: array, starts: np.ndarray, ends: np.ndarray) -> None:
+        ''' (re)initializes the storage; _data is a zero-copy numpy view of
+            the code-point array chars
+        '''
+        self._chars  = chars
+        self._data   = np.frombuffer(chars, dtype = _DTYPES.get(chars.typecode, np.uint32))
+        self._starts = starts
+        self._ends   = ends
+
+    #####################################################
+    @classmethod
+    def _from_offsets(cls, chars: array, starts: np.ndarray, ends: np.ndarray) -> 'StringArray':
+        ''' builds a StringArray around existing storage (internal use only) '''
+        new_array = cls.__new__(cls)
+        new_array._set(chars, starts, ends)
+        return new_array
+
+    #####################################################
+    def len(self) -> int:
+        ''' returns the number of strings in the array '''
+        return len(self._starts)
+
+    def __len__(self) -> int:
+        return self.len()
+
+    #####################################################
+    def lengths(self) -> np.ndarray:
+        ''' returns a numpy int array of the number of characters per string '''
+        return self._ends - self._starts
+
+    #####################################################
+    def is_empty(self) -> np.ndarray:
+        ''' returns a numpy bool mask, True where the string is empty '''
+        return self._ends == self._starts
+
+    #####################################################
+    def __getitem__(self, index):
+        ''' overrides the __getitem__ special method
+
+        Args:
+            index: an int, a slice, a numpy bool mask or an array of ints
+
+        Returns:
+            a String view sharing the buffer (for an int index), otherwise a
+            StringArray sharing the buffer
+
+        Raises:
+            IndexError: if an int index is out of range
+        '''
+        if isinstance(index, (int, np.integer)):
+            if index < 0: index += self.len()
+            if not 0 <= index < self.len():
+                raise IndexError("StringArray index out of range")
+            start, end = int(self._starts[index]), int(self._ends[index])
+            return String._from_array(self._chars, start, end - start, shared = True)
+        return StringArray._from_offsets(self._chars, self._starts[index], self._ends[index])
+
+    #####################################################
+    def __iter__(self):
+        ''' generator of String views of the elements, in order '''
+        for i in range(self.len()):
+            yield self[i]
+
+    #####################################################
+    def substring(self, start: int, end: int) -> 'StringArray':
+        ''' returns a StringArray of the [start:end] slice of every string,
+            with python slicing rules per string (negative indices count from
+            each string's end); no characters are copied
+
+        Args:
+            start: an int index of the first character to keep
+            end:   an int index one past the last character to keep
+
+        Returns:
+            a StringArray sharing this array's buffer
+        '''
+        lengths = self.lengths()
+
+        def clip(index: int) -> np.ndarray:
+            position = lengths + index if index < 0 else np.full_like(lengths, index)
+            return np.clip(position, 0, lengths)
+
+        first = clip(start)
+        last  = np.maximum(clip(end), first)
+        return StringArray._from_offsets(self._chars, self._starts + first, self._starts + last)
+
+    #####################################################
+    def _equals_scalar(self, other: 'String | str') -> np.ndarray:
+        ''' returns the mask of elements equal to a single String or str '''
+        chars, start, end = buffer_of(other)
+        m = end - start
+        result = self.lengths() == m
+        if m == 0 or not result.any():
+            return result
+        needle = np.frombuffer(chars, dtype = _DTYPES.get(chars.typecode, np.uint32))[start:end]
+        if needle.max() > np.iinfo(self._data.dtype).max:
+            return np.zeros_like(result)   # too wide to occur in this buffer
+
+        candidates = np.flatnonzero(result)
+        columns = np.arange(m)
+        for i in range(0, len(candidates), max(_CHUNK // m, 1)):
+            chunk = candidates[i : i + max(_CHUNK // m, 1)]
+            window = self._data[self._starts[chunk][:, None] + columns]
+            result[chunk] = (window == needle).all(axis = 1)
+        return result
+
+    #####################################################
+    def _equals_array(self, other: 'StringArray') -> np.ndarray:
+        ''' returns the mask of elements equal to the element at the same
+            index of another StringArray
+        '''
+        if self.len() != other.len():
+            raise ValueError("StringArrays must have the same number of elements")
+        lengths = self.lengths()
+        result = lengths == other.lengths()
+        candidates = np.flatnonzero(result & (lengths > 0))
+        if len(candidates) == 0:
+            return result
+
+        # one flat gather of every character of every candidate pair, then a
+        # per-element count of the mismatches
+        sizes   = lengths[candidates]
+        element = np.repeat(np.arange(len(candidates)), sizes)
+        within  = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        mine    = self._data[self._starts[candidates][element] + within]
+        theirs  = other._data[other._starts[candidates][element] + within]
+        mismatches = np.bincount(element[mine != theirs], minlength = len(candidates))
+        result[candidates[mismatches > 0]] = False
+        return result
+
+    #####################################################
+    def __eq__(self, other) -> np.ndarray:
+        ''' overrides the __eq__ special method, comparing every element with
+            an str/String, or element-wise with a StringArray (or list)
+
+        Args:
+            other: a String, str, StringArray or list of strings
+
+        Returns:
+            a numpy bool mask with one entry per element
+        '''
+        if isinstance(other, (String, str)):
+            return self._equals_scalar(other)
+        if isinstance(other, list):
+            other = StringArray(other)
+        if isinstance(other, StringArray):
+            return self._equals_array(other)
+        return NotImplemented
+
+    def __ne__(self, other) -> np.ndarray:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else ~result
+
+    __hash__ = None   # mutable container compared element-wise, like ndarray
+
+    #####################################################
+    def to_list(self) -> list:
+        ''' returns the elements as a list of str '''
+        return [str(s) for s in self]
+
+    #####################################################
+    def __repr__(self) -> str:
+        return f'StringArray({self.to_list()!r})'
@@ -0,0 +1,382 @@
+'''Full-text indexes for answering many queries on one large, unchanging String.
+
+Two indexes are provided, both built once in O(n log^2 n) time:
+
+    SuffixArray: the starting positions of all suffixes in sorted order, plus
+        the LCP array (longest common prefix of neighbouring suffixes).
+        count/locate take O(m log n) for a needle of length m, and the
+        longest repeated/common substring come from a single pass over LCP.
+        Memory: the text plus two int arrays of n entries.
+
+    FMIndex: the Burrows-Wheeler transform of the text with occurrence
+        checkpoints and a sampled suffix array.  count takes O(m) steps and
+        locate O(m + SAMPLE) per match; the suffix array itself is dropped
+        after construction, so memory is the BWT (same width as the text)
+        plus roughly 4 * sigma / STEP bytes per character for the
+        checkpoints (sigma distinct characters), 8 / SAMPLE for the sampled
+        suffix array and 3 / 16 for the bitvector marking its rows.
+
+A SuffixArray keeps a FrozenString of the text, which shares storage with
+the String the index was built from (copy-on-write), so later edits to that
+String do not invalidate the index.  An FMIndex keeps no text at all: its
+BWT is enough to answer queries.
+
+Like str.count, both count the empty needle at every index, the end of the
+text included: n + 1 times in a text of n characters.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from .String import String, frozen
+from .codepoints import buffer_of
+
+# FMIndex: rows between occurrence checkpoints, and suffix array sampling rate
+STEP   = 64
+SAMPLE = 32
+
+# FMIndex: rows per rank checkpoint of the bitvector of sampled rows (a word)
+RANK_BLOCK = 64
+
+###############################################################################
+
+def _suffix_array(codes: list) -> array:
+    ''' returns the suffix array of a list of ints, by prefix doubling: the
+        suffixes are sorted by their first k symbols for k = 1, 2, 4, ...,
+        each round sorting on the pair of ranks of the two halves
+
+    Args:
+        codes: a list of ints (code points, possibly with separators)
+
+    Returns:
+        an array of the starting indices of the suffixes in sorted order
+    '''
+    n = len(codes)
+    if n == 0:
+        return array('q')
+    order = sorted(range(n), key = codes.__getitem__)
+    rank  = [0] * n
+    for i in range(1, n):
+        rank[order[i]] = rank[order[i - 1]] + (codes[order[i]] != codes[order[i - 1]])
+
+    k = 1
+    while rank[order[-1]] < n - 1:    # stop once all suffixes are distinct
+        second = rank[k:] + [-1] * k  # rank of the suffix k further on
+        key    = [(rank[i], second[i]) for i in range(n)]
+        order.sort(key = key.__getitem__)
+        new_rank = [0] * n
+        for i in range(1, n):
+            new_rank[order[i]] = new_rank[order[i - 1]] + (key[order[i]] != key[order[i - 1]])
+        rank = new_rank
+        k *= 2
+    return array('q', order)
+
+def _lcp_array(codes: list, suffixes: array) -> array:
+    ''' returns the LCP array by Kasai's algorithm in O(n): entry i is the
+        length of the longest common prefix of suffixes[i - 1] and suffixes[i]
+        (entry 0 is 0)
+    '''
+    n = len(codes)
+    rank = [0] * n
+    for i, position in enumerate(suffixes):
+        rank[position] = i
+    lcp = array('q', bytes(8 * n))
+    h = 0
+    for position in range(n):
+        if rank[position] > 0:
+            previous = suffixes[rank[position] - 1]
+            while position + h < n and previous + h < n and \
+                    codes[position + h] == codes[previous + h]:
+                h += 1
+            lcp[rank[position]] = h
+            if h > 0: h -= 1
+        else:
+            h = 0
+    return lcp
+
+###############################################################################
+
+class SuffixArray:
+    '''Suffix array and LCP array of a String, for fast repeated queries.
+
+    Attributes:
+        text      : the (frozen) String that was indexed
+        suffixes  : array of suffix start positions in sorted order
+        lcp       : array of longest common prefixes of neighbouring suffixes
+        len       : returns the (int) number of characters indexed
+        count     : returns the number of (overlapping) occurrences of a needle
+        locate    : returns the sorted positions of the occurrences of a needle
+        longest_repeated_substring: returns the longest substring occurring twice
+        longest_common_substring  : returns the longest substring shared with
+                                    another String
+    '''
+
+    __slots__ = ('text', 'suffixes', 'lcp', '_chars', '_offset')
+
+    #####################################################
+    def __init__(self, text: 'String | str') -> None:
+        ''' initialization method for the SuffixArray class
+
+        Args:
+            text: the String or str to index
+        '''
+        self.text = frozen(text)
+        chars, start, end = self.text._buffer()
+        self._chars, self._offset = chars, start
+        codes = chars[start:end].tolist()
+        self.suffixes = _suffix_array(codes)
+        self.lcp      = _lcp_array(codes, self.suffixes)
+
+    #####################################################
+    def len(self) -> int:
+        ''' returns the number of characters in the indexed text '''
+        return self.text.len()
+
+    #####################################################
+    def _range(self, pattern: 'String | str') -> tuple:
+        ''' returns the [lo, hi) range of suffixes starting with pattern, by
+            binary search comparing buffer slices with the pattern
+        '''
+        chars, start, end = buffer_of(pattern)
+        m, base, stop = end - start, self._offset, self._offset + self.len()
+        try:
+            needle = array(self._chars.typecode, chars[start:end])
+        except OverflowError:
+            return 0, 0   # pattern has characters too wide to be in the text
+
+        def prefix(position: int) -> array:
+            return self._chars[base + position : min(base + position + m, stop)]
+
+        lo = bisect_left(self.suffixes, needle, key = prefix)
+        hi = bisect_right(self.suffixes, needle, lo = lo, key = prefix)
+        return lo, hi
+
+    #####################################################
+    def count(self, pattern: 'String | str') -> int:
+        ''' returns the number of (possibly overlapping) occurrences of
+            pattern in the text, in O(m log n) time
+
+        Args:
+            pattern: a String or str to look for
+
+        Returns:
+            an int count
+        '''
+        lo, hi = self._range(pattern)
+        return hi - lo + (len(pattern) == 0)   # "" also occurs at the end
+
+    #####################################################
+    def locate(self, pattern: 'String | str') -> list:
+        ''' returns the positions of all (possibly overlapping) occurrences of
+            pattern in the text, in increasing order
+
+        Args:
+            pattern: a String or str to look for
+
+        Returns:
+            a sorted list of int indices
+        '''
+        lo, hi = self._range(pattern)
+        positions = sorted(self.suffixes[lo:hi])
+        if len(pattern) == 0:
+            positions.append(self.len())       # "" also occurs at the end
+        return positions
+
+    #####################################################
+    def longest_repeated_substring(self) -> String:
+        ''' returns the longest substring occurring at least twice in the text
+            (possibly overlapping), as a view of the text; the empty String
+            if no character repeats
+        '''
+        if self.len() < 2:
+            return self.text.substring(0, 0)
+        best = max(range(len(self.lcp)), key = self.lcp.__getitem__)
+        start = self.suffixes[best]
+        return self.text.substring(start, start + self.lcp[best])
+
+    #####################################################
+    def longest_common_substring(self, other: 'String | str') -> String:
+        ''' returns the longest substring of the text that also occurs in
+            other, as a view of the text (the leftmost one if there are ties)
+
+        This builds a suffix array of the text and other joined by a unique
+        separator, so it costs about as much as indexing both of them.
+
+        Args:
+            other: a String or str
+
+        Returns:
+            a String, empty if the two have no character in common
+        '''
+        chars, start, end = buffer_of(other)
+        n = self.len()
+        codes = self._chars[self._offset : self._offset + n].tolist() + [-1] + \
+                chars[start:end].tolist()
+        suffixes = _suffix_array(codes)
+        lcp      = _lcp_array(codes, suffixes)
+
+        best_length, best_start = 0, 0
+        for i in range(1, len(codes)):
+            # neighbouring suffixes from different sides of the separator
+            if (suffixes[i] < n) != (suffixes[i - 1] < n):
+                here = min(suffixes[i], suffixes[i - 1])
+                if lcp[i] > best_length or (lcp[i] == best_length and here < best_start):
+                    best_length, best_start = lcp[i], here
+        return self.text.substring(best_start, best_start + best_length)
+
+###############################################################################
+
+class FMIndex:
+    '''Compressed full-text index (FM-index) of a String.
+
+    Rows are the sorted rotations of the text followed by a sentinel smaller
+    than every character.  The last column of those rows (the BWT) together
+    with character counts is enough to count a needle in O(m) steps by
+    backward search; a sample of the suffix array allows locating matches.
+
+    Attributes:
+        len    : returns the (int) number of characters indexed
+        count  : returns the number of (overlapping) occurrences of a needle
+        locate : returns the sorted positions of the occurrences of a needle
+    '''
+
+    __slots__ = ('_length', '_bwt', '_primary', '_first', '_checkpoints', '_samples',
+                 '_sampled', '_sampled_ranks')
+
+    #####################################################
+    def __init__(self, text: 'String | str') -> None:
+        ''' initialization method for the FMIndex class
+
+        Args:
+            text: the String or str to index
+        '''
+        chars, start, end = buffer_of(text)   # the text itself is not kept
+        codes = chars[start:end].tolist()
+        n = self._length = len(codes)
+        suffixes = [n] + _suffix_array(codes).tolist()  # the sentinel sorts first
+
+        # BWT: the character before each sorted suffix; the row of the whole
+        # text (preceded by the sentinel) holds a placeholder 0 instead
+        self._bwt = array(chars.typecode, bytes(chars.itemsize * (n + 1)))
+        # rows of the sampled positions are marked in the bitvector sampled;
+        # samples holds their positions, in row order
+        self._primary = 0
+        self._samples = array('Q')
+        self._sampled = bytearray((n + 1 + RANK_BLOCK) // 8)
+        for row, position in enumerate(suffixes):
+            if position == 0:
+                self._primary = row
+            else:
+                self._bwt[row] = codes[position - 1]
+            if position % SAMPLE == 0:
+                self._sampled[row >> 3] |= 1 << (row & 7)
+                self._samples.append(position)
+
+        # sampled_ranks[k]: number of marked rows before row k * RANK_BLOCK
+        self._sampled_ranks, marked, size = array('I'), 0, RANK_BLOCK // 8
+        for offset in range(0, len(self._sampled), size):
+            self._sampled_ranks.append(marked)
+            marked += int.from_bytes(self._sampled[offset : offset + size], 'little').bit_count()
+
+        # first[c]: number of rows whose first character is smaller than c
+        totals = {}
+        for code in codes:
+            totals[code] = totals.get(code, 0) + 1
+        self._first, running = {}, 1            # 1 for the sentinel row
+        for code in sorted(totals):
+            self._first[code] = running
+            running += totals[code]
+
+        # checkpoints[c][k]: occurrences of c in bwt[:k * STEP]
+        self._checkpoints = {code: array('I', [0]) for code in totals}
+        seen = dict.fromkeys(totals, 0)
+        for row in range(n + 1):
+            if row != self._primary:
+                seen[self._bwt[row]] += 1
+            if (row + 1) % STEP == 0:
+                for code, counts in self._checkpoints.items():
+                    counts.append(seen[code])
+
+    #####################################################
+    def len(self) -> int:
+        ''' returns the number of characters in the indexed text '''
+        return self._length
+
+    #####################################################
+    def _occ(self, code: int, row: int) -> int:
+        ''' returns the number of occurrences of code in bwt[:row] '''
+        block = row // STEP
+        count = self._checkpoints[code][block] + self._bwt[block * STEP : row].count(code)
+        if code == 0 and block * STEP <= self._primary < row:
+            count -= 1   # the sentinel's placeholder is not a real 0
+        return count
+
+    #####################################################
+    def _sample(self, row: int) -> int:
+        ''' returns the text position of a row if it is sampled, or -1,
+            ranking the row among the marked rows of the bitvector
+        '''
+        if not self._sampled[row >> 3] >> (row & 7) & 1:
+            return -1
+        block, size = row // RANK_BLOCK, RANK_BLOCK // 8
+        word = int.from_bytes(self._sampled[block * size : (block + 1) * size], 'little')
+        below = word & ((1 << (row - block * RANK_BLOCK)) - 1)
+        return self._samples[self._sampled_ranks[block] + below.bit_count()]
+
+    #####################################################
+    def _range(self, pattern: 'String | str') -> tuple:
+        ''' returns the [lo, hi) range of rows starting with pattern, found by
+            backward search one character at a time
+        '''
+        chars, start, end = buffer_of(pattern)
+        lo, hi = 0, len(self._bwt)
+        for i in range(end - 1, start - 1, -1):
+            code = chars[i]
+            if code not in self._first:
+                return 0, 0
+            lo = self._first[code] + self._occ(code, lo)
+            hi = self._first[code] + self._occ(code, hi)
+            if lo >= hi:
+                return 0, 0
+        return lo, hi
+
+    #####################################################
+    def count(self, pattern: 'String | str') -> int:
+        ''' returns the number of (possibly overlapping) occurrences of
+            pattern in the text, in O(m) steps
+
+        Args:
+            pattern: a String or str to look for
+
+        Returns:
+            an int count
+        '''
+        lo, hi = self._range(pattern)
+        return hi - lo
+
+    #####################################################
+    def locate(self, pattern: 'String | str') -> list:
+        ''' returns the positions of all (possibly overlapping) occurrences of
+            pattern in the text, in increasing order; each match walks back
+            to the nearest sampled row, at most SAMPLE steps
+
+        Args:
+            pattern: a String or str to look for
+
+        Returns:
+            a sorted list of int indices
+        '''
+        lo, hi = self._range(pattern)
+        positions = []
+        for row in range(lo, hi):
+            steps, sample = 0, self._sample(row)
+            while sample < 0:
+                code = self._bwt[row]          # LF mapping: step one character back
+                row  = self._first[code] + self._occ(code, row)
+                steps, sample = steps + 1, self._sample(row)
+            positions.append(sample + steps)
+        return sorted(positions)
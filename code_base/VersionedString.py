@@ -0,0 +1,231 @@
+'''Persistent (versioned) String: every edit makes a new version, and all the
+   versions stay available.
+
+Each version is a FrozenString whose rope (see Rope.py) shares every piece
+it did not change with the version it was made from: an edit rebuilds only
+the O(log n) rope nodes along the edited range, plus the inserted text
+(and at most Rope.LEAF_SIZE characters when small pieces are merged).  So
+thousands of revisions of a large document cost memory in proportion to the
+edits, not to the document.
+
+Versions form a tree: undo goes back to the parent version, and an edit
+made after an undo starts a new branch without forgetting the old one.
+Versions are numbered from 0 (the initial text) in order of creation.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from .String import String, FrozenString, frozen
+
+###############################################################################
+
+class VersionedString:
+    '''A String with a history of persistent, structurally shared versions.
+
+    Attributes:
+        version      : the (int) number of the current version
+        current      : the FrozenString of the current version
+        len          : returns the (int) number of characters of the current version
+        __str__, __eq__, __getitem__, substring: as for String, on the current version
+        __setitem__  : overwrites one character, making a new version
+        insert, delete, replace_range: edit as String does, making a new version
+        snapshot     : returns the number of the current version
+        at           : returns the FrozenString of any version
+        undo         : goes back to the version the current one was made from
+        checkout     : makes any version the current one
+        diff_versions: returns the edits turning one version into another
+    '''
+
+    __slots__ = ('version', 'current', '_texts', '_parents', '_edits', '_depths')
+
+    #####################################################
+    def __init__(self, text: 'String | str') -> None:
+        ''' initialization method for the VersionedString class
+
+        Args:
+            text: a String or str, the contents of version 0
+        '''
+        self.current  = frozen(text)
+        self.version  = 0
+        self._texts   = [self.current]   # per version: its FrozenString
+        self._parents = [None]           # per version: the version it was made from
+        self._edits   = [None]           # per version: (start, end, text) applied to the parent
+        self._depths  = [0]              # per version: number of edits from version 0
+
+    #####################################################
+    def len(self) -> int:
+        ''' returns the number of characters in the current version '''
+        return self.current.len()
+
+    #####################################################
+    def __str__(self) -> str:
+        ''' returns an str version of the current version '''
+        return str(self.current)
+
+    #####################################################
+    def __eq__(self, other) -> bool:
+        ''' compares the current version with a String, str or VersionedString '''
+        if isinstance(other, VersionedString):
+            other = other.current
+        return self.current.__eq__(other)
+
+    __hash__ = None   # changes with every edit, like a String being edited
+
+    #####################################################
+    def __getitem__(self, index: int) -> str:
+        ''' returns a character or slice of the current version '''
+        return self.current[index]
+
+    #####################################################
+    def substring(self, start: int, end: int) -> FrozenString:
+        ''' returns a substring of the current version, which stays unchanged '''
+        return self.current.substring(start, end)
+
+    #####################################################
+    def replace_range(self, start: int, end: int, text: 'String | str') -> int:
+        ''' replaces the characters in [start, end) by text (python slicing
+            rules for start and end), as a new version; the old version is
+            left unchanged and shares all the untouched pieces
+
+        Args:
+            start: an int index of the first character to replace
+            end:   an int index one past the last character to replace
+            text:  a String or str to put in their place
+
+        Returns:
+            the int number of the new (now current) version
+        '''
+        start, end, _ = slice(start, end).indices(self.len())
+        end  = max(start, end)
+        text = frozen(text)
+        # a fresh String over the current rope: editing it rebuilds only the
+        # nodes on the path to the edit, as rope nodes are never modified
+        edited = String._from_rope(self.current._as_rope())
+        edited.replace_range(start, end, text)
+
+        self._texts.append(edited.freeze())
+        self._parents.append(self.version)
+        self._edits.append((start, end, text))
+        self._depths.append(self._depths[self.version] + 1)
+        self.checkout(len(self._texts) - 1)
+        return self.version
+
+    #####################################################
+    def insert(self, index: int, text: 'String | str') -> int:
+        ''' inserts text before position index (like list.insert), as a new
+            version; returns the number of the new version
+        '''
+        return self.replace_range(index, index, text)
+
+    #####################################################
+    def delete(self, start: int, end: int) -> int:
+        ''' removes the characters in [start, end), as a new version; returns
+            the number of the new version
+        '''
+        return self.replace_range(start, end, "")
+
+    #####################################################
+    def __setitem__(self, index: int, char: str) -> None:
+        ''' overrides the __setitem__ special method: overwrites one character,
+            as a new version
+
+        Raises:
+            IndexError: if the index value is invalid relative to String length
+            ValueError: if char is not exactly one character long
+        '''
+        if index < 0: index += self.len()
+        if not 0 <= index < self.len():
+            raise IndexError("Index value invalid relative to string length")
+        if len(char) != 1:
+            raise ValueError("Only a single character can be assigned")
+        self.replace_range(index, index + 1, char)
+
+    #####################################################
+    def snapshot(self) -> int:
+        ''' returns the number of the current version, which can later be
+            passed to at, checkout or diff_versions; as versions are never
+            changed, taking a snapshot costs nothing
+        '''
+        return self.version
+
+    #####################################################
+    def at(self, version: int) -> FrozenString:
+        ''' returns the FrozenString of a version, without making it current
+
+        Raises:
+            IndexError: if there is no such version
+        '''
+        if not 0 <= version < len(self._texts):
+            raise IndexError("No such version")
+        return self._texts[version]
+
+    #####################################################
+    def checkout(self, version: int) -> FrozenString:
+        ''' makes a version the current one; later edits branch from it
+
+        Returns:
+            the FrozenString of that version
+
+        Raises:
+            IndexError: if there is no such version
+        '''
+        self.current = self.at(version)
+        self.version = version
+        return self.current
+
+    #####################################################
+    def undo(self, steps: int = 1) -> int:
+        ''' goes back steps edits, to an earlier version (which becomes
+            current); the undone versions remain available
+
+        Returns:
+            the int number of the now current version
+
+        Raises:
+            ValueError: if there are fewer than steps edits to undo
+        '''
+        if steps > self._depths[self.version]:
+            raise ValueError("Nothing left to undo")
+        version = self.version
+        for _ in range(steps):
+            version = self._parents[version]
+        self.checkout(version)
+        return version
+
+    #####################################################
+    def diff_versions(self, old: int, new: int) -> list:
+        ''' returns the edits turning version old into version new, read off
+            the version tree (up from old to the closest common version, then
+            down to new) rather than by comparing the texts
+
+        Args:
+            old: an int version number
+            new: an int version number
+
+        Returns:
+            a list of (start, end, text) tuples, each meaning "replace the
+            characters in [start, end) by the FrozenString text", to be
+            applied in order
+
+        Raises:
+            IndexError: if either version does not exist
+        '''
+        self.at(old); self.at(new)
+        undone, redone = [], []
+        while old != new:
+            if self._depths[old] >= self._depths[new]:
+                # undo the edit that made old: put back what it replaced
+                start, end, text = self._edits[old]
+                parent = self._parents[old]
+                undone.append((start, start + text.len(), self._texts[parent].substring(start, end)))
+                old = parent
+            else:
+                redone.append(self._edits[new])
+                new = self._parents[new]
+        return undone + redone[::-1]
+
+    #####################################################
+    def __repr__(self) -> str:
+        return f'VersionedString({str(self.current)!r}, version = {self.version})'
@@ -0,0 +1,256 @@
+'''Helpers for the compact code-point buffers used by String and friends.
+
+A buffer is an array.array of code points using the narrowest width able to
+hold its largest code point, much like CPython's own str (PEP 393).
+
+The search helpers at the end (find, rfind, finditer, count) run str.find
+and str.count over bounded windows decoded from any kind of buffer, so that
+searching is done in C without decoding the whole text at once;
+overlaps_itself tells whether occurrences of a needle can overlap, which
+decides whether counting them per window is safe.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from array import array
+import sys
+
+# Typecodes used for the compact code-point buffer, from narrowest to widest:
+# 1 byte (latin-1), 2 bytes (BMP) or 4 bytes (everything else).
+UCS1 = 'B'
+UCS2 = 'H'
+UCS4 = 'I' if array('I').itemsize == 4 else 'L'
+WIDTHS = (UCS1, UCS2, UCS4)
+
+# native-endian codecs matching the in-memory layout of the 2- and 4-byte arrays
+UTF16 = 'utf-16-le' if sys.byteorder == 'little' else 'utf-16-be'
+UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
+
+def typecode_for(code: int) -> str:
+    ''' returns the narrowest buffer typecode able to hold the given code point '''
+    if code < 0x100:   return UCS1
+    if code < 0x10000: return UCS2
+    return UCS4
+
+
+def encode(string: str) -> array:
+    ''' packs an str into a compact array of code points, picking the
+        narrowest width able to hold every character in the str
+
+    Args:
+        string: the str to pack
+
+    Returns:
+        an array.array of code points (typecode 'B', 'H' or 4-byte)
+    '''
+    if len(string) == 0:
+        return array(UCS1)
+    typecode = typecode_for(ord(max(string)))
+    chars = array(typecode)
+    if typecode == UCS1:
+        chars.frombytes(string.encode('latin-1'))
+    elif typecode == UCS2:
+        chars.frombytes(string.encode(UTF16, 'surrogatepass'))
+    else:
+        # astral characters take two UTF-16 units, so go through UTF-32 here
+        chars.frombytes(string.encode(UTF32, 'surrogatepass'))
+    return chars
+
+
+def decode(chars: array, start: int = 0, end: int = None) -> str:
+    ''' unpacks (a window of) an array of code points, as built by encode,
+        back into an str
+
+    Args:
+        chars: an array.array of code points (or a MappedBuffer)
+        start: index of the first code point to decode
+        end:   index one past the last code point to decode (default: the end)
+
+    Returns:
+        the str with those code points
+    '''
+    if end is None: end = len(chars)
+    if not isinstance(chars, array):
+        return chars.decode(start, end)   # file-backed buffers decode themselves
+    data = memoryview(chars)[start:end].tobytes()  # one copy, even for a window
+    if chars.typecode == UCS1:
+        return data.decode('latin-1')
+    if chars.typecode == UCS2:
+        string = data.decode(UTF16, 'surrogatepass')
+        # a high/low surrogate pair stored as two separate code points gets
+        # merged by the UTF-16 codec, in which case fall back to chr()
+        if len(string) != end - start:
+            string = "".join(map(chr, chars[start:end]))
+        return string
+    return data.decode(UTF32, 'surrogatepass')
+
+
+def widen(chars: array, typecode: str) -> array:
+    ''' returns chars itself if it is already at least as wide as typecode,
+        otherwise a copy of chars using the wider typecode
+    '''
+    if WIDTHS.index(chars.typecode) >= WIDTHS.index(typecode):
+        return chars
+    return array(typecode, chars)
+
+
+def copy(chars: array, start: int, end: int) -> array:
+    ''' returns a new array holding code points [start, end) of chars (an
+        array, or a MappedBuffer, whose slices are arrays too)
+    '''
+    return chars[start:end]
+
+
+def join(parts, typecode: str) -> array:
+    ''' returns a new array of the given typecode holding the code points of
+        every array in parts, one after the other, widening narrower parts
+    '''
+    chars = array(typecode)
+    for part in parts:
+        chars.extend(part if part.typecode == typecode else array(typecode, part))
+    return chars
+
+
+def buffer_of(text: 'String | str') -> tuple:
+    ''' returns (chars, start, end) locating the code points of a String (or
+        of a freshly encoded str) inside its buffer
+    '''
+    if isinstance(text, str):
+        chars = encode(text)
+        return chars, 0, len(chars)
+    return text._buffer()
+
+
+def adjust_indices(start: int, end: int, length: int) -> tuple:
+    ''' normalizes optional start/end arguments the way str.find does, except
+        that start may be left past end (meaning nothing can be found)
+    '''
+    if end is None or end > length: end = length
+    elif end < 0: end = max(end + length, 0)
+    if start < 0: start = max(start + length, 0)
+    return start, end
+
+
+# characters decoded by the first window of a search, doubling with each
+# further window up to WINDOW, so that a match close to the start costs
+# little while a long scan decodes large windows
+FIRST_WINDOW = 256
+WINDOW = 1 << 16
+
+
+def _window_sizes(width: int):
+    ''' generator of the growing sizes of the windows searched for a needle
+        of width characters (each at least twice the width)
+    '''
+    size, largest = max(FIRST_WINDOW, 2 * width), max(WINDOW, 2 * width)
+    while True:
+        yield size
+        size = min(size * 2, largest)
+
+
+def find(chars, needle: str, start: int, end: int) -> int:
+    ''' returns the lowest index i in [start, end - len(needle)] at which
+        chars holds needle, or -1, running str.find over windows decoded one
+        after the other (consecutive windows overlap by len(needle) - 1)
+
+    Args:
+        chars:  an array.array of code points (or a MappedBuffer or
+                CompressedBuffer)
+        needle: the str to search for
+        start:  index of the first code point searched
+        end:    index one past the last code point searched
+
+    Returns:
+        an int index into chars, or -1
+    '''
+    width, sizes, position = len(needle), _window_sizes(len(needle)), start
+    while position + width <= end:
+        stop  = min(position + next(sizes), end)
+        found = decode(chars, position, stop).find(needle)
+        if found >= 0:
+            return position + found
+        if stop == end:
+            break
+        position = stop - width + 1
+    return -1
+
+
+def rfind(chars, needle: str, start: int, end: int) -> int:
+    ''' returns the highest index i in [start, end - len(needle)] at which
+        chars holds needle, or -1, like find but searching windows from the
+        end backwards
+    '''
+    width, sizes, stop = len(needle), _window_sizes(len(needle)), end
+    while stop - width >= start:
+        position = max(stop - next(sizes), start)
+        found = decode(chars, position, stop).rfind(needle)
+        if found >= 0:
+            return position + found
+        if position == start:
+            break
+        stop = position + width - 1
+    return -1
+
+
+def finditer(chars, needle: str, start: int, end: int):
+    ''' generator over the indices of the non-overlapping occurrences of a
+        (non-empty) needle in chars[start:end], from left to right, decoding
+        each window once whatever the number of matches in it
+    '''
+    width, sizes, position = len(needle), _window_sizes(len(needle)), start
+    while position + width <= end:
+        stop   = min(position + next(sizes), end)
+        window = decode(chars, position, stop)
+        resume = len(window) - width + 1     # where the next window starts
+        found  = window.find(needle)
+        while found >= 0:
+            yield position + found
+            resume = found + width
+            found  = window.find(needle, resume)
+        if stop == end:
+            return
+        position += resume
+
+
+def overlaps_itself(needle: str) -> bool:
+    ''' returns True if two occurrences of needle can overlap, i.e. if a
+        proper prefix of needle is also a suffix of it (found with the KMP
+        failure function, in time linear in the needle length)
+
+    Args:
+        needle: the str to check
+
+    Returns:
+        a bool
+    '''
+    border = [0] * len(needle)     # border[i]: longest such prefix of needle[:i + 1]
+    k = 0
+    for i in range(1, len(needle)):
+        while k > 0 and needle[i] != needle[k]:
+            k = border[k - 1]
+        if needle[i] == needle[k]:
+            k += 1
+        border[i] = k
+    return k > 0
+
+
+def count(chars, needle: str, start: int, end: int) -> int:
+    ''' returns the number of non-overlapping occurrences of a (non-empty)
+        needle in chars[start:end], as str.count, using str.count on each
+        window when occurrences of the needle cannot overlap each other
+    '''
+    if overlaps_itself(needle):
+        return sum(1 for _ in finditer(chars, needle, start, end))
+    width, sizes, position, total = len(needle), _window_sizes(len(needle)), start, 0
+    while position + width <= end:
+        stop   = min(position + next(sizes), end)
+        window = decode(chars, position, stop)
+        total += window.count(needle)
+        if stop == end:
+            break
+        last = window.rfind(needle)
+        position += last + width if last >= 0 else len(window) - width + 1
+    return total
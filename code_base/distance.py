@@ -0,0 +1,432 @@
+'''Edit distance, longest common subsequence and diff between Strings.
+
+    levenshtein : edit distance (insertions, deletions, substitutions), by
+                  a banded search over diagonals when it is small, by Myers'
+                  bit-parallel algorithm otherwise; with an optional cutoff
+    lcs_length  : length of the longest common subsequence, bit-parallel
+    diff        : Myers' O((N + M) D) diff in linear space, as difflib-style
+                  opcodes, by character or by line
+
+The bit-parallel algorithms keep one bit per character of the shorter text
+in a Python int, so each character of the longer text costs a handful of
+integer operations on (m / 64)-word numbers rather than m steps of Python
+code.  The banded and diff searches skip each run of equal characters with
+slice comparisons, which run in C, and all three functions first strip the
+common prefix and suffix: for near-duplicates that is most of the work.
+Where the diff search would take too long (texts with many differences), it
+falls back to splitting the texts at optimal points found by bit-parallel
+LCS passes (Hirschberg), so the diff stays minimal at O(N * M / 64) cost.
+
+The functions take Strings or strs; diff also takes lists of lines.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+import itertools
+import math
+import operator
+
+from .codepoints import buffer_of, copy
+
+# width of the first band of diagonals tried by levenshtein; a band costs
+# about width ** 2 steps, so once that exceeds the cost of a bit-parallel
+# pass the bit-parallel algorithm is used instead
+BAND_START = 16
+# the diff search from both ends gives up on a part of the texts once it has
+# taken this many times the steps of a bit-parallel LCS pass over it, and
+# splits it at an optimal point found by bit-parallel LCS instead
+SEARCH_LIMIT = 1
+# bits of a row that one step of Python code processes, roughly, in a
+# bit-parallel pass (the int operations run in C, on 64-bit words)
+ROW_BITS_PER_STEP = 1024
+
+###############################################################################
+
+def _sequence(text) -> 'array | list':
+    ''' returns the code points of a String or str as an array (lists and
+        tuples, e.g. of lines, are returned as they are)
+    '''
+    if isinstance(text, (list, tuple)):
+        return text
+    chars, start, end = buffer_of(text)
+    return copy(chars, start, end)
+
+def _match_forward(a, i: int, b, j: int, limit: int = None) -> int:
+    ''' returns the length of the common run of a[i:] and b[j:] (at most
+        limit), comparing slices of doubling length (compared in C) and then
+        bisecting
+    '''
+    limit = min(len(a) - i, len(b) - j, len(a) if limit is None else limit)
+    if limit == 0 or a[i] != b[j]:
+        return 0
+    low, step = 1, 1        # a[i:i + low] == b[j:j + low] is known
+    while low < limit:
+        high = min(low + step, limit)
+        if a[i + low : i + high] != b[j + low : j + high]:
+            limit = high - 1   # the mismatch lies in [low, high)
+            break
+        low, step = high, step * 2
+    while low < limit:      # bisect the mismatch in [low, limit]
+        middle = (low + limit + 1) // 2
+        if a[i + low : i + middle] == b[j + low : j + middle]:
+            low = middle
+        else:
+            limit = middle - 1
+    return low
+
+def _match_backward(a, i: int, b, j: int, limit: int = None) -> int:
+    ''' returns the length of the common run ending just before a[i] and b[j]
+        (at most limit)
+    '''
+    limit = min(i, j, i if limit is None else limit)
+    if limit == 0 or a[i - 1] != b[j - 1]:
+        return 0
+    low, step = 1, 1
+    while low < limit:
+        high = min(low + step, limit)
+        if a[i - high : i - low] != b[j - high : j - low]:
+            limit = high - 1
+            break
+        low, step = high, step * 2
+    while low < limit:
+        middle = (low + limit + 1) // 2
+        if a[i - middle : i - low] == b[j - middle : j - low]:
+            low = middle
+        else:
+            limit = middle - 1
+    return low
+
+def _trim(a, b) -> tuple:
+    ''' returns a and b without their common prefix and suffix '''
+    prefix = _match_forward(a, 0, b, 0)
+    suffix = _match_backward(a, len(a), b, len(b))
+    suffix = min(suffix, len(a) - prefix, len(b) - prefix)
+    return a[prefix : len(a) - suffix], b[prefix : len(b) - suffix]
+
+def _pass_cost(n: int, m: int) -> int:
+    ''' returns the rough cost, in steps of Python code, of a bit-parallel
+        pass of n characters over a row of m bits
+    '''
+    return n * (1 + m // ROW_BITS_PER_STEP)
+
+def _peq(pattern) -> dict:
+    ''' returns, per symbol of pattern, the int bit mask of its positions '''
+    peq = {}
+    bit = 1
+    for symbol in pattern:
+        peq[symbol] = peq.get(symbol, 0) | bit
+        bit <<= 1
+    return peq
+
+###############################################################################
+
+def _bit_parallel(a, b, max_distance: int) -> int:
+    ''' Myers' bit-parallel edit distance (in Hyyro's formulation), with a
+        as the pattern: bit i of VP/VN holds the vertical delta +1/-1 of row
+        i in the current column of the dynamic programming matrix
+    '''
+    m, n = len(a), len(b)
+    peq  = _peq(a)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    vp, vn, score = mask, 0, m
+    for j, symbol in enumerate(b, 1):
+        eq = peq.get(symbol, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | ~(xh | vp)
+        hn = vp & xh
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        if max_distance is not None and score - (n - j) > max_distance:
+            return max_distance + 1   # even matching the rest cannot help
+        hp = (hp << 1) | 1            # row 0 grows by one per column
+        hn <<= 1
+        vp = (hn | ~(xv | hp)) & mask
+        vn = hp & xv
+    return score
+
+def _diagonal(a, b, max_distance: int) -> int:
+    ''' edit distance restricted to the band of diagonals |j - i| <=
+        max_distance, by the algorithm of Landau and Vishkin: for e = 0, 1,
+        ... errors, the furthest row reachable on each diagonal, each run of
+        matches being skipped at once; len(a) <= len(b)
+    '''
+    m, n = len(a), len(b)
+    target = n - m              # the diagonal j - i of the end
+    previous = {}               # diagonal -> furthest row, with e - 1 errors
+    for e in range(max_distance + 1):
+        current = {}
+        for d in range(max(-e, -m), min(e, n) + 1):
+            if e == 0:
+                i = 0
+            else:
+                i = max(previous.get(d, -1) + 1,        # substitution
+                        previous.get(d - 1, -1),        # insertion
+                        previous.get(d + 1, -2) + 1)    # deletion
+                i = min(i, m, n - d)
+            if i < m and i + d < n:
+                i += _match_forward(a, i, b, i + d)
+            current[d] = i
+        if current.get(target, 0) >= m:
+            return e
+        previous = current
+    return max_distance + 1
+
+def levenshtein(a: 'String | str', b: 'String | str', max_distance: int = None) -> int:
+    ''' returns the Levenshtein (edit) distance between a and b: the fewest
+        single-character insertions, deletions and substitutions turning a
+        into b
+
+    Small distances are found by the banded algorithm of Landau and Vishkin,
+    in O(n + distance ** 2) steps (trying bands four times wider until the
+    distance fits, when no max_distance is given); once a band would cost
+    more than that, by Myers' bit-parallel algorithm in O(n * m / 64) word
+    operations.
+
+    Args:
+        a:            a String or str
+        b:            a String or str
+        max_distance: if given, stop as soon as the distance is known to be
+                      larger, and return max_distance + 1
+
+    Returns:
+        an int distance (at most max_distance + 1, when it is given)
+    '''
+    a, b = _trim(_sequence(a), _sequence(b))
+    if len(a) > len(b):
+        a, b = b, a
+    if max_distance is not None and len(b) - len(a) > max_distance:
+        return max_distance + 1
+    if len(a) == 0:
+        return len(b)
+    band = BAND_START
+    while True:
+        if max_distance is not None and band >= max_distance:
+            band = max_distance
+        if band * band > _pass_cost(len(b), len(a)):
+            return _bit_parallel(a, b, max_distance)
+        distance = _diagonal(a, b, band)
+        if distance <= band or band == max_distance:
+            return distance
+        band *= 4
+
+def lcs_length(a: 'String | str', b: 'String | str') -> int:
+    ''' returns the length of the longest common subsequence of a and b:
+        from their diff when they differ little, otherwise by the
+        bit-parallel algorithm of Allison and Dix in O(n * m / 64) word
+        operations
+
+    Args:
+        a: a String or str
+        b: a String or str
+
+    Returns:
+        an int length
+    '''
+    a, b = _sequence(a), _sequence(b)
+    common = len(a)
+    a, b = _trim(a, b)
+    common -= len(a)                # the trimmed prefix and suffix match
+    if len(a) > len(b):
+        a, b = b, a
+    if len(a) == 0:
+        return common
+    if _middle_snake(a, b, 0, len(a), 0, len(b), _search_limit(len(a), len(b))) is not None:
+        # few differences: the diff finds them faster than a bit-parallel pass
+        return common + sum(i2 - i1 for tag, i1, i2, _, _ in _script(a, b) if tag == 'equal')
+    return common + len(a) - _lcs_row(a, b).bit_count()
+
+def _lcs_row(pattern, text) -> int:
+    ''' returns the last row of the Allison-Dix LCS computation of pattern
+        against text: a zero bit i marks a match of pattern[i], and the LCS of
+        pattern[:i] and text is the number of zero bits below bit i
+    '''
+    peq  = _peq(pattern)
+    mask = (1 << len(pattern)) - 1
+    row  = mask
+    for symbol in text:
+        matched = row & peq.get(symbol, 0)
+        row = ((row + matched) | (row - matched)) & mask
+    return row
+
+# bytes.translate table turning the digits of a binary number into 1 for a
+# '0' (a matched row) and 0 for a '1'
+_ZERO_BITS = bytes(int(code == ord('0')) for code in range(256))
+
+def _matched_before(row: int, length: int) -> list:
+    ''' returns, for every i in 0 ... length, the number of zero bits of row
+        below bit i
+    '''
+    digits = format(row, 'b').zfill(length)[::-1].encode('ascii')
+    return [0, *itertools.accumulate(digits.translate(_ZERO_BITS))]
+
+def _lcs_split(a, b, a0: int, a1: int, b0: int, b1: int) -> tuple:
+    ''' splits the LCS problem of a[a0:a1] and b[b0:b1] in the middle of a,
+        at the point of b where the LCSs of the two halves add up to the
+        most (Hirschberg), the rows being computed bit-parallel
+
+    Returns:
+        (x, y): the split point, in absolute indices of a and b
+    '''
+    middle = (a0 + a1) // 2
+    head, tail = b[b0:b1], b[b1 - 1 : b0 - 1 if b0 else None : -1]
+    before = _matched_before(_lcs_row(head, a[a0:middle]), b1 - b0)
+    after  = _matched_before(_lcs_row(tail, a[a1 - 1 : middle - 1 if middle else None : -1]), b1 - b0)
+    totals = list(map(operator.add, before, reversed(after)))
+    return middle, b0 + totals.index(max(totals))
+
+###############################################################################
+
+def _search_limit(n: int, m: int) -> int:
+    ''' returns the number of differences after which the search from both
+        ends (about d ** 2 steps) gives way to a bit-parallel split
+    '''
+    return math.isqrt(SEARCH_LIMIT * _pass_cost(n, m)) + 1
+
+def _middle_snake(a, b, a0: int, a1: int, b0: int, b1: int, limit: int) -> tuple:
+    ''' finds where the shortest edit script of a[a0:a1] into b[b0:b1] can
+        be split in two, running the greedy search of Myers from both ends
+        until the two searches overlap (a and b must differ at both ends)
+
+    Returns:
+        (x, y): the split point, in absolute indices of a and b, or None if
+        it takes more than limit steps (differences) from each end
+    '''
+    n, m   = a1 - a0, b1 - b0
+    delta  = n - m
+    odd    = delta & 1
+    offset = (n + m + 1) // 2 + 1
+    # furthest x reached on each diagonal k = x - y (at index k + offset),
+    # from the start and (in reversed coordinates) from the end
+    forward, backward = [-1] * (2 * offset + 2), [-1] * (2 * offset + 2)
+    forward[offset + 1] = backward[offset + 1] = 0
+    # diagonals that have left the grid are not searched any further
+    f_low = f_high = b_low = b_high = 0
+    for d in range(min(offset, limit)):
+        for k in range(-d + f_low, d + 1 - f_high, 2):
+            if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            if x < n and y < m and a[a0 + x] == b[b0 + y]:
+                run = _match_forward(a, a0 + x, b, b0 + y, min(n - x, m - y))
+                x, y = x + run, y + run
+            forward[offset + k] = x
+            if x > n:
+                f_high += 2
+            elif y > m:
+                f_low += 2
+            elif odd and 0 <= offset + delta - k < len(backward):
+                reverse = backward[offset + delta - k]
+                if reverse != -1 and x >= n - reverse:
+                    return a0 + x, b0 + y
+        for k in range(-d + b_low, d + 1 - b_high, 2):
+            if k == -d or (k != d and backward[offset + k - 1] < backward[offset + k + 1]):
+                x = backward[offset + k + 1]
+            else:
+                x = backward[offset + k - 1] + 1
+            y = x - k
+            if x < n and y < m and a[a1 - x - 1] == b[b1 - y - 1]:
+                run = _match_backward(a, a1 - x, b, b1 - y, min(n - x, m - y))
+                x, y = x + run, y + run
+            backward[offset + k] = x
+            if x > n:
+                b_high += 2
+            elif y > m:
+                b_low += 2
+            elif not odd and 0 <= offset + delta - k < len(forward):
+                reached = forward[offset + delta - k]
+                if reached != -1 and reached >= n - x:
+                    return a0 + reached, b0 + reached - (delta - k)
+    return None
+
+def _script(a, b) -> list:
+    ''' returns the shortest edit script of a into b as a list of
+        ('equal' | 'delete' | 'insert', i1, i2, j1, j2) tuples in order
+    '''
+    script = []
+    stack  = [('split', 0, len(a), 0, len(b))]
+    while stack:
+        tag, a0, a1, b0, b1 = stack.pop()
+        if tag == 'equal':
+            script.append((tag, a0, a1, b0, b1))
+            continue
+        # common ends first: the split point of what is left then has fewer
+        # edits on each side than the whole, so every split makes progress
+        prefix = _match_forward(a, a0, b, b0, min(a1 - a0, b1 - b0))
+        suffix = _match_backward(a, a1, b, b1, min(a1 - a0, b1 - b0) - prefix)
+        if suffix:
+            stack.append(('equal', a1 - suffix, a1, b1 - suffix, b1))
+            a1, b1 = a1 - suffix, b1 - suffix
+        if prefix:
+            script.append(('equal', a0, a0 + prefix, b0, b0 + prefix))
+            a0, b0 = a0 + prefix, b0 + prefix
+        if a1 - a0 <= 1 or b1 - b0 == 0:
+            # a single character of a left: keep it if b has it
+            found = b[b0:b1].index(a[a0]) if a0 < a1 and a[a0] in b[b0:b1] else -1
+            if found < 0:
+                if a0 < a1: script.append(('delete', a0, a1, b0, b0))
+                if b0 < b1: script.append(('insert', a1, a1, b0, b1))
+            else:
+                if found: script.append(('insert', a0, a0, b0, b0 + found))
+                script.append(('equal', a0, a1, b0 + found, b0 + found + 1))
+                if b0 + found + 1 < b1: script.append(('insert', a1, a1, b0 + found + 1, b1))
+            continue
+        limit = _search_limit(a1 - a0, b1 - b0)
+        split = _middle_snake(a, b, a0, a1, b0, b1, limit) if b0 < b1 else None
+        x, y = split or _lcs_split(a, b, a0, a1, b0, b1)
+        # popped in order: the part before the split, then the part after
+        stack.append(('split', x, a1, y, b1))
+        stack.append(('split', a0, x, b0, y))
+    return script
+
+def diff(a, b, lines: bool = False) -> list:
+    ''' returns the differences between a and b as difflib-style opcodes
+
+    Args:
+        a:     a String or str (or a list of lines)
+        b:     a String or str (or a list of lines)
+        lines: True to compare line by line (each line keeping its '\\n')
+               rather than character by character
+
+    Returns:
+        a list of (tag, i1, i2, j1, j2) tuples, tag being 'equal',
+        'replace', 'delete' or 'insert', meaning that a[i1:i2] is equal to,
+        or is to be replaced by, b[j1:j2]; indices count lines when lines
+        is True, characters otherwise
+    '''
+    if lines:
+        a = a if isinstance(a, (list, tuple)) else str(a).splitlines(keepends = True)
+        b = b if isinstance(b, (list, tuple)) else str(b).splitlines(keepends = True)
+    a, b = _sequence(a), _sequence(b)
+
+    # strip the common ends before the search, which then only sees the middle
+    prefix = _match_forward(a, 0, b, 0)
+    suffix = min(_match_backward(a, len(a), b, len(b)), len(a) - prefix, len(b) - prefix)
+    middle = _script(a[prefix : len(a) - suffix], b[prefix : len(b) - suffix])
+
+    opcodes = []
+    if prefix:
+        opcodes.append(['equal', 0, prefix, 0, prefix])
+    for tag, i1, i2, j1, j2 in middle:
+        i1, i2, j1, j2 = i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix
+        if opcodes and (opcodes[-1][0] == 'equal') == (tag == 'equal'):
+            # merge with the previous opcode: equal runs, or edits in a row
+            previous = opcodes[-1]
+            previous[2], previous[4] = i2, j2
+            if tag != 'equal' and previous[0] != tag:
+                previous[0] = 'replace'
+        else:
+            opcodes.append([tag, i1, i2, j1, j2])
+    if suffix:
+        if opcodes and opcodes[-1][0] == 'equal':
+            opcodes[-1][2] += suffix; opcodes[-1][4] += suffix
+        else:
+            opcodes.append(['equal', len(a) - suffix, len(a), len(b) - suffix, len(b)])
+    return [tuple(opcode) for opcode in opcodes]
@@ -0,0 +1,355 @@
+'''Opt-in instrumentation of String: calls, time, characters copied and
+   objects allocated, per String method (and optionally per call site).
+
+Nothing is instrumented until a Recorder is started, and nothing is left
+behind once the last one stops: starting swaps every public String method
+(and the internal helpers that copy or allocate) for a counting wrapper, and
+stopping puts the original functions back, so disabled instrumentation costs
+nothing at all.  The helpers of codepoints.py that copy code points are
+wrapped in every module of the package that uses them, so that the copies
+made by distance.py, RollingHash.py, Pattern.py, splitting.py and the like
+are counted too.
+
+    with instrument.recording(sites = True) as recorder:
+        run_workload()
+    print(recorder.report(by_site = True))
+
+For each call of a String method the recorder adds up:
+
+    calls   : number of calls
+    seconds : elapsed time inside the method
+    copied  : code points (or characters) copied into new buffers or strs
+    buffers : new code-point arrays or strs allocated to hold them
+    strings : new String objects created
+
+Work done by a String method called from another one (e.g. the String built
+from an str operand of __add__) is charged to the outer call, so the totals
+add up and each call site is charged for everything it caused.  A method
+returning a generator (such as split) is also charged for the work done as
+the generator is iterated, and is recorded once the iteration ends.  Copies
+made by internal helpers called from outside any String method (e.g. by
+Pattern flattening a rope) are listed under the name of the helper.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from contextlib import contextmanager
+import functools
+import sys
+import threading
+import time
+import types
+
+from . import codepoints
+from .String import String, FrozenString
+
+# statistics kept per method, in order
+FIELDS = ('calls', 'seconds', 'copied', 'buffers', 'strings')
+
+# helpers of codepoints.py that copy characters: their result is a new buffer
+_COPIES = ('encode', 'decode', 'copy', 'join')
+
+_active = []                # Recorders currently collecting
+_saved  = {}                # (owner, name) -> original, while installed
+_local  = threading.local() # per thread: the outermost String call running
+
+###############################################################################
+
+class Recorder:
+    '''Aggregated statistics of the String methods called while it is active.
+
+    Attributes:
+        sites  : True to also break the statistics down by call site
+        every  : seconds between periodic dumps (None for no dumps)
+        stream : where periodic dumps are written (default sys.stderr)
+        stats  : returns the statistics as a dict of dicts
+        report : returns the statistics as a table, in an str
+        dump   : writes the report to a stream
+        reset  : forgets everything recorded so far
+    '''
+
+    __slots__ = ('sites', 'every', 'stream', '_totals', '_next_dump')
+
+    #####################################################
+    def __init__(self, sites: bool = False, every: float = None, stream = None) -> None:
+        ''' initialization method for the Recorder class
+
+        Args:
+            sites:  True to also record the file and line each call came from
+            every:  if given, dump the report at most every this many seconds
+                    (checked whenever a String method returns)
+            stream: a writable text stream for the periodic dumps
+        '''
+        self.sites  = sites
+        self.every  = every
+        self.stream = stream
+        self.reset()
+
+    #####################################################
+    def reset(self) -> None:
+        ''' forgets all the statistics recorded so far '''
+        self._totals = {}   # (method, site or None) -> [calls, seconds, ...]
+        self._next_dump = time.perf_counter() + (self.every or 0)
+
+    #####################################################
+    def _add(self, method: str, site: str, seconds: float, tally: list, calls: int = 1) -> None:
+        ''' adds one call of method (or, with calls = 0, more of the cost of a
+            call already counted) to the statistics, then dumps them if a
+            periodic dump is due
+        '''
+        key = (method, site if self.sites else None)
+        totals = self._totals.get(key)
+        if totals is None:
+            totals = self._totals[key] = [0, 0.0, 0, 0, 0]
+        totals[0] += calls
+        totals[1] += seconds
+        totals[2] += tally[0]
+        totals[3] += tally[1]
+        totals[4] += tally[2]
+        if self.every is not None and time.perf_counter() >= self._next_dump:
+            self.dump()
+
+    #####################################################
+    def stats(self, by_site: bool = False) -> dict:
+        ''' returns the statistics recorded so far
+
+        Args:
+            by_site: True to key them by (method, site) rather than by method
+                     (sites are only known if the Recorder was made with sites)
+
+        Returns:
+            a dict mapping each method name (or (method, site) pair) to a dict
+            of its FIELDS
+        '''
+        merged = {}
+        for (method, site), totals in self._totals.items():
+            key = (method, site) if by_site else method
+            into = merged.setdefault(key, [0, 0.0, 0, 0, 0])
+            for i, value in enumerate(totals):
+                into[i] += value
+        return {key: dict(zip(FIELDS, totals)) for key, totals in merged.items()}
+
+    #####################################################
+    def report(self, sort: str = 'copied', limit: int = None, by_site: bool = False) -> str:
+        ''' returns the statistics as a table, one line per method (or per
+            method and call site), largest first
+
+        Args:
+            sort:    the field to sort by, one of FIELDS
+            limit:   the maximum number of lines (default: all of them)
+            by_site: True for one line per (method, site) pair
+
+        Returns:
+            an str with a header line and one line per entry
+        '''
+        stats = self.stats(by_site)
+        keys  = sorted(stats, key = lambda key: stats[key][sort], reverse = True)[:limit]
+        lines = [f"{'method':<40} {'calls':>9} {'seconds':>9} {'copied':>11} "
+                 f"{'buffers':>8} {'strings':>8}"]
+        for key in keys:
+            row  = stats[key]
+            name = f"{key[0]} @ {key[1]}" if by_site else key
+            lines.append(f"{name:<40} {row['calls']:>9} {row['seconds']:>9.4f} "
+                         f"{row['copied']:>11} {row['buffers']:>8} {row['strings']:>8}")
+        return "\n".join(lines)
+
+    #####################################################
+    def dump(self, stream = None) -> None:
+        ''' writes the report (by site, if sites are recorded) to stream, by
+            default the Recorder's own stream or sys.stderr
+        '''
+        stream = stream or self.stream or sys.stderr
+        stream.write(self.report(by_site = self.sites) + "\n\n")
+        stream.flush()
+        self._next_dump = time.perf_counter() + (self.every or 0)
+
+###############################################################################
+
+def _record(method: str, site: str, seconds: float, tally: list, calls: int = 1) -> None:
+    for recorder in _active:
+        recorder._add(method, site, seconds, tally, calls)
+
+def _charge(name: str, copied: int, buffers: int, strings: int) -> None:
+    ''' adds the cost of one helper call to the String call running in this
+        thread, or records it under the helper's name if there is none
+    '''
+    tally = getattr(_local, 'tally', None)
+    if tally is None:
+        _record(name, None, 0.0, [copied, buffers, strings])
+    else:
+        tally[0] += copied
+        tally[1] += buffers
+        tally[2] += strings
+
+def _measured(name: str, function):
+    ''' returns a wrapper of the String method function that records its
+        calls, unless it is called from inside another String method
+    '''
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if getattr(_local, 'tally', None) is not None:
+            return function(*args, **kwargs)   # charged to the outer call
+        site = None
+        if any(recorder.sites for recorder in _active):
+            caller = sys._getframe(1)
+            site = f"{caller.f_code.co_filename}:{caller.f_lineno}"
+        _local.tally = tally = [0, 0, 0]
+        start = time.perf_counter()
+        try:
+            returned = function(*args, **kwargs)
+            if isinstance(returned, types.GeneratorType):
+                returned = _iterated(name, site, returned)
+            return returned
+        finally:
+            seconds = time.perf_counter() - start
+            _local.tally = None
+            _record(name, site, seconds, tally)
+    return wrapper
+
+def _iterated(name: str, site: str, generator):
+    ''' generator passing on the items of a generator returned by a String
+        method, charging the time and copies of each step to that method
+        (without counting another call) when the iteration ends or is
+        abandoned
+    '''
+    tally, seconds = [0, 0, 0], 0.0
+    try:
+        while True:
+            outer, _local.tally = getattr(_local, 'tally', None), tally
+            start = time.perf_counter()
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            finally:
+                seconds += time.perf_counter() - start
+                _local.tally = outer
+            yield item
+    finally:
+        generator.close()
+        _record(name, site, seconds, tally, calls = 0)
+
+def _counted(name: str, function, cost):
+    ''' returns a wrapper of the helper function that charges cost(args,
+        result), a (copied, buffers, strings) tuple, to the current call
+    '''
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        result = function(*args, **kwargs)
+        _charge(name, *cost(args, result))
+        return result
+    return wrapper
+
+def _copy_cost(args, result) -> tuple:
+    return len(result), 1, 0
+
+def _widen_cost(args, result) -> tuple:
+    return (0, 0, 0) if result is args[0] else (len(result), 1, 0)
+
+def _string_cost(args, result) -> tuple:
+    return 0, 0, 1
+
+def _rope_cost(args, result) -> tuple:
+    # a leaf is wrapped by _from_array, which is counted already
+    return 0, 0, int(result._rope is not None)
+
+###############################################################################
+
+def _wrap(owner, name: str, wrap) -> None:
+    ''' replaces owner.name (a function, classmethod or staticmethod) by
+        wrap(name, function), remembering the original
+    '''
+    original = owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name)
+    _saved.setdefault((owner, name), original)
+    if isinstance(original, (classmethod, staticmethod)):
+        wrapped = type(original)(wrap(name, original.__func__))
+    else:
+        wrapped = wrap(name, original)
+    setattr(owner, name, wrapped)
+
+def _public_methods(cls: type) -> list:
+    ''' returns the names of the public and special methods defined by cls '''
+    return [name for name, attribute in cls.__dict__.items()
+            if isinstance(attribute, (classmethod, staticmethod)) or callable(attribute)
+            if not name.startswith('_') or
+               (name.startswith('__') and name not in ('__new__', '__init_subclass__'))]
+
+def _modules_using(function) -> list:
+    ''' returns the modules of this package (codepoints included) that have
+        function as a global, under its own name
+    '''
+    package = __name__.rpartition('.')[0]
+    return [module for module_name, module in list(sys.modules.items())
+            if module is not None and module_name.startswith(package + '.')
+            if getattr(module, function.__name__, None) is function]
+
+def _install() -> None:
+    ''' swaps the counting wrappers into String and the helpers it uses '''
+    costs = dict.fromkeys(_COPIES, _copy_cost)
+    costs['widen'] = _widen_cost
+    for name, cost in costs.items():
+        for module in _modules_using(getattr(codepoints, name)):
+            _wrap(module, name, lambda name, f, cost = cost: _counted(name, f, cost))
+    _wrap(String, '_from_array', lambda name, f: _counted(name, f, _string_cost))
+    _wrap(String, '_from_rope', lambda name, f: _counted(name, f, _rope_cost))
+    _wrap(String, '__init__', lambda name, f: _counted(name, f, _string_cost))
+    for cls in (String, FrozenString):
+        for name in _public_methods(cls):
+            _wrap(cls, name, _measured)
+
+def _uninstall() -> None:
+    ''' puts back every original function replaced by _install '''
+    for (owner, name), original in _saved.items():
+        setattr(owner, name, original)
+    _saved.clear()
+
+###############################################################################
+
+def start(sites: bool = False, every: float = None, stream = None) -> Recorder:
+    ''' starts recording String statistics into a new Recorder (installing
+        the instrumentation if no other Recorder is active)
+
+    Args:
+        sites:  True to also record the call site of each String call
+        every:  if given, dump the report at most every this many seconds
+        stream: a writable text stream for the periodic dumps
+
+    Returns:
+        the Recorder, which collects until passed to stop()
+    '''
+    recorder = Recorder(sites, every, stream)
+    if not _active:
+        _install()
+    _active.append(recorder)
+    return recorder
+
+def stop(recorder: Recorder) -> Recorder:
+    ''' stops recording into recorder (removing the instrumentation if it was
+        the last active Recorder); its statistics remain available
+
+    Returns:
+        the recorder
+    '''
+    _active.remove(recorder)
+    if not _active:
+        _uninstall()
+    return recorder
+
+@contextmanager
+def recording(sites: bool = False, every: float = None, stream = None):
+    ''' context manager recording String statistics while its block runs
+
+    Returns:
+        a context manager whose value is the Recorder (see start())
+    '''
+    recorder = start(sites, every, stream)
+    try:
+        yield recorder
+    finally:
+        stop(recorder)
+
+def is_enabled() -> bool:
+    ''' returns True if any Recorder is currently active '''
+    return bool(_active)
@@ -0,0 +1,258 @@
+'''Search and transform very large Strings on several cores at once.
+
+    find, rfind : lowest / highest index of a substring, or -1
+    count       : number of non-overlapping occurrences of a substring
+    find_all    : indices of the non-overlapping occurrences, in order
+    transform   : applies a character-wise str function (e.g. str.upper)
+    translate   : maps the characters through a table, as str.translate
+
+The String's code points are copied once into a block of shared memory,
+which every worker process of a pool maps by name: tasks name only a range
+of characters, so the text itself is never pickled.  The text is cut into
+chunks of chunk_size characters, each read by a worker together with the
+len(sub) - 1 characters that follow it, so that every occurrence is seen by
+the worker whose chunk it starts in, including those straddling two chunks.
+Results come back in chunk order and are merged in the calling process, so
+the outcome does not depend on the number of workers or their timing.
+
+Each call starts its own pool (some tens of milliseconds), so the workers
+pay off for texts of many millions of characters.  With workers = 1, or when
+the text fits in one chunk, the same chunk code runs in the calling process
+instead.
+As for any use of multiprocessing, scripts calling these functions must
+guard their entry point with if __name__ == '__main__' on platforms that
+spawn rather than fork new processes.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import math
+import operator
+import os
+from multiprocessing import shared_memory
+
+from .String import String
+from .Pattern import Pattern
+from .codepoints import buffer_of, decode, overlaps_itself
+
+# bounds on the automatic chunk size, in characters; in between, the text is
+# cut into CHUNKS_PER_WORKER chunks per worker, to balance the load
+MIN_CHUNK = 1 << 16
+MAX_CHUNK = 1 << 24
+CHUNKS_PER_WORKER = 4
+
+# in a worker process: the shared memory holding the text, and its typecode
+_shared   = None
+_typecode = None
+
+###############################################################################
+
+def _attach(name: str, typecode: str) -> None:
+    ''' pool initializer: maps the shared memory block holding the text '''
+    global _shared, _typecode
+    _shared, _typecode = shared_memory.SharedMemory(name = name), typecode
+
+def _shared_text(lo: int, hi: int) -> str:
+    ''' returns the characters in [lo, hi) of the text in shared memory '''
+    chars = array(_typecode)
+    chars.frombytes(_shared.buf[lo * chars.itemsize : hi * chars.itemsize])
+    return decode(chars)
+
+def _worker(task: tuple):
+    ''' runs one task in a worker process, on the text in shared memory '''
+    return _run(_shared_text, task)
+
+def _run(text_of, task: tuple):
+    ''' runs one task on one chunk
+
+    Args:
+        text_of: a function returning the characters in [lo, hi) as an str
+        task:    (operation, lo, hi, stop, argument): the chunk is [lo, hi),
+                 read up to stop (which includes the overlap), and argument
+                 is the substring searched for or the transform applied
+    '''
+    operation, lo, hi, stop, argument = task
+    piece = text_of(lo, stop)
+    if operation == 'find':
+        found = piece.find(argument)
+        return found if found < 0 else lo + found
+    if operation == 'rfind':
+        found = piece.rfind(argument)
+        return found if found < 0 else lo + found
+    if operation == 'count':    # the needle cannot overlap itself here
+        return piece.count(argument)
+    if operation == 'starts':   # every start, overlapping or not
+        starts, found = array('q'), piece.find(argument)
+        while found >= 0:
+            starts.append(lo + found)
+            found = piece.find(argument, found + 1)
+        return starts
+    return argument(piece)      # 'transform'
+
+###############################################################################
+
+def _dispatch(text: 'String | str', operation: str, argument, overlap: int,
+              workers: int, chunk_size: int) -> list:
+    ''' runs operation on every chunk of text, in worker processes sharing
+        the text when there is more than one chunk and worker
+
+    Returns:
+        the list of the chunk results, in the order of the chunks
+    '''
+    chars, start, end = buffer_of(text)
+    n = end - start
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = min(max(math.ceil(n / (workers * CHUNKS_PER_WORKER)), MIN_CHUNK), MAX_CHUNK)
+    tasks = [(operation, lo, min(lo + chunk_size, n), min(lo + chunk_size + overlap, n), argument)
+             for lo in range(0, n, chunk_size)]
+    if workers == 1 or len(tasks) <= 1:
+        text_of = lambda lo, hi: decode(chars, start + lo, start + hi)
+        return [_run(text_of, task) for task in tasks]
+
+    typecode = chars.typecode
+    itemsize = array(typecode).itemsize
+    block = shared_memory.SharedMemory(create = True, size = max(n * itemsize, 1))
+    try:
+        # one copy of the text into the block, a slice at a time for
+        # file-backed buffers
+        for lo in range(0, n, MAX_CHUNK):
+            hi = min(lo + MAX_CHUNK, n)
+            part = memoryview(chars)[start + lo : start + hi] if isinstance(chars, array) \
+                   else memoryview(chars[start + lo : start + hi])
+            block.buf[lo * itemsize : hi * itemsize] = part.cast('B')
+        with ProcessPoolExecutor(min(workers, len(tasks)), initializer = _attach,
+                                 initargs = (block.name, typecode)) as pool:
+            return list(pool.map(_worker, tasks))
+    finally:
+        block.close()
+        block.unlink()
+
+def _starts(text, sub: str, workers: int, chunk_size: int) -> list:
+    ''' returns the starts of the non-overlapping occurrences of sub, taken
+        greedily from the left as str.count and Pattern.finditer do
+    '''
+    chosen, next_free, overlapping = [], 0, overlaps_itself(sub)
+    for starts in _dispatch(text, 'starts', sub, len(sub) - 1, workers, chunk_size):
+        if not overlapping:
+            chosen.extend(starts)
+            continue
+        for found in starts:
+            if found >= next_free:
+                chosen.append(found)
+                next_free = found + len(sub)
+    return chosen
+
+###############################################################################
+
+def find(text: 'String | str', sub: 'String | str', workers: int = None,
+         chunk_size: int = None) -> int:
+    ''' returns the lowest index of sub in text, or -1 if it does not occur,
+        searching chunks of text in parallel
+
+    Args:
+        text:       a String or str to search in
+        sub:        a String or str to search for
+        workers:    the number of worker processes (default: one per core)
+        chunk_size: the number of characters per task (default: automatic)
+
+    Returns:
+        an int index, or -1
+    '''
+    sub = str(sub)
+    if not sub:
+        return 0
+    found = [i for i in _dispatch(text, 'find', sub, len(sub) - 1, workers, chunk_size) if i >= 0]
+    return found[0] if found else -1
+
+#####################################################
+def rfind(text: 'String | str', sub: 'String | str', workers: int = None,
+          chunk_size: int = None) -> int:
+    ''' returns the highest index of sub in text, or -1 if it does not occur,
+        searching chunks of text in parallel (arguments as for find)
+    '''
+    sub = str(sub)
+    if not sub:
+        return len(text) if isinstance(text, str) else text.len()
+    found = [i for i in _dispatch(text, 'rfind', sub, len(sub) - 1, workers, chunk_size) if i >= 0]
+    return found[-1] if found else -1
+
+#####################################################
+def count(text: 'String | str', sub: 'String | str', workers: int = None,
+          chunk_size: int = None) -> int:
+    ''' returns the number of non-overlapping occurrences of sub in text (as
+        str.count), counting chunks of text in parallel
+
+    Each chunk is counted on its own unless occurrences of sub can overlap
+    (e.g. 'aa' in 'aaa'); then which ones count depends on those before, and
+    the workers return the occurrences for the calling process to choose from.
+
+    Args:
+        text:       a String or str to search in
+        sub:        a String or str to search for
+        workers:    the number of worker processes (default: one per core)
+        chunk_size: the number of characters per task (default: automatic)
+
+    Returns:
+        an int count
+    '''
+    sub = str(sub)
+    if not sub:
+        return Pattern(sub).count(text)
+    if overlaps_itself(sub):
+        return len(_starts(text, sub, workers, chunk_size))
+    return sum(_dispatch(text, 'count', sub, len(sub) - 1, workers, chunk_size))
+
+#####################################################
+def find_all(text: 'String | str', sub: 'String | str', workers: int = None,
+             chunk_size: int = None) -> list:
+    ''' returns the indices of the non-overlapping occurrences of sub in text,
+        from left to right (as Pattern.finditer), searching chunks in parallel
+
+    Args:
+        text:       a String or str to search in
+        sub:        a non-empty String or str to search for
+        workers:    the number of worker processes (default: one per core)
+        chunk_size: the number of characters per task (default: automatic)
+
+    Returns:
+        a list of int indices
+
+    Raises:
+        ValueError: if sub is empty
+    '''
+    sub = str(sub)
+    if not sub:
+        raise ValueError("Cannot search for an empty substring")
+    return _starts(text, sub, workers, chunk_size)
+
+#####################################################
+def transform(text: 'String | str', function, workers: int = None,
+              chunk_size: int = None) -> String:
+    ''' returns a new String made by applying function to chunks of text in
+        parallel and joining the results in order
+
+    Args:
+        text:       a String or str
+        function:   a picklable function from str to str that works character
+                    by character (e.g. str.upper, str.swapcase), so that its
+                    result does not depend on where the text is cut
+        workers:    the number of worker processes (default: one per core)
+        chunk_size: the number of characters per task (default: automatic)
+
+    Returns:
+        a String object
+    '''
+    return String("".join(_dispatch(text, 'transform', function, 0, workers, chunk_size)))
+
+#####################################################
+def translate(text: 'String | str', table: dict, workers: int = None,
+              chunk_size: int = None) -> String:
+    ''' returns a new String with every character of text mapped through
+        table, as str.translate does, in parallel (arguments as for transform)
+    '''
+    return transform(text, operator.methodcaller('translate', table), workers, chunk_size)
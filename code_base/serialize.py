@@ -0,0 +1,227 @@
+'''Binary files of Strings, loaded back without copying or decoding.
+
+Saving a String as an str (or pickling one) means encoding it on the way out
+and rebuilding its code-point buffer on the way in.  dump instead writes the
+buffer itself, and load maps the file and returns Strings that view the
+mapped bytes directly: loading costs the same few system calls whatever the
+size of the file, and characters are only read from disk when used.
+
+File format (version 1).  Every integer is unsigned, in the byte order given
+at offset 7 (the order of the machine that wrote the file):
+
+    offset  size        field
+    0       6           magic b'DCSSTR'
+    6       1           format version, 1
+    7       1           byte order, b'<' (little) or b'>' (big endian)
+    8       1           width: bytes per code point, 1, 2 or 4
+    9       1           flags: bit 0 set for a single String, clear for a batch
+    10      6           reserved, zero
+    16      8           count: number of Strings n
+    24      8           total: number of code points in the payload
+    32      8 (n + 1)   offsets table: String i is payload[offsets[i]:offsets[i + 1]]
+    40 + 8n width total payload: the code points of every String, one after
+                        the other, each stored in width bytes
+
+Every String of a file uses the width of its widest character, so the
+payload stays a plain array and String i starts at a computable byte; the
+header and table are multiples of 8 bytes long, so the payload is aligned.
+
+A file written on a machine of the other byte order is still loaded, but
+copied into memory to swap its bytes.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from array import array
+import itertools
+import mmap
+import struct
+import sys
+
+from .String import String
+from .MappedBuffer import MappedBuffer
+from .codepoints import UCS1, WIDTHS, buffer_of
+
+MAGIC   = b'DCSSTR'
+VERSION = 1
+SINGLE  = 0x01   # flags bit: the file holds one String rather than a batch
+
+# header layout after the byte order character: magic, version, byte order,
+# width, flags, 6 reserved bytes, count, total
+_HEADER = '6sBcBB6xQQ'
+HEADER_SIZE = struct.calcsize('<' + _HEADER)
+
+_ORDER = b'<' if sys.byteorder == 'little' else b'>'
+
+# typecodes of the 1, 2 and 4 byte code-point arrays
+_TYPECODES = {array(typecode).itemsize: typecode for typecode in WIDTHS}
+
+###############################################################################
+
+class StringBatch:
+    '''The Strings of a file written by dump, as a read-only sequence.
+
+    Element i is a String viewing characters [offsets[i], offsets[i + 1]) of
+    one shared code-point buffer (the mapped payload), built only when asked
+    for, so a batch of millions of Strings costs nothing until it is used.
+
+    Attributes:
+        len        : returns the (int) number of Strings
+        __getitem__: an int gives a String view; a slice (step 1) gives a
+                     StringBatch sharing the buffer
+        __iter__   : iterates over the Strings in order
+        to_list    : returns a list of str
+    '''
+
+    __slots__ = ('_chars', '_offsets')
+
+    #####################################################
+    def __init__(self, chars, offsets) -> None:
+        ''' initialization method for the StringBatch class
+
+        Args:
+            chars:   the code-point buffer (an array or a MappedBuffer)
+            offsets: n + 1 int character offsets into chars (any sequence of
+                ints, e.g. a memoryview of the file's offsets table)
+        '''
+        self._chars   = chars
+        self._offsets = offsets
+
+    #####################################################
+    def len(self) -> int:
+        ''' returns the number of Strings in the batch '''
+        return len(self._offsets) - 1
+
+    def __len__(self) -> int:
+        return self.len()
+
+    #####################################################
+    def __getitem__(self, index):
+        ''' overrides the __getitem__ special method
+
+        Args:
+            index: an int (negative counts from the end) or a slice with step 1
+
+        Returns:
+            a String sharing the buffer (for an int index), otherwise a
+            StringBatch sharing the buffer
+
+        Raises:
+            IndexError: if an int index is out of range
+        '''
+        if isinstance(index, slice):
+            start, end, step = index.indices(self.len())
+            if step != 1:
+                raise ValueError("StringBatch slices must have step 1")
+            return StringBatch(self._chars, self._offsets[start : max(start, end) + 1])
+        if index < 0: index += self.len()
+        if not 0 <= index < self.len():
+            raise IndexError("StringBatch index out of range")
+        start = self._offsets[index]
+        return String._from_array(self._chars, start, self._offsets[index + 1] - start,
+                                  shared = True)
+
+    #####################################################
+    def __iter__(self):
+        return map(self.__getitem__, range(self.len()))
+
+    #####################################################
+    def to_list(self) -> list:
+        ''' returns the Strings of the batch as a list of str '''
+        return [str(string) for string in self]
+
+    #####################################################
+    def __repr__(self) -> str:
+        return f'StringBatch({self.len()} Strings)'
+
+###############################################################################
+
+def dump(strings, path: str) -> None:
+    ''' writes a String, or a batch of Strings, to a binary file that load
+        maps back without copying (see the format above)
+
+    Args:
+        strings: a String or str, saved as a single String, or an iterable of
+            Strings and strs, saved as a batch
+        path:    the path of the file to (over)write
+    '''
+    single  = isinstance(strings, (String, str))
+    lengths = array('Q')
+    buffers, texts = [], []   # texts: a run of strs, to be encoded in one go
+
+    def encode_texts() -> None:
+        if texts:
+            buffers.append(buffer_of("".join(texts)))
+            texts.clear()
+
+    for string in [strings] if single else strings:
+        if isinstance(string, str):
+            texts.append(string)
+            lengths.append(len(string))
+        else:
+            encode_texts()
+            buffers.append(buffer_of(string))
+            lengths.append(buffers[-1][2] - buffers[-1][1])
+    encode_texts()
+    typecode = max((chars.typecode for chars, _, _ in buffers), key = WIDTHS.index, default = UCS1)
+    offsets  = array('Q', itertools.accumulate(lengths, initial = 0))
+
+    with open(path, 'wb') as file:
+        file.write(struct.pack(_ORDER.decode() + _HEADER, MAGIC, VERSION, _ORDER,
+                               array(typecode).itemsize, SINGLE if single else 0,
+                               len(lengths), offsets[-1]))
+        file.write(offsets)
+        for chars, start, end in buffers:
+            if isinstance(chars, array) and chars.typecode == typecode:
+                file.write(memoryview(chars)[start:end])   # straight from the buffer
+            else:
+                file.write(array(typecode, chars[start:end]))
+
+###############################################################################
+
+def load(path: str) -> 'String | StringBatch':
+    ''' maps a file written by dump and returns its String(s), which read
+        their characters from the mapped file directly (read only: writing to
+        one copies it first, as for String.from_file)
+
+    Args:
+        path: the path of the file to load
+
+    Returns:
+        a String if a single String was saved, otherwise a StringBatch
+
+    Raises:
+        ValueError: if the file is not in this format, or is truncated
+    '''
+    with open(path, 'rb') as file:
+        try:
+            source = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ)
+        except ValueError:   # empty files cannot be mapped
+            source = b''
+    if len(source) < HEADER_SIZE or source[:6] != MAGIC:
+        raise ValueError(f"{path!r} is not a String file")
+    order = source[7:8]
+    if order not in (b'<', b'>'):
+        raise ValueError(f"{path!r} has an invalid byte order {order!r}")
+    _, version, _, width, flags, count, total = struct.unpack_from(order.decode() + _HEADER, source)
+    if version != VERSION or width not in _TYPECODES:
+        raise ValueError(f"{path!r} has an unsupported version or width")
+    typecode, table_end = _TYPECODES[width], HEADER_SIZE + 8 * (count + 1)
+    if len(source) < table_end + width * total:
+        raise ValueError(f"{path!r} is truncated")
+
+    if order == _ORDER:
+        offsets = memoryview(source)[HEADER_SIZE:table_end].cast('Q')
+        chars   = MappedBuffer._from_region(path, source, table_end, total, typecode)
+    else:
+        offsets, chars = array('Q'), array(typecode)
+        offsets.frombytes(source[HEADER_SIZE:table_end])
+        chars.frombytes(source[table_end : table_end + width * total])
+        offsets.byteswap()
+        chars.byteswap()
+
+    if flags & SINGLE:
+        return String._from_array(chars, offsets[0], offsets[1] - offsets[0], shared = True)
+    return StringBatch(chars, offsets)
@@ -0,0 +1,249 @@
+'''Splitting Strings into views: split, rsplit, splitlines and partition.
+
+Splitting a String through str (str(s).split(), then a String per piece)
+copies every piece twice.  The functions here instead return pieces that
+are views of the String's own buffer (see String.substring), so splitting
+allocates one small String object per piece and no characters at all.
+
+The pieces are generated lazily, from left to right, with the same results
+as the str methods of the same name, plus any-of delimiters: with
+any_of = ",;" every comma and every semicolon separates two pieces, as with
+re.split("[,;]").  Delimiters are found by running a regular expression over
+windows of at most CHUNK characters decoded from the buffer, so memory stays
+small even for a file-backed or compressed String.
+
+The String is flattened first (if it is a rope) and its buffer is shared
+copy-on-write, so the pieces, including those generated after the String is
+edited, are those of the String as it was when splitting started.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+from collections import deque
+import re
+
+from .Pattern import Pattern
+from .codepoints import decode, overlaps_itself
+
+# characters decoded at a time when looking for delimiters
+CHUNK = 1 << 16
+
+# runs of whitespace (as str.isspace), and the line boundaries of str.splitlines
+_WHITESPACE = re.compile(r'\s+')
+_LINE_BREAK = re.compile('\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]')
+
+###############################################################################
+
+def _snapshot(text: 'String') -> 'String':
+    ''' returns a flat String viewing the whole of text (flattened first),
+        whose buffer is shared copy-on-write and so never changes; the pieces
+        are views of it, made with its _view method
+    '''
+    text._flatten()
+    return text._view(0, text.len())
+
+def _delimiter(sep, any_of) -> tuple:
+    ''' returns (regex, overlap): the compiled regular expression matching one
+        delimiter, and how many characters a delimiter may still need after
+        the end of a window it starts in (0 for single characters and runs)
+
+    Raises:
+        ValueError: if sep is empty, or both sep and any_of are given
+    '''
+    if sep is not None and any_of is not None:
+        raise ValueError("give either sep or any_of, not both")
+    if any_of is not None:
+        delimiters = "".join(sorted(set(str(any_of))))
+        if not delimiters:
+            raise ValueError("empty set of delimiters")
+        return re.compile('[' + re.escape(delimiters) + ']'), 0
+    if sep is None:
+        return _WHITESPACE, 0
+    sep = str(sep)
+    if not sep:
+        raise ValueError("empty separator")
+    return re.compile(re.escape(sep)), len(sep) - 1
+
+def _matches(whole: 'String', regex, overlap: int):
+    ''' generator over the (start, end) of the successive non-overlapping
+        matches of regex in a snapshot, decoding at most about CHUNK
+        characters at a time
+
+    A match reaching the end of a window may go on in the next one, so it is
+    looked for again from its start in the next window; a window holding a
+    single unfinished match is doubled in size until the match ends.
+    '''
+    chars, offset, length = whole._chars, whole._start, whole._length
+    position, size = 0, max(CHUNK, 2 * (overlap + 1))
+    while position < length:
+        end = min(length, position + size)
+        window = decode(chars, offset + position, offset + end)
+        resume = max(len(window) - overlap, 0)
+        for match in regex.finditer(window):
+            if match.end() == len(window) and end < length:
+                resume = match.start()   # may go on in the next window
+                break
+            yield position + match.start(), position + match.end()
+            resume = max(resume, match.end())
+        if end == length:
+            return
+        size = size * 2 if resume == 0 else max(CHUNK, 2 * (overlap + 1))
+        position += resume
+
+###############################################################################
+
+def split(text: 'String', sep: 'String | str' = None, maxsplit: int = -1,
+          any_of: 'String | str' = None):
+    ''' returns a generator over the pieces of text (as String views)
+        separated by sep, like str.split
+
+    Args:
+        text:     the String to split
+        sep:      a String or str separating the pieces; None (default)
+                  splits at runs of whitespace, dropping empty pieces
+        maxsplit: the maximum number of splits, the rest of text making the
+                  last piece; -1 (default) for no limit
+        any_of:   a String or str of delimiter characters, each of which
+                  separates two pieces (instead of sep)
+
+    Raises:
+        ValueError: if sep or any_of is empty, or both are given
+    '''
+    regex, overlap = _delimiter(sep, any_of)
+    return _split(_snapshot(text), regex, overlap, maxsplit, sep is None and any_of is None)
+
+def _split(whole: 'String', regex, overlap: int, maxsplit: int, whitespace: bool):
+    ''' generator behind split, over a snapshot '''
+    position, length = 0, whole.len()
+    for start, end in _matches(whole, regex, overlap):
+        if whitespace and start == position:
+            position = end        # leading whitespace makes no piece
+            continue
+        if maxsplit == 0:
+            break
+        yield whole._view(position, start)
+        position, maxsplit = end, maxsplit - 1
+    if position < length or not whitespace:
+        yield whole._view(position, length)
+
+###############################################################################
+
+def rsplit(text: 'String', sep: 'String | str' = None, maxsplit: int = -1,
+           any_of: 'String | str' = None):
+    ''' returns a generator over the pieces of text (as String views)
+        separated by sep, like str.rsplit: the same as split, except that at
+        most maxsplit splits are made from the right, the rest of text being
+        the first piece
+
+    Without a limit, the pieces are those of split, generated lazily, unless
+    sep overlaps itself (like "aa" in "aaa", where the occurrences found from
+    the right differ).  Otherwise the positions of the splits are found
+    first, from the right, then the pieces are generated from left to right.
+
+    Args:
+        text:     the String to split
+        sep:      a String or str separating the pieces; None (default)
+                  splits at runs of whitespace, dropping empty pieces
+        maxsplit: the maximum number of splits; -1 (default) for no limit
+        any_of:   a String or str of delimiter characters (instead of sep)
+
+    Raises:
+        ValueError: if sep or any_of is empty, or both are given
+    '''
+    regex, overlap = _delimiter(sep, any_of)
+    whole = _snapshot(text)
+    if maxsplit < 0:
+        sep = None if sep is None else str(sep)
+        if sep is None or not overlaps_itself(sep):
+            return _split(whole, regex, overlap, maxsplit, sep is None and any_of is None)
+        maxsplit = whole.len()
+    return _rsplit(whole, sep, regex, overlap, maxsplit)
+
+def _rsplit(whole: 'String', sep, regex, overlap: int, maxsplit: int):
+    ''' generator behind rsplit with a limit, over a snapshot; sep is None
+        for the regex delimiters
+    '''
+    length = whole.len()
+    position, end = 0, length
+
+    if sep is not None:
+        pattern, splits = Pattern(sep), deque()
+        while len(splits) < maxsplit:
+            found = pattern.rfind(whole, 0, splits[0][0] if splits else length)
+            if found < 0:
+                break
+            splits.appendleft((found, found + overlap + 1))
+    elif regex is not _WHITESPACE:
+        splits = list(deque(_matches(whole, regex, 0), maxlen = maxsplit)) \
+                 if maxsplit else []
+    else:
+        # only the last maxsplit runs of whitespace split, plus one at the end
+        runs = deque(_matches(whole, regex, 0), maxlen = maxsplit + 1)
+        if runs and runs[-1][1] == length:
+            end = runs.pop()[0]        # trailing whitespace makes no piece
+        splits = list(runs)[max(len(runs) - maxsplit, 0):] if maxsplit else []
+        if splits and splits[0][0] == 0:
+            position = splits.pop(0)[1]  # nor does leading whitespace
+
+    for start, stop in splits:
+        yield whole._view(position, start)
+        position = stop
+    if position < end or regex is not _WHITESPACE:
+        yield whole._view(position, end)
+
+###############################################################################
+
+def splitlines(text: 'String', keepends: bool = False):
+    ''' returns a generator over the lines of text (as String views), split
+        at the line boundaries of str.splitlines: newline, carriage return
+        (alone or followed by a newline), form feed, line separator and the
+        like
+
+    Args:
+        text:     the String to split
+        keepends: True to keep the line boundary at the end of each line
+    '''
+    return _splitlines(_snapshot(text), keepends)
+
+def _splitlines(whole: 'String', keepends: bool):
+    ''' generator behind splitlines, over a snapshot '''
+    position, length = 0, whole.len()
+    for start, end in _matches(whole, _LINE_BREAK, 0):
+        yield whole._view(position, end if keepends else start)
+        position = end
+    if position < length:
+        yield whole._view(position, length)
+
+###############################################################################
+
+def partition(text: 'String', sep: 'String | str', from_right: bool = False) -> tuple:
+    ''' splits text at the first (or last) occurrence of sep, like
+        str.partition (or str.rpartition)
+
+    Args:
+        text:       the String to split
+        sep:        a String or str to split at
+        from_right: True to split at the last occurrence of sep
+
+    Returns:
+        a tuple of three String views: the part before sep, sep and the part
+        after it; if sep does not occur, text and two empty Strings (or two
+        empty Strings and text, from the right)
+
+    Raises:
+        ValueError: if sep is empty
+    '''
+    if not len(sep):
+        raise ValueError("empty separator")
+    whole = _snapshot(text)
+    length, pattern = whole.len(), Pattern(sep)
+    found = pattern.rfind(whole) if from_right else pattern.find(whole)
+    if found < 0:
+        split_at = 0 if from_right else length
+        return (whole._view(0, split_at), whole._view(split_at, split_at),
+                whole._view(split_at, length))
+    end = found + len(sep)
+    return (whole._view(0, found), whole._view(found, end),
+            whole._view(end, length))
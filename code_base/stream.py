@@ -0,0 +1,138 @@
+'''Generators turning large files and binary streams into String objects
+   incrementally, reading a bounded chunk of bytes at a time.
+
+    read_chunks : one String per chunk read
+    read_lines  : one String per line
+    read_records: one String per record, for any delimiter
+
+Memory use is bounded by the chunk size plus the longest single record, no
+matter how large the input is.  Lines and records are substring views of the
+decoded chunk they came from, so splitting copies no characters; a record
+that straddles a chunk boundary is carried over and completed with the next
+chunk.  Multi-byte characters split across chunks are handled by decoding
+incrementally.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+'''
+
+import codecs
+import os
+
+from .String import String
+from .Pattern import Pattern
+
+# default number of bytes read at a time
+CHUNK_SIZE = 1 << 20
+
+###############################################################################
+
+def _read_text(source, encoding: str, chunk_size: int):
+    ''' generator yielding the decoded text of source one chunk at a time
+
+    Args:
+        source:     a path, or a binary (or text) stream with a read method
+        encoding:   the name of the text encoding, for binary input
+        chunk_size: the number of bytes (or characters) read at a time
+    '''
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file:
+            yield from _read_text(file, encoding, chunk_size)
+        return
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+    while True:
+        data = source.read(chunk_size)
+        if isinstance(data, str):   # text streams are already decoded
+            if not data: return
+            yield data
+            continue
+        text = decoder.decode(data, final = not data)
+        if text:
+            yield text
+        if not data:
+            return
+
+#####################################################
+def read_chunks(source, encoding: str = 'utf-8', chunk_size: int = CHUNK_SIZE):
+    ''' generator yielding the contents of source as consecutive Strings, one
+        per chunk of (at most) chunk_size bytes read
+
+    Args:
+        source:     a path, or a binary (or text) stream with a read method
+        encoding:   the name of the text encoding, for binary input
+        chunk_size: the number of bytes read at a time
+
+    Returns:
+        a generator of non-empty String objects
+    '''
+    for text in _read_text(source, encoding, chunk_size):
+        yield String(text)
+
+#####################################################
+def read_records(source, delimiter: 'String | str', encoding: str = 'utf-8',
+                 chunk_size: int = CHUNK_SIZE, keepends: bool = False):
+    ''' generator yielding the records of source separated by delimiter,
+        which may be several characters long and may straddle chunks
+
+    As with the lines of a file, a delimiter at the very end of the input
+    does not produce a final empty record.
+
+    Args:
+        source:     a path, or a binary (or text) stream with a read method
+        delimiter:  a non-empty String or str separating the records
+        encoding:   the name of the text encoding, for binary input
+        chunk_size: the number of bytes read at a time
+        keepends:   True to keep the delimiter at the end of each record
+
+    Returns:
+        a generator of String objects (views of the chunk they came from)
+
+    Raises:
+        ValueError: if the delimiter is empty
+    '''
+    pattern = Pattern(delimiter)
+    width = pattern.len()
+    if width == 0:
+        raise ValueError("The record delimiter cannot be empty")
+
+    pending = String("")   # start of a record not yet terminated
+    for text in _read_text(source, encoding, chunk_size):
+        # a delimiter can only begin in the last width - 1 carried-over
+        # characters, so only those are searched again along with the new
+        # text; the rest of a long record just grows as a rope
+        keep   = max(pending.len() - width + 1, 0)
+        head   = pending.substring(0, keep)
+        buffer = String(str(pending.substring(keep, pending.len())) + text)
+        start  = 0
+        found  = pattern.find(buffer)
+        while found >= 0:
+            record = buffer.substring(start, found + width if keepends else found)
+            if head.len():
+                record, head = head + record, String("")
+            yield record
+            start = found + width
+            found = pattern.find(buffer, start)
+        pending = buffer.substring(start, buffer.len())
+        if head.len():
+            pending = head + pending
+
+    if pending.len():
+        yield pending
+
+#####################################################
+def read_lines(source, encoding: str = 'utf-8', chunk_size: int = CHUNK_SIZE,
+               keepends: bool = False):
+    ''' generator yielding the lines of source, separated by '\\n'
+
+    Args:
+        source:     a path, or a binary (or text) stream with a read method
+        encoding:   the name of the text encoding, for binary input
+        chunk_size: the number of bytes read at a time
+        keepends:   True to keep the '\\n' at the end of each line
+
+    Returns:
+        a generator of String objects (views of the chunk they came from)
+    '''
+    return read_records(source, "\n", encoding, chunk_size, keepends)
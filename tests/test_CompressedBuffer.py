@@ -0,0 +1,94 @@
+'''Tests of String.compress: Strings kept in memory as compressed blocks,
+   read a block at a time.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+import random
+
+from code_base.String import String, FrozenString
+from code_base.CompressedBuffer import CompressedBuffer, CACHE
+from tests.test_String import print_test
+import pytest
+
+###############################################################################
+
+@pytest.fixture
+def repetitive_text():
+    ''' pytest fixture that returns a long, repetitive str of mixed widths
+
+    Returns:
+        an str of random words, a few thousand characters long
+    '''
+    rng = random.Random(23)
+    return "".join(rng.choice(["alpha ", "beta ", "gamma ", "€uro ", "😀 "]) for _ in range(800))
+
+###############################################################################
+
+def test_compress_reads(repetitive_text):
+    ''' pytest test that a compressed String (in blocks of 100 characters)
+        reads, slices, searches and compares like the str it was made from
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text = repetitive_text
+    compressed = String(text).compress(block = 100)
+    result   = (len(compressed), compressed[0], compressed[-1], compressed[150],
+                str(compressed.substring(95, 310)), compressed.find("😀", 1000),
+                compressed.count("beta"), compressed == text, "".join(compressed) == text,
+                isinstance(compressed._chars, CompressedBuffer))
+    expected = (len(text), text[0], text[-1], text[150], text[95:310], text.find("😀", 1000),
+                text.count("beta"), True, True, True)
+    print_test('String(text).compress(block = 100)[150]', result = result[3], expected = expected[3])
+    assert(result == expected)
+
+def test_compress_blocks_and_cache(repetitive_text):
+    ''' pytest test that the buffer decompresses only the blocks it reads,
+        keeps at most CACHE of them, and takes less memory than the text
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text   = String(repetitive_text)
+    compressed = text.compress(block = 64)
+    buffer = compressed._chars
+    cached = []
+    buffer[130]
+    cached.append(sorted(buffer._cache))
+    buffer[60:200]
+    cached.append(list(buffer._cache))
+    for i in range(0, 64 * (CACHE + 3), 64):
+        buffer[i]
+    result   = (cached, len(buffer._cache), sorted(buffer._cache)[0], compressed.find("😀", 700),
+                buffer.nbytes() < len(buffer) * buffer.itemsize, len(buffer))
+    expected = ([[2], [0, 1, 2, 3]], CACHE, 3, repetitive_text.index("😀", 700), True,
+                len(repetitive_text))
+    print_test('String(text).compress(block = 64)._chars[60:200]', result = result, expected = expected)
+    assert(result == expected)
+
+def test_compress_edits_copy(repetitive_text):
+    ''' pytest test that writing to a compressed String (or a view of one)
+        changes only that String, that FrozenStrings stay frozen, and that
+        empty Strings compress
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    compressed = String(repetitive_text).compress()
+    view = compressed.substring(6, 20)
+    view[0] = "X"
+    compressed[0] = "A"
+    frozen = FrozenString(repetitive_text).compress()
+    result   = (str(view)[:3], str(compressed)[:8], type(frozen).__name__,
+                str(String("").compress()), str(compressed.substring(6, 9)))
+    expected = ("X" + repetitive_text[7:9], "A" + repetitive_text[1:8], "FrozenString", "",
+                repetitive_text[6:9])
+    print_test('String(text).compress()[0] = "A"', result = result, expected = expected)
+    assert(result == expected)
@@ -0,0 +1,80 @@
+'''Tests of InternPool: canonical FrozenStrings shared by equal texts.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+import gc
+
+from code_base.String import String, FrozenString
+from code_base.InternPool import InternPool, intern
+from tests.test_String import print_test
+import pytest
+
+###############################################################################
+
+def test_intern_pool_weak():
+    ''' pytest test that equal Strings and strs intern to one FrozenString,
+        which owns a compact copy of a substring, and which the weak pool
+        forgets once it is no longer used
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    pool  = InternPool()
+    large = String("key:" + "x" * 1000)
+    first = pool.intern(large.substring(0, 3))
+    same  = [pool.intern("key"), pool.intern(String("key")), pool.intern(FrozenString("key"))]
+    other = pool.intern("kez")
+    before = (len(pool), "key" in pool, "kex" in pool)
+    del same, other
+    gc.collect()
+    after = (len(pool), "kez" in pool)
+    del first
+    gc.collect()
+    result   = (before, after, len(pool), intern("tag") is intern(String("tag")))
+    expected = ((2, True, False), (1, False), 0, True)
+    print_test('InternPool().intern("key")', result = result, expected = expected)
+    assert(result == expected)
+
+def test_intern_pool_identity():
+    ''' pytest test that interned Strings are FrozenStrings equal to the text,
+        the same object for equal texts, holding no view of a larger buffer
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    pool   = InternPool()
+    large  = String("€" * 100 + "token")
+    tokens = [pool.intern(large.substring(100, 105)) for _ in range(3)]
+    result   = (all(t is tokens[0] for t in tokens), isinstance(tokens[0], FrozenString),
+                tokens[0] == "token", len(tokens[0]._chars), tokens[0]._chars.typecode)
+    expected = (True, True, True, 5, 'B')
+    print_test('InternPool().intern(String("€" * 100 + "token").substring(100, 105))',
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_intern_pool_lru():
+    ''' pytest test that a bounded pool keeps the most recently interned
+        Strings and rejects a non-positive capacity
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    pool = InternPool(2)
+    a = pool.intern("a")
+    pool.intern("b")
+    again = pool.intern("a")     # "a" is now the most recently used
+    pool.intern("c")             # evicts "b"
+    result   = (a is again, "a" in pool, "b" in pool, "c" in pool, len(pool),
+                pool.intern(String("a")) is a)
+    expected = (True, True, False, True, 2, True)
+    print_test('InternPool(2).intern("c")', result = result, expected = expected)
+    with pytest.raises(ValueError):
+        InternPool(0)
+    assert(result == expected)
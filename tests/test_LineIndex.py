@@ -0,0 +1,99 @@
+'''Tests of the line/column lookups of String, backed by a LineIndex.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+from code_base.LineIndex import LineIndex
+from code_base.MappedBuffer import MappedBuffer
+from tests.test_String import print_test
+import pytest
+
+###############################################################################
+
+@pytest.fixture
+def lines_text():
+    ''' pytest fixture that returns an str of a few lines, with an empty line,
+        wide characters, a carriage return and a final newline
+
+    Returns:
+        an str
+    '''
+    return "first line\n\nth€rd 😀\r\nfourth\n"
+
+###############################################################################
+
+def test_line_lookups(lines_text):
+    ''' pytest test that offsets and (line, column) pairs convert both ways,
+        including the end of the text, and that line returns views without
+        their newline
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    string = String(lines_text)
+    result   = (string.line_count(), [string.offset_to_line_col(i) for i in (0, 10, 11, 12, 21, 28)],
+                string.line_col_to_offset(2, 6), string.line_col_to_offset(-2, 6),
+                [str(string.line(n)) for n in range(string.line_count())], str(string.line(-3)),
+                string.line(0)._chars is string._chars)
+    expected = (5, [(0, 0), (0, 10), (1, 0), (2, 0), (3, 0), (4, 0)], 18, 27,
+                lines_text.split("\n"), "th€rd 😀\r", True)
+    print_test(f"String({lines_text!r}).offset_to_line_col(12)", result = result[1][3],
+               expected = expected[1][3])
+    for bad in (lambda: string.offset_to_line_col(29), lambda: string.offset_to_line_col(-1),
+                lambda: string.line_col_to_offset(1, 1), lambda: string.line(5)):
+        with pytest.raises(IndexError):
+            bad()
+    assert(result == expected)
+
+def test_line_index_follows_setitem(lines_text):
+    ''' pytest test that overwriting characters with [] updates the same
+        LineIndex in place (also on a rope), while other edits rebuild it
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    result, expected = [], []
+    for string in (String(lines_text), String(lines_text[:9]) + String(lines_text[9:] * 20)):
+        text  = list(str(string))
+        index = string.line_index()
+        for position, char in ((5, "\n"), (10, " "), (11, "\n"), (3, "x"), (-1, "."), (0, "\n")):
+            string[position] = char
+            text[position] = char
+        result.append((string.line_index() is index, list(index._starts),
+                       [str(string.line(n)) for n in range(string.line_count())]))
+        text = "".join(text)
+        expected.append((True, list(LineIndex(text)._starts), text.split("\n")))
+        string.insert(0, "new\n")
+        result.append((string.line_index() is index, string.offset_to_line_col(4)))
+        expected.append((False, (1, 0)))
+    print_test(f"String({lines_text!r})[5] = '\\n'", result = result[0][1], expected = expected[0][1])
+    assert(result == expected)
+
+def test_line_index_of_mapped_utf8_file(tmp_path, lines_text, monkeypatch):
+    ''' pytest test that the LineIndex of a String read lazily from a UTF-8
+        file is built in one pass, decoding each character about once
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text = lines_text * 2000
+    path = tmp_path / "lines.txt"
+    path.write_bytes(text.encode('utf-8'))
+    string  = String.from_file(str(path))
+    decoded = []
+    original = MappedBuffer.decode
+    monkeypatch.setattr(MappedBuffer, "decode",
+                        lambda self, start, end: decoded.append(end - start) or original(self, start, end))
+    index = string.line_index()
+    result   = (type(string._chars).__name__, list(index._starts), string.offset_to_line_col(len(text) - 3),
+                str(string.line(-3)), sum(decoded) <= 2 * len(text))
+    expected = ('MappedBuffer', list(LineIndex(text)._starts), (text.count("\n") - 1, 4), "th€rd 😀\r", True)
+    print_test(f"String.from_file('{path}').line_index()", result = result[2:], expected = expected[2:])
+    assert(result == expected)
@@ -0,0 +1,114 @@
+'''Tests of the compiled Pattern class in Pattern.py, which searches String
+   objects without redoing the preprocessing of the needle.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+import re
+
+from code_base.String import String
+from code_base.Pattern import Pattern
+from code_base import codepoints
+from tests.test_String import print_test
+import pytest
+
+###############################################################################
+
+@pytest.fixture
+def haystack():
+    ''' pytest fixture that returns a str with repeated and overlapping words
+
+    Returns:
+        an str to search in
+    '''
+    return "the cat sat on the mat; the cattle scattered at the theatre"
+
+###############################################################################
+
+def test_pattern_reused_across_Strings(haystack):
+    ''' pytest test that one compiled Pattern finds its needle in several
+        Strings, including views and ropes
+        (1) stores the actual and expected results of the searches
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    texts    = [haystack, haystack[10:], haystack * 30]
+    strings  = [String(haystack), String(haystack).substring(10, len(haystack)), \
+                String(haystack * 15) + String(haystack * 15)]
+    pattern  = Pattern("theatre")
+    result   = [(pattern.find(s), pattern.rfind(s), pattern.count(s)) for s in strings]
+    expected = [(t.find("theatre"), t.rfind("theatre"), t.count("theatre")) for t in texts]
+    print_test('Pattern("theatre").find(String(...))', result = result, expected = expected)
+    assert(result == expected)
+
+def test_pattern_finditer_on_String(haystack):
+    ''' pytest test for the indices of all non-overlapping occurrences
+        (1) stores the actual and expected indices
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    result   = list(Pattern("at").finditer(String(haystack)))
+    expected = [i for i in range(len(haystack)) if haystack.startswith("at", i)]
+    print_test('Pattern("at").finditer(String(...))', result = result, expected = expected)
+    assert(result == expected)
+
+def test_pattern_wider_than_String(haystack):
+    ''' pytest test that a needle with characters too wide for the String's
+        buffer is rejected without scanning
+        (1) stores the actual and expected results of the searches
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    result   = [Pattern("cat€").find(String(haystack)), Pattern("€").count(String("a€b€"))]
+    expected = [-1, 2]
+    print_test('Pattern("cat€").find(String(...))', result = result, expected = expected)
+    assert(result == expected)
+
+def test_pattern_across_windows(haystack, monkeypatch):
+    ''' pytest test that occurrences straddling the windows decoded for the
+        search are found, forwards and backwards, within bounds
+        (1) stores the actual and expected results of the searches
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    monkeypatch.setattr(codepoints, "FIRST_WINDOW", 3)
+    monkeypatch.setattr(codepoints, "WINDOW", 7)
+    text     = haystack + "€ aaaa"
+    strings  = [String(text), String(text[:20]) + String(text[20:])]
+    result, expected = [], []
+    for string in strings:
+        for needle in ("the", "at", "t", "aa", "€ a", "cattle scattered", "zzz"):
+            pattern = Pattern(needle)
+            for start, end in ((0, None), (5, 40), (-12, -1)):
+                result.append((pattern.find(string, start, end), pattern.rfind(string, start, end),
+                               pattern.count(string, start, end),
+                               list(pattern.finditer(string, start, end))[:3]))
+                lo, hi = codepoints.adjust_indices(start, end, len(text))
+                expected.append((text.find(needle, start, end), text.rfind(needle, start, end),
+                                 text.count(needle, start, end),
+                                 [lo + m.start() for m in re.finditer(re.escape(needle),
+                                                                      text[lo:hi])][:3]))
+    print_test('Pattern("the").find(String(...)), 7-character windows', result = result[0],
+               expected = expected[0])
+    assert(result == expected)
+
+def test_overlaps_itself():
+    ''' pytest test that codepoints.overlaps_itself finds needles with a
+        proper prefix that is also a suffix
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    needles  = ("", "a", "ab", "aa", "aba", "abab", "abcab", "aabaa", "abcd", "€😀€")
+    result   = [codepoints.overlaps_itself(n) for n in needles]
+    expected = [any(n[:i] == n[-i:] for i in range(1, len(n))) for n in needles]
+    print_test('codepoints.overlaps_itself("abcab")', result = result[6], expected = expected[6])
+    assert(result == expected)
@@ -0,0 +1,83 @@
+'''Tests of the Aho-Corasick PatternSet class in PatternSet.py, which finds
+   many needles in a String with a single scan.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+from code_base.PatternSet import PatternSet
+from tests.test_String import print_test
+import pytest
+
+###############################################################################
+
+@pytest.fixture
+def keywords():
+    ''' pytest fixture returning needles that overlap and contain each other
+
+    Returns:
+        a list of str needles
+    '''
+    return ["he", "she", "his", "hers", "e"]
+
+###############################################################################
+
+def test_scan_finds_overlapping_matches(keywords):
+    ''' pytest test that a single scan reports every occurrence of every
+        needle, including overlapping and nested ones
+        (1) stores the actual and expected (needle, index) matches
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text     = "ushers and his shed"
+    result   = sorted(PatternSet(keywords).scan(String(text)))
+    expected = sorted((k, i) for k in keywords for i in range(len(text)) if text.startswith(k, i))
+    print_test(f'PatternSet({keywords}).scan(String("{text}"))', \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_scan_orders_matches_by_end_then_length(keywords):
+    ''' pytest test for the order of the matches yielded by scan
+        (1) stores the actual and expected order of the matches
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    result   = list(PatternSet(keywords).scan(String("ushers")))
+    expected = [("she", 1), ("he", 2), ("e", 3), ("hers", 2)]
+    print_test('PatternSet(...).scan(String("ushers"))', \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_count_on_String_view(keywords):
+    ''' pytest test that count works on a substring view of a larger String
+        (1) stores the actual and expected match counts
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text     = "xxx she sells his shells xxx"
+    result   = PatternSet(keywords).count(String(text).substring(4, -4))
+    expected = {k: sum(text[4:-4].startswith(k, i) for i in range(len(text) - 8)) for k in keywords}
+    print_test(f'PatternSet({keywords}).count(String("{text}").substring(4, -4))', \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_empty_needle_rejected():
+    ''' pytest test that an empty needle cannot be compiled
+        (1) uses 'with pytest.raises' to look for appropriate raised exception,
+            which is raised by the indented code
+        (2) calls print_test with string version of the test, result of the
+            actual test, and expected result
+        (3) assert required by pytest
+    '''
+    with pytest.raises(ValueError) as exception_info:
+        PatternSet(["a", ""])
+    result   = type(exception_info.value)
+    expected = ValueError
+    print_test('PatternSet(["a", ""])', result = result, expected = expected)
+    assert(result == expected)
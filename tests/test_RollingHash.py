@@ -0,0 +1,114 @@
+'''Tests of the rolling-hash fingerprints in RollingHash.py, and of the
+   String methods built on them.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from array import array
+import os
+import random
+
+from code_base.String import String
+from code_base import RollingHash as RollingHash_module
+from code_base.RollingHash import RollingHash
+from tests.test_String import print_test
+import pytest
+
+###############################################################################
+
+@pytest.fixture
+def repetitive_text():
+    ''' pytest fixture that returns a random str over a tiny alphabet (so
+        that many of its substrings repeat), including NUL and wide characters
+
+    Returns:
+        an str of 300 characters
+    '''
+    return "".join(random.Random(18).choices("ab\x00😀", k = 300))
+
+###############################################################################
+
+def test_substring_equals(repetitive_text):
+    ''' pytest test that fingerprint comparisons agree with comparing the
+        substrings, within one text and across two, and reject bad ranges
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text, rng = repetitive_text, random.Random(1)
+    string, other = String(text), RollingHash(text[::-1])
+    result, expected = [], []
+    for _ in range(2000):
+        i, j = rng.randrange(300), rng.randrange(300)
+        length = rng.randint(0, 300 - max(i, j))
+        result.append((string.substring_equals(i, j, length),
+                       string.rolling_hash().substring_equals(i, j, length, other)))
+        expected.append((text[i : i + length] == text[j : j + length],
+                         text[i : i + length] == text[::-1][j : j + length]))
+    with pytest.raises(IndexError):
+        string.substring_equals(250, 0, 51)
+    print_test('String(text).substring_equals(i, j, length)', result = sum(map(any, result)),
+               expected = sum(map(any, expected)))
+    assert(result == expected)
+
+def test_common_prefix_length(repetitive_text):
+    ''' pytest test that the longest common prefix of two suffixes is found
+        by binary search over fingerprints, including at the ends of the text
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text, rng = repetitive_text, random.Random(2)
+    string = String(text)
+    pairs  = [(0, 0), (0, 300), (300, 5)] + [(rng.randint(0, 300), rng.randint(0, 300)) for _ in range(500)]
+    result   = [string.common_prefix_length(i, j) for i, j in pairs]
+    expected = [len(os.path.commonprefix([text[i:], text[j:]])) for i, j in pairs]
+    print_test('String(text).common_prefix_length(i, j)', result = result[:3], expected = expected[:3])
+    assert(result == expected)
+
+def test_duplicate_windows_after_edit():
+    ''' pytest test that repeated windows are found by Rabin-Karp, and that
+        the String builds a new RollingHash once it has been edited
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    string  = String("the cat sat on the mat")
+    before  = string.duplicate_windows(4)
+    cached  = string.rolling_hash() is string.rolling_hash()
+    string.replace_range(8, 11, "the")
+    result   = (before, cached, string.duplicate_windows(4), string.duplicate_windows(30))
+    expected = ([[0, 15]], True, [[0, 8, 15], [7, 14]], [])
+    print_test('String("the cat sat on the mat").duplicate_windows(4)',
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_powers_table_is_capped(repetitive_text, monkeypatch):
+    ''' pytest test that the shared table of powers stops growing at
+        POWERS_MAX entries, fingerprints of longer substrings using pow()
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    monkeypatch.setattr(RollingHash_module, "POWERS_MAX", 16)
+    monkeypatch.setattr(RollingHash_module, "_powers", (array('Q', [1]), array('Q', [1])))
+    text   = repetitive_text[:100] * 3       # windows of 40 repeat 100 apart
+    hashes = RollingHash(text)
+    rng    = random.Random(3)
+    pairs  = [(rng.randrange(150), rng.randrange(150), rng.randrange(150)) for _ in range(200)]
+    windows = {}
+    for start in range(len(text) - 39):
+        windows.setdefault(text[start : start + 40], []).append(start)
+    result   = (len(RollingHash_module._powers[0]), [hashes.substring_equals(i, j, n) for i, j, n in pairs],
+                hashes.common_prefix_length(0, 0), hashes.duplicate_windows(40))
+    expected = (16, [text[i : i + n] == text[j : j + n] for i, j, n in pairs], len(text),
+                [found for found in windows.values() if len(found) > 1])
+    print_test("RollingHash(String(...)) with POWERS_MAX = 16", result = result[0], expected = expected[0])
+    assert(result == expected)
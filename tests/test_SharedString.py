@@ -0,0 +1,93 @@
+'''Tests of SharedString: lock-free snapshot reads while other threads edit.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+import sys
+import threading
+
+from code_base.String import FrozenString
+from code_base.SharedString import SharedString
+from tests.test_String import print_test
+import pytest
+
+###############################################################################
+
+def test_shared_string_versions():
+    ''' pytest test that every edit publishes a new version with the next
+        epoch, that snapshots taken earlier do not change, and that a failed
+        edit block publishes nothing
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    shared = SharedString("hello world")
+    before = shared.snapshot()
+    epochs = [shared.insert(5, ","), shared.delete(0, 1), shared.replace_range(0, 4, "Hell")]
+    shared[-1] = "D"
+    with shared.edit() as draft:
+        draft.insert(draft.len(), "!")
+        draft.replace_range(0, 1, "J")
+    with pytest.raises(IndexError):
+        shared[100] = "x"
+    with pytest.raises(RuntimeError):
+        with shared.edit() as draft:
+            draft.delete(0, 5)
+            raise RuntimeError("abandon this edit")
+    result   = (str(shared), shared.epoch(), epochs, str(before), isinstance(shared.snapshot(), FrozenString),
+                shared.find("worl"), shared[1], "Jell" in shared)
+    expected = ("Jell, worlD!", 5, [1, 2, 3], "hello world", True, 6, "e", True)
+    print_test('SharedString("hello world")', result = result, expected = expected)
+    assert(result == expected)
+
+def test_shared_string_stress():
+    ''' pytest test that readers never see a partly published edit while
+        writer threads keep rewriting the text: each edit block rewrites all
+        the blocks of the text, one by one, and each reader checks without
+        locking that all the blocks of its snapshot are the same
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    blocks, width, writes = 50, 8, 40
+    shared = SharedString("0" * width * blocks)
+    torn, reads = [], [0]
+    stop = threading.Event()
+
+    def writer(digit: str) -> None:
+        for _ in range(writes):
+            with shared.edit() as draft:
+                for block in range(blocks):
+                    draft.replace_range(block * width, (block + 1) * width, digit * width)
+
+    def reader() -> None:
+        while not stop.is_set():
+            snapshot = shared.snapshot()
+            text = str(snapshot)
+            first = snapshot.substring(0, width)
+            if len(text) != width * blocks or text != str(first) * blocks or \
+                    snapshot.count(first) != blocks:
+                torn.append(text)
+            reads[0] += 1
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)        # switch threads as often as possible
+    try:
+        readers = [threading.Thread(target = reader) for _ in range(4)]
+        writers = [threading.Thread(target = writer, args = (str(d),)) for d in range(1, 5)]
+        for thread in readers + writers: thread.start()
+        for thread in writers: thread.join()
+        stop.set()
+        for thread in readers: thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    result   = (torn, shared.epoch(), reads[0] > 0)
+    expected = ([], 4 * writes, True)
+    print_test('SharedString("0" * 400) stress', result = result, expected = expected)
+    assert(result == expected)
@@ -284,7 +284,7 @@ def test_empty_constructor(empty_string):
             test, and expected result
         (3) assert required by pytest
     '''
-    result = String(empty_string)._chars
+    result = list(String(empty_string)._chars)
     expected = []
     print_test(f'String("{empty_string}")._chars', \
                result = result, expected = expected)
@@ -297,12 +297,40 @@ def test_basic_constructor(random_string):
             test, and expected result
         (3) assert required by pytest
     '''
-    result   = String(random_string)._chars
-    expected = [c for c in random_string]
+    result   = list(String(random_string)._chars)
+    expected = [ord(c) for c in random_string]
     print_test(f'String("{random_string}")._chars', \
                result = result, expected = expected)
     assert(result == expected)
 
+def test_constructor_uses_narrowest_width():
+    ''' pytest test that the compact buffer uses 1, 2 or 4 bytes per character
+        depending on the widest character in the str
+        (1) stores the actual and expected buffer item sizes
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    result   = [String(s)._chars.itemsize for s in ("héllo", "h€llo", "h😀llo")]
+    expected = [1, 2, 4]
+    print_test('String("héllo")._chars.itemsize', \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_conversion_round_trips_wide_characters():
+    ''' pytest test that non-latin characters survive the compact buffer
+        (1) stores the actual and expected results of the conversion
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text     = "ascii é € 😀 \ud83d\ude00"  # includes a lone surrogate pair
+    result   = [str(String(text)), str(String(text[:-2])), str(String(text[:-5]))]
+    expected = [text, text[:-2], text[:-5]]
+    print_test('String("ascii é € 😀")', \
+               result = result, expected = expected)
+    assert(result == expected)
+
 ##############################################################################
 
 ###################################
@@ -522,6 +550,76 @@ def test_add_on_String_and_empty_str(sample_String1, empty_string):
                result = result, expected = expected)
     assert(result == expected)
 
+def test_add_builds_rope_for_long_Strings(sample_string1, sample_string2):
+    ''' pytest test that repeatedly adding to a String produces a rope whose
+        contents match the equivalent str concatenation
+        (1) stores the actual and expected results of the repeated sums
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    result = String("")
+    for i in range(100):
+        result = result + (sample_string1 if i % 2 else String(sample_string2))
+    expected = "".join(sample_string1 if i % 2 else sample_string2 for i in range(100))
+    print_test(f"String('') + '{sample_string1}' + ...", \
+               result = result, expected = expected)
+    assert(result._rope is not None and result.len() == len(expected))
+    assert(result == expected)
+
+def test_getitem_and_substring_on_rope(sample_string1, sample_string2):
+    ''' pytest test that [] access and substring work directly on a rope
+        (1) stores the actual and expected characters and substrings
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    rope     = String(sample_string1 * 50) + String(sample_string2 * 50)
+    text     = sample_string1 * 50 + sample_string2 * 50
+    result   = [rope[0], rope[700], rope[-1], str(rope.substring(690, -5))]
+    expected = [text[0], text[700], text[-1], text[690:-5]]
+    print_test(f"String('{sample_string1}' * 50)[700]", \
+               result = result, expected = expected)
+    assert(rope._rope is not None)
+    assert(result == expected)
+
+def test_setitem_on_rope_leaves_operands_unchanged(sample_string1):
+    ''' pytest test that overwriting a character of a rope does not leak into
+        the Strings that were concatenated to build it
+        (1) builds a rope from a String and overwrites one of its characters
+        (2) calls print_test with string version of the test, result of the
+            actual test, and expected result
+        (3) assert required by pytest
+    '''
+    left  = String(sample_string1 * 40)
+    rope  = left + left
+    rope[3] = '$'
+    result   = [str(left), str(rope)]
+    expected = [sample_string1 * 40, (sample_string1 * 80)[:3] + '$' + (sample_string1 * 80)[4:]]
+    print_test(f"String('{sample_string1}' * 80)[3] = '$'", \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_same_length_replace_range_on_rope(sample_string1):
+    ''' pytest test that replacing ranges of a rope by text of the same length,
+        within one leaf, across leaves and with wide characters, matches str
+        and keeps the rope
+        (1) builds a rope of several leaves and overwrites ranges of it
+        (2) calls print_test with string version of the test, result of the
+            actual test, and expected result
+        (3) assert required by pytest
+    '''
+    rope     = String(sample_string1 * 60) + String(sample_string1 * 60)
+    expected = list(sample_string1 * 120)
+    for start, text in ((0, "ab"), (511, "xyz"), (700, "€€"), (len(expected) - 1, "😀")):
+        rope.replace_range(start, start + len(text), text)
+        expected[start:start + len(text)] = text
+    result   = (str(rope), rope._rope is not None)
+    expected = ("".join(expected), True)
+    print_test(f"(String('{sample_string1}' * 60) * 2).replace_range(700, 702, '€€')", \
+               result = result, expected = expected)
+    assert(result == expected)
+
 ##############################################################################
 
 
@@ -577,6 +675,38 @@ def test_substring_from_minus_3_to_minus_3_of_a_String(random_string):
                result = result, expected = expected)
     assert(result == expected)
 
+def test_substring_shares_buffer_with_String(sample_String1):
+    ''' pytest test that substring returns a view sharing the parent's buffer
+        (1) stores whether the buffers are the same object and the substring
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    view     = sample_String1.substring(2, 9)
+    result   = [view._chars is sample_String1._chars, str(view)]
+    expected = [True, "v2berop"]
+    print_test(f"String('{sample_String1}').substring(2, 9)._chars", \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_setitem_on_substring_copies_on_write(sample_String1, sample_string1):
+    ''' pytest test that writing to a substring view leaves the parent alone,
+        and that writing to the parent leaves an earlier view alone
+        (1) writes through a view and through the parent
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    view1 = sample_String1.substring(0, 4)
+    view2 = sample_String1.substring(-4, 14)
+    view1[0] = '$'
+    sample_String1[-1] = '&'
+    result   = [str(view1), str(view2), str(sample_String1)]
+    expected = ["$hv2", "jsdf", sample_string1[:-1] + '&']
+    print_test(f"String('{sample_string1}').substring(0, 4)[0] = '$'", \
+               result = result, expected = expected)
+    assert(result == expected)
+
 ##############################################################################c
 
 ######################################
@@ -703,3 +833,444 @@ def test_setitem_firt_on_index_value_greater_than_String(sample_String2):
     print_test(f'String("{empty_string}")[27] = \'&\'', \
             result = result, expected = expected)
     assert(result == expected)
+
+def test_setitem_widens_buffer_for_wider_character(sample_String1, sample_string1):
+    ''' pytest test for storing a character wider than the current buffer
+        (1) overwrites a character with one needing 4 bytes
+        (2) calls print_test with string version of the test, result of the
+            actual test, and expected result
+        (3) assert required by pytest
+    '''
+    string = sample_String1
+    string[0] = '😀'
+    result   = string
+    expected = "😀hv2beropijsdf"
+    print_test(f'String("{sample_string1}")[0] = \'😀\'', \
+            result = result, expected = expected)
+    assert(result == expected and string._chars.itemsize == 4)
+
+##############################################################################
+
+#####################################
+#Testing __hash__(self) and freeze()
+#####################################
+
+def test_hash_matches_str_as_dict_key(sample_String1, sample_string1):
+    ''' pytest test that a String hashes like the equivalent str, so either
+        can be used to look up the other in a dict
+        (1) stores the actual and expected results of the dict lookups
+        (2) calls print_test with string version of the test, result of the
+            actual test, and expected result
+        (3) assert required by pytest
+    '''
+    table    = {sample_String1: 1, "other": 2}
+    result   = [hash(sample_String1) == hash(sample_string1), \
+                table[sample_string1], table[String(sample_string1)]]
+    expected = [True, 1, 1]
+    print_test(f"hash(String('{sample_string1}'))", \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_setitem_invalidates_cached_str_and_hash(sample_String1, sample_string1):
+    ''' pytest test that the cached str version and hash are refreshed after
+        a character is overwritten
+        (1) caches the str and hash, then overwrites a character
+        (2) calls print_test with string version of the test, result of the
+            actual test, and expected result
+        (3) assert required by pytest
+    '''
+    str(sample_String1); hash(sample_String1)   # fill the caches
+    sample_String1[0] = '$'
+    result   = [str(sample_String1), hash(sample_String1)]
+    expected = ['$' + sample_string1[1:], hash('$' + sample_string1[1:])]
+    print_test(f"String('{sample_string1}')[0] = '$'", \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_frozen_String_rejects_setitem(sample_String1, sample_string1):
+    ''' pytest test that a FrozenString shares storage with the String it was
+        frozen from and refuses to be changed
+        (1) uses 'with pytest.raises' to look for appropriate raised exception,
+            which is raised by the indented code
+        (2) calls print_test with string version of the test, result of the
+            actual test, and expected result
+        (3) assert required by pytest
+    '''
+    frozen = sample_String1.freeze()
+    with pytest.raises(TypeError) as exception_info:
+        frozen[0] = '$'
+    sample_String1[0] = '$'   # copy-on-write keeps the frozen copy intact
+    result   = [type(exception_info.value), str(frozen), frozen in {sample_string1}]
+    expected = [TypeError, sample_string1, True]
+    print_test(f"String('{sample_string1}').freeze()[0] = '$'", \
+               result = result, expected = expected)
+    assert(result == expected)
+
+##############################################################################
+
+##########################################################
+#Testing find, rfind, index, count and __contains__(self)
+##########################################################
+
+def test_find_and_rfind_on_String(sample_string2):
+    ''' pytest test for the lowest and highest index of substrings of several
+        lengths (so that each search algorithm gets exercised)
+        (1) stores the actual and expected results of the searches
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    string   = String(sample_string2)
+    needles  = ["k", "lk", "h1", "flkh1", "blkjnrsdf", "zzz", ""]
+    result   = [(string.find(n), string.rfind(n), string.find(n, 3, -2)) for n in needles]
+    expected = [(sample_string2.find(n), sample_string2.rfind(n), sample_string2.find(n, 3, -2)) \
+                for n in needles]
+    print_test(f"String('{sample_string2}').find(...)", \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_count_and_contains_on_random_String(random_string):
+    ''' pytest test that count and the in operator agree with str
+        (1) stores the actual and expected results of the searches
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    string   = String(random_string)
+    needles  = [random_string[i:i + 2] for i in range(len(random_string))] + ["~~~~~~"]
+    result   = [(string.count(n), n in string) for n in needles]
+    expected = [(random_string.count(n), n in random_string) for n in needles]
+    print_test(f"String('{random_string}').count(...)", \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_index_not_found_on_String(sample_String1):
+    ''' pytest test for index on a substring that does not occur
+        (1) uses 'with pytest.raises' to look for appropriate raised exception,
+            which is raised by the indented code
+        (2) calls print_test with string version of the test, result of the
+            actual test, and expected result
+        (3) assert required by pytest
+    '''
+    with pytest.raises(ValueError) as exception_info:
+        sample_String1.index("xyz")
+    result   = type(exception_info.value)
+    expected = ValueError
+    print_test(f"String('{sample_String1}').index('xyz')", \
+               result = result, expected = expected)
+    assert(result == expected)
+
+##############################################################################
+
+#######################################################################
+#Testing __len__, __iter__, __reversed__, slicing and codepoints()
+#######################################################################
+
+def test_len_iter_and_reversed(random_string):
+    ''' pytest test that len(), iteration and reversed() match str, for a
+        flat String and for a rope
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    flat = String(random_string)
+    rope = String(random_string * 20) + String("€" * 600)
+    result   = [len(flat), list(flat), list(reversed(flat)),
+                len(rope), "".join(rope), "".join(reversed(rope))]
+    expected = [len(random_string), list(random_string), list(reversed(random_string)),
+                len(random_string) * 20 + 600, random_string * 20 + "€" * 600,
+                (random_string * 20 + "€" * 600)[::-1]]
+    print_test(f"list(String(random_string))", result = result, expected = expected)
+    assert(result == expected)
+
+def test_getitem_slices(sample_String2, sample_string2):
+    ''' pytest test that slices return Strings equal to the str slices, and
+        that a plain slice is a view sharing the buffer
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    view = sample_String2[2:-3]
+    result   = [str(view), str(sample_String2[::-2]), str(sample_String2[100:]),
+                view._chars is sample_String2._chars]
+    expected = [sample_string2[2:-3], sample_string2[::-2], "", True]
+    print_test(f"String('{sample_string2}')[2:-3]", result = result, expected = expected)
+    assert(result == expected)
+
+def test_codepoints_memoryview(sample_String1, sample_string1):
+    ''' pytest test that codepoints() exports the code points without a copy
+        and keeps showing them after the String is written to
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    view = sample_String1.codepoints()
+    sample_String1[0] = "€"   # copy-on-write: the view is not affected
+    result   = [view.readonly, view.tolist(), str(sample_String1)[0]]
+    expected = [True, [ord(c) for c in sample_string1], "€"]
+    print_test(f"String('{sample_string1}').codepoints()", result = result, expected = expected)
+    assert(result == expected)
+
+##############################################################################
+
+##############################################################
+#Testing slice and bulk assignment, set_items and translate
+##############################################################
+
+def test_setitem_slices(sample_String1, sample_string1):
+    ''' pytest test that slices can be assigned, changing the length of the
+        String for a simple slice, like a list
+        (1) applies the same assignments to a String and to a list
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    expected_list = list(sample_string1)
+    sample_String1[1:3] = "€€€€"; expected_list[1:3] = "€€€€"
+    sample_String1[::2] = "_" * len(expected_list[::2]); expected_list[::2] = "_" * len(expected_list[::2])
+    sample_String1[-2:] = String(""); expected_list[-2:] = ""
+    result   = str(sample_String1)
+    expected = "".join(expected_list)
+    print_test(f"String('{sample_string1}')[1:3] = '€€€€'", result = result, expected = expected)
+    assert(result == expected)
+
+def test_setitem_extended_slice_broadcasts_one_character(sample_String1, sample_string1):
+    ''' pytest test that a single character is written to every position of
+        an extended slice, while any other mismatched length is rejected
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    sample_String1[::2] = "x"
+    sample_String1[-1::-3] = String("€")
+    with pytest.raises(ValueError):
+        sample_String1[::2] = "xy"
+    expected_list = list(sample_string1)
+    expected_list[::2] = "x" * len(expected_list[::2])
+    expected_list[-1::-3] = "€" * len(expected_list[-1::-3])
+    result   = str(sample_String1)
+    expected = "".join(expected_list)
+    print_test(f"String('{sample_string1}')[::2] = 'x'", result = result, expected = expected)
+    assert(result == expected)
+
+def test_setitem_many_indices(sample_String2, sample_string2):
+    ''' pytest test that a list of indices, (index, char) pairs and a numpy
+        index array each overwrite many characters, and that a bad index
+        leaves the String unchanged
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    np = pytest.importorskip("numpy")
+    sample_String2[[0, -1]] = "<>"
+    sample_String2.set_items([(1, "1"), (2, "2")])
+    sample_String2[np.array([3, 4, 5])] = "*"
+    with pytest.raises(IndexError):
+        sample_String2[[6, 100]] = "!!"
+    result   = str(sample_String2)
+    expected = "<12***" + sample_string2[6:-1] + ">"
+    print_test(f"String('{sample_string2}')[[0, -1]] = '<>'", result = result, expected = expected)
+    assert(result == expected)
+
+def test_translate_in_place(sample_String1, sample_string1):
+    ''' pytest test that translate rewrites the String in place like
+        str.translate, including deletions and multi-character replacements
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    table = str.maketrans({"a": "4", "e": "33", "o": None})
+    sample_String1.translate(table)
+    result   = str(sample_String1)
+    expected = sample_string1.translate(table)
+    print_test(f"String('{sample_string1}').translate(table)", result = result, expected = expected)
+    assert(result == expected)
+
+##############################################################################
+
+###################################################################
+#Testing insert(index, text), delete(start, end), replace_range(...)
+###################################################################
+
+def test_edits_on_long_String(random_string):
+    ''' pytest test that insert, delete and replace_range edit a long String
+        in place like the equivalent str slicing, and leave the inserted
+        String unchanged
+        (1) applies the same edits to a String and to an str
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text = String(random_string * 3)
+    piece = String("<piece>")
+    text.insert(10, piece)
+    text.delete(-30, -20)
+    text.replace_range(500, 520, "€dit")
+    piece[0] = "["
+    text.insert(-1000, "")
+    expected_str = random_string * 3
+    expected_str = expected_str[:10] + "<piece>" + expected_str[10:]
+    expected_str = expected_str[:-30] + expected_str[-20:]
+    expected_str = expected_str[:500] + "€dit" + expected_str[520:]
+    result   = [str(text), text.len(), str(piece)]
+    expected = [expected_str, len(expected_str), "[piece>"]
+    print_test(f"String(random_string * 3).insert(10, '<piece>')", \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_edits_then_setitem(sample_String1, sample_string1):
+    ''' pytest test that characters can be overwritten after edits, and that
+        edits at out-of-range positions clamp to the ends like list.insert
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    sample_String1.insert(100, "!")
+    sample_String1.insert(-100, "^")
+    sample_String1.delete(1, 3)
+    sample_String1[-2] = "_"
+    edited = "^" + sample_string1 + "!"
+    edited = edited[:1] + edited[3:]
+    edited = edited[:-2] + "_" + edited[-1:]
+    result   = str(sample_String1)
+    expected = edited
+    print_test(f"String('{sample_string1}').insert(100, '!')", \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_frozen_String_rejects_edits(sample_String1):
+    ''' pytest test that a FrozenString cannot be edited
+        (1) uses 'with pytest.raises' to look for appropriate raised exception,
+            which is raised by the indented code
+        (2) calls print_test with string version of the test, result of the
+            actual test, and expected result
+        (3) assert required by pytest
+    '''
+    with pytest.raises(TypeError) as exception_info:
+        sample_String1.freeze().insert(0, "x")
+    result   = type(exception_info.value)
+    expected = TypeError
+    print_test(f"String('{sample_String1}').freeze().insert(0, 'x')", \
+               result = result, expected = expected)
+    assert(result == expected)
+
+##############################################################################
+
+#################################################
+#Testing from_file(path: str, encoding: str)
+#################################################
+
+@pytest.fixture
+def text_file(tmp_path, sample_string2):
+    ''' pytest fixture writing a UTF-8 file with multi-byte characters
+
+    Args:
+        tmp_path: built-in pytest fixture giving a temporary directory
+        sample_string2: pytest fixture (above) that generates a specific string
+
+    Returns:
+        a (path, str) tuple of the file and its contents
+    '''
+    text = (sample_string2 + " € 😀 é\n") * 300
+    path = tmp_path / "sample.txt"
+    path.write_bytes(text.encode('utf-8'))
+    return str(path), text
+
+def test_from_file_utf8_access(text_file):
+    ''' pytest test for [] access, len, substring and == on a String read
+        lazily from a UTF-8 file
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    path, text = text_file
+    string   = String.from_file(path)
+    result   = [string.len(), string[5000], string[-2], str(string.substring(2990, 3020)), \
+                string == text]
+    expected = [len(text), text[5000], text[-2], text[2990:3020], True]
+    print_test(f"String.from_file('{path}')", result = result, expected = expected)
+    assert(result == expected)
+
+def test_from_file_search(text_file):
+    ''' pytest test for searching a String read lazily from a file
+        (1) stores the actual and expected results of the searches
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    path, text = text_file
+    string   = String.from_file(path)
+    result   = [string.find("€ 😀", 4000), string.rfind("\n"), string.count("lkh1")]
+    expected = [text.find("€ 😀", 4000), text.rfind("\n"), text.count("lkh1")]
+    print_test(f"String.from_file('{path}').find('€ 😀', 4000)", \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_from_file_find_decodes_near_windows(text_file, monkeypatch):
+    ''' pytest test that finding each occurrence in turn in a UTF-8 file only
+        decodes about the characters up to it, not a whole chunk per call
+        (1) stores the actual and expected positions and decoded lengths
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    path, text = text_file
+    string  = String.from_file(path)
+    decoded = []
+    original = MappedBuffer.decode
+    monkeypatch.setattr(MappedBuffer, "decode",
+                        lambda self, start, end: decoded.append(end - start) or original(self, start, end))
+    positions, position = [], string.find("\n")
+    while position >= 0:
+        positions.append(position)
+        position = string.find("\n", position + 1)
+    result   = [positions, string.count("€"), list(string.split("😀"))[-1] == text.split("😀")[-1],
+                sum(decoded) < 10 * len(text)]
+    expected = [[i for i, c in enumerate(text) if c == "\n"], text.count("€"), True, True]
+    print_test(f"String.from_file('{path}').find('\\n', ...)", \
+               result = result[1:], expected = expected[1:])
+    assert(result == expected)
+
+def test_from_file_eq_str_keeps_text_unloaded(text_file):
+    ''' pytest test that comparing file-backed and compressed Strings with an
+        str, or converting them to str, does not keep the decoded text
+        (1) stores the actual and expected results of the comparisons
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    path, text = text_file
+    result, expected = [], []
+    for string in (String.from_file(path), String(text).compress(block = 1000)):
+        different = text[:-1] + "!"
+        result.append((string == text, string == different, string == text[:-1],
+                       str(string) == text, hash(string) == hash(text), string._str))
+        expected.append((True, False, False, True, True, None))
+    print_test(f"String.from_file('{path}') == <its text>", result = result, expected = expected)
+    assert(result == expected)
+
+def test_from_file_latin1_setitem_copies(tmp_path, sample_string1):
+    ''' pytest test that writing to a String read from a (fixed-width
+        latin-1) file copies it into memory, leaving the file unchanged
+        (1) overwrites a character of the file-backed String
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    path = tmp_path / "sample.txt"
+    path.write_bytes(sample_string1.encode('latin-1'))
+    string = String.from_file(str(path), 'latin-1')
+    string[0] = '$'
+    result   = [str(string), path.read_bytes().decode('latin-1')]
+    expected = ['$' + sample_string1[1:], sample_string1]
+    print_test(f"String.from_file('{path}', 'latin-1')[0] = '$'", \
+               result = result, expected = expected)
+    assert(result == expected)
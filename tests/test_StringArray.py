@@ -0,0 +1,87 @@
+'''Tests of the StringArray class in StringArray.py, a column of strings in a
+   single buffer with NumPy-vectorized operations.  Skipped without NumPy.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+import pytest
+np = pytest.importorskip("numpy")
+
+from code_base.String import String
+from code_base.StringArray import StringArray
+from tests.test_String import print_test
+
+###############################################################################
+
+@pytest.fixture
+def words():
+    ''' pytest fixture returning a list of str including empty and wide ones
+
+    Returns:
+        a list of str
+    '''
+    return ["alpha", "", "beta", "gamma€", "beta", "😀", "delta"]
+
+###############################################################################
+
+def test_lengths_and_is_empty(words):
+    ''' pytest test for the vectorized lengths and emptiness mask
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    array    = StringArray(words)
+    result   = [array.len(), array.lengths().tolist(), array.is_empty().tolist()]
+    expected = [len(words), [len(w) for w in words], [w == "" for w in words]]
+    print_test(f'StringArray({words}).lengths()', result = result, expected = expected)
+    assert(result == expected)
+
+def test_eq_against_scalar_and_array(words):
+    ''' pytest test for comparing every element with one String, and
+        element-wise with another StringArray
+        (1) stores the actual and expected masks
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    array    = StringArray(words)
+    other    = ["alpha", "", "bet", "gamma€", "BETA", "😀", "delta"]
+    result   = [(array == String("beta")).tolist(), (array == StringArray(other)).tolist()]
+    expected = [[w == "beta" for w in words], [w == o for w, o in zip(words, other)]]
+    print_test(f'StringArray({words}) == String("beta")', result = result, expected = expected)
+    assert(result == expected)
+
+def test_substring_of_every_element(words):
+    ''' pytest test that substring slices every element with python rules,
+        sharing the buffer of the original array
+        (1) stores the actual and expected elements
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    array     = StringArray(words)
+    substring = array.substring(1, -1)
+    result    = [substring.to_list(), substring._chars is array._chars]
+    expected  = [[w[1:-1] for w in words], True]
+    print_test(f'StringArray({words}).substring(1, -1)', result = result, expected = expected)
+    assert(result == expected)
+
+def test_element_access_returns_copy_on_write_view(words):
+    ''' pytest test that [] gives String views, and that writing to one of
+        them leaves the array unchanged
+        (1) overwrites a character of an element view
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    array = StringArray(words)
+    element = array[2]
+    element[0] = 'z'
+    result   = [str(element), array[2] == "beta", array[np.array([0, 3])].to_list()]
+    expected = ["zeta", True, ["alpha", "gamma€"]]
+    print_test(f'StringArray({words})[2][0] = "z"', result = result, expected = expected)
+    assert(result == expected)
@@ -0,0 +1,111 @@
+'''Tests of the SuffixArray and FMIndex classes in SuffixArray.py, which
+   answer repeated queries on a large String without rescanning it.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+from code_base.SuffixArray import SuffixArray, FMIndex
+from tests.test_String import print_test
+import pytest
+
+###############################################################################
+
+@pytest.fixture
+def banana():
+    ''' pytest fixture returning the classic suffix array example
+
+    Returns:
+        the str "banana"
+    '''
+    return "banana"
+
+###############################################################################
+
+def test_suffix_and_lcp_arrays_of_banana(banana):
+    ''' pytest test for the suffix array and LCP array of "banana"
+        (1) stores the actual and expected arrays
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    index    = SuffixArray(String(banana))
+    result   = [list(index.suffixes), list(index.lcp)]
+    expected = [[5, 3, 1, 0, 4, 2], [0, 1, 3, 0, 0, 2]]
+    print_test(f'SuffixArray(String("{banana}")).suffixes', \
+               result = result, expected = expected)
+    assert(result == expected)
+
+@pytest.mark.parametrize('index_class', [SuffixArray, FMIndex])
+def test_count_and_locate_agree_with_scanning(index_class):
+    ''' pytest test that both indexes count and locate every substring of a
+        String, overlapping occurrences included
+        (1) stores the actual and expected positions for each needle
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text     = "mississippi, mississippi"
+    index    = index_class(String(text))
+    needles  = [text[i:i + 3] for i in range(len(text) - 2)] + ["€", "~~~~"]
+    result   = [(index.count(n), index.locate(n)) for n in needles]
+    expected = [(len(p), p) for p in \
+                ([i for i in range(len(text)) if text.startswith(n, i)] for n in needles)]
+    print_test(f'{index_class.__name__}(String("{text}")).locate(...)', \
+               result = result, expected = expected)
+    assert(result == expected)
+
+def test_longest_repeated_and_common_substrings(banana):
+    ''' pytest test for the longest repeated substring of a String and the
+        longest substring it has in common with another String
+        (1) stores the actual and expected substrings
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    index    = SuffixArray(String(banana))
+    result   = [str(index.longest_repeated_substring()), \
+                str(index.longest_common_substring(String("cabana"))), \
+                str(index.longest_common_substring("xyz"))]
+    expected = ["ana", "bana", ""]
+    print_test(f'SuffixArray(String("{banana}")).longest_repeated_substring()', \
+               result = result, expected = expected)
+    assert(result == expected)
+
+@pytest.mark.parametrize("index_class", [SuffixArray, FMIndex])
+def test_index_unaffected_by_later_setitem(banana, index_class):
+    ''' pytest test that overwriting a character of the indexed String does
+        not change the index (a SuffixArray keeps a frozen copy-on-write
+        snapshot, an FMIndex keeps no text at all)
+        (1) builds the index, then overwrites a character of the String
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    string = String(banana)
+    index  = index_class(string)
+    string[1] = 'x'
+    result   = [index.count("ana"), index.locate("ana"), index.len(), str(string)]
+    expected = [2, [1, 3], 6, "bxnana"]
+    print_test(f'{index_class.__name__}(String("{banana}")).locate("ana")', \
+               result = result, expected = expected)
+    assert(result == expected)
+
+@pytest.mark.parametrize("index_class", [SuffixArray, FMIndex])
+def test_index_empty_pattern_like_str(banana, index_class):
+    ''' pytest test that both indexes count and locate the empty pattern at
+        every index, the end of the text included, like str.count
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    index = index_class(String(banana))
+    result   = [index.count(""), index.locate("")]
+    expected = [banana.count(""), list(range(len(banana) + 1))]
+    print_test(f'{index_class.__name__}(String("{banana}")).count("")', \
+               result = result, expected = expected)
+    assert(result == expected)
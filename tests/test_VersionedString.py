@@ -0,0 +1,100 @@
+'''Tests of the persistent, versioned String in VersionedString.py.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from code_base.String import String
+from code_base.VersionedString import VersionedString
+from tests.test_String import print_test
+import pytest
+import tracemalloc
+
+###############################################################################
+
+@pytest.fixture
+def document():
+    ''' pytest fixture that returns a VersionedString with a short history:
+        version 0 "the quick brown fox", then three edits
+
+    Returns:
+        a VersionedString at version 3
+    '''
+    text = VersionedString("the quick brown fox")
+    text.replace_range(4, 9, "slow")     # 1: "the slow brown fox"
+    text.insert(-3, "red ")              # 2: "the slow brown red fox"
+    text[0] = "T"                        # 3: "The slow brown red fox"
+    return text
+
+###############################################################################
+
+def test_versions_are_kept(document):
+    ''' pytest test that every edit makes a new version and that the old
+        versions are left unchanged
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    result   = [document.version] + [str(document.at(v)) for v in range(4)]
+    expected = [3, "the quick brown fox", "the slow brown fox",
+                "the slow brown red fox", "The slow brown red fox"]
+    print_test('VersionedString("the quick brown fox").at(v)', result = result, expected = expected)
+    assert(result == expected)
+
+def test_undo_then_branch(document):
+    ''' pytest test that undo goes back and that editing afterwards starts a
+        new branch, keeping the undone versions
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    document.undo(2)
+    snapshot = document.snapshot()
+    document.delete(0, 4)
+    result   = [snapshot, str(document), document.version, str(document.at(3))]
+    expected = [1, "slow brown fox", 4, "The slow brown red fox"]
+    print_test('VersionedString.undo(2)', result = result, expected = expected)
+    assert(result == expected)
+
+def test_diff_versions_across_branches(document):
+    ''' pytest test that applying diff_versions(a, b) to version a gives b,
+        including between two branches
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    document.undo(2)
+    document.delete(0, 4)                # 4, branching from version 1
+    result = []
+    for old, new in ((0, 3), (3, 0), (3, 4)):
+        text = String(str(document.at(old)))
+        for start, end, replacement in document.diff_versions(old, new):
+            text.replace_range(start, end, replacement)
+        result.append(str(text))
+    expected = [str(document.at(3)), str(document.at(0)), str(document.at(4))]
+    print_test('VersionedString.diff_versions(3, 4)', result = result, expected = expected)
+    assert(result == expected)
+
+def test_versions_share_storage():
+    ''' pytest test that a thousand versions of a large String take far less
+        memory than a single copy of it
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text = VersionedString("0123456789" * 500_000)
+    tracemalloc.start()
+    for i in range(1000):
+        text[i * 4999] = "#"
+    extra = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    result   = [text.version, text.at(0)[0], text[0], extra < 5_000_000 // 2]
+    expected = [1000, "0", "#", True]
+    print_test('VersionedString("0123456789" * 500_000)[i] = "#"', result = result, expected = expected)
+    assert(result == expected)
@@ -0,0 +1,160 @@
+'''Tests of the edit distance, LCS and diff functions in distance.py, checked
+   against straightforward dynamic programming.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+import random
+
+from code_base.String import String
+from code_base import distance
+from tests.test_String import print_test
+import pytest
+
+###############################################################################
+
+def _levenshtein(a: str, b: str) -> int:
+    ''' the textbook O(n * m) edit distance '''
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y)))
+        previous = current
+    return previous[-1]
+
+def _lcs_length(a: str, b: str) -> int:
+    ''' the textbook O(n * m) longest common subsequence length '''
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b, 1):
+            current.append(previous[j - 1] + 1 if x == y else max(previous[j], current[j - 1]))
+        previous = current
+    return previous[-1]
+
+@pytest.fixture
+def text_pairs():
+    ''' pytest fixture that returns pairs of random strs over small alphabets
+        (so they have much in common), some of them near-duplicates
+
+    Returns:
+        a list of (str, str) tuples
+    '''
+    generator = random.Random(17)
+    pairs = [("", ""), ("", "abc"), ("kitten", "sitting"), ("a", "baab")]
+    for _ in range(150):
+        alphabet = generator.choice(["ab", "abc€", "abcdefgh😀"])
+        a = "".join(generator.choices(alphabet, k = generator.randint(0, 60)))
+        edited = list(a)
+        for _ in range(generator.randint(0, 12)):
+            edited.insert(generator.randint(0, len(edited)), generator.choice(alphabet))
+            if edited and generator.random() < 0.5:
+                del edited[generator.randrange(len(edited))]
+        b = "".join(edited) if generator.random() < 0.7 else \
+            "".join(generator.choices(alphabet, k = generator.randint(0, 60)))
+        pairs.append((a, b))
+    return pairs
+
+###############################################################################
+
+def test_levenshtein(text_pairs):
+    ''' pytest test that the edit distance matches dynamic programming, with
+        and without a cutoff, for Strings and strs
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    result, expected = [], []
+    for a, b in text_pairs:
+        exact = _levenshtein(a, b)
+        result.append((distance.levenshtein(a, b), String(a).edit_distance(String(b)),
+                       distance.levenshtein(a, b, 3), distance.levenshtein(a, b, 30)))
+        expected.append((exact, exact, min(exact, 4), min(exact, 31)))
+    print_test('levenshtein(a, b, max_distance)', result = result[:4], expected = expected[:4])
+    assert(result == expected)
+
+def test_lcs(text_pairs):
+    ''' pytest test that the LCS length matches dynamic programming, and that
+        String.lcs returns a common subsequence of that length
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    def is_subsequence(short: str, long: str) -> bool:
+        characters = iter(long)
+        return all(c in characters for c in short)
+
+    result, expected = [], []
+    for a, b in text_pairs:
+        common = str(String(a).lcs(b))
+        result.append((distance.lcs_length(a, b), len(common),
+                       is_subsequence(common, a) and is_subsequence(common, b)))
+        expected.append((_lcs_length(a, b),) * 2 + (True,))
+    print_test('lcs_length(a, b)', result = result[:4], expected = expected[:4])
+    assert(result == expected)
+
+def test_diff(text_pairs):
+    ''' pytest test that diff opcodes cover both texts in order, rebuild the
+        new text, and are minimal (as many edited characters as the LCS
+        leaves), by character and by line
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    def check(a, b, opcodes) -> tuple:
+        rebuilt, edited, covered = type(a)(), 0, (0, 0)
+        for tag, i1, i2, j1, j2 in opcodes:
+            covered = covered if covered != (i1, j1) else (i2, j2)
+            if tag == 'equal':
+                rebuilt += a[i1:i2]
+            else:
+                rebuilt += b[j1:j2]
+                edited += (i2 - i1) + (j2 - j1)
+        return covered, rebuilt == b, edited
+
+    result, expected = [], []
+    for a, b in text_pairs:
+        result.append(check(a, b, String(a).diff(b)))
+        expected.append(((len(a), len(b)), True, len(a) + len(b) - 2 * _lcs_length(a, b)))
+        a_lines, b_lines = a.replace("a", "a\n").splitlines(True), b.replace("a", "a\n").splitlines(True)
+        result.append(check(a_lines, b_lines, distance.diff("".join(a_lines), "".join(b_lines), lines = True)))
+        expected.append(((len(a_lines), len(b_lines)), True,
+                         len(a_lines) + len(b_lines) - 2 * _lcs_length(a_lines, b_lines)))
+    print_test('diff(a, b)', result = String("kitten").diff("sitting"),
+               expected = [('replace', 0, 1, 0, 1), ('equal', 1, 4, 1, 4), ('replace', 4, 5, 4, 5),
+                           ('equal', 5, 6, 5, 6), ('insert', 6, 6, 6, 7)])
+    assert(result == expected)
+
+def test_large_near_duplicates(monkeypatch):
+    ''' pytest test that long near-duplicate texts are compared exactly, and
+        that the bit-parallel fallbacks agree with the fast paths
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    generator = random.Random(229)
+    a = "".join(generator.choices("abcdefghijklmnopqrstuvwxyz ", k = 20_000))
+    b = a[:5000] + "XYZ" + a[5000:12000] + a[12005:19000] + "W" + a[19001:]
+    distances = (distance.levenshtein(a, b), distance.levenshtein(a, b, 5))
+    opcodes   = distance.diff(a, b)
+    ends      = ("Q" + a[4900:5100] + "Q", b[4900:5103])   # differ at both ends
+    # with the search from both ends disabled, diff splits by LCS passes only
+    monkeypatch.setattr(distance, 'SEARCH_LIMIT', 0)
+    monkeypatch.setattr(distance, 'BAND_START', 10 ** 6)
+    result   = (distances, opcodes, distance.levenshtein(*ends),
+                [op for op in distance.diff(a[:6000], b[:6003]) if op[0] != 'equal'])
+    expected = ((9, 6), [('equal', 0, 5000, 0, 5000), ('insert', 5000, 5000, 5000, 5003),
+                         ('equal', 5000, 12000, 5003, 12003), ('delete', 12000, 12005, 12003, 12003),
+                         ('equal', 12005, 19000, 12003, 18998), ('replace', 19000, 19001, 18998, 18999),
+                         ('equal', 19001, 20000, 18999, 19998)],
+                _levenshtein(*ends), [('insert', 5000, 5000, 5000, 5003)])
+    print_test('diff(20_000 chars)', result = result[:2], expected = expected[:2])
+    assert(result == expected)
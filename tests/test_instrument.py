@@ -0,0 +1,99 @@
+'''Tests of the opt-in String instrumentation in instrument.py.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+import io
+
+from code_base import String as string_module
+from code_base import instrument
+from code_base.String import String
+from tests.test_String import print_test
+
+###############################################################################
+
+def test_instrument_counts_copies():
+    ''' pytest test that calls, copied characters, buffers and Strings are
+        recorded per method, with nested calls charged to the outer one
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    with instrument.recording() as recorder:
+        text = String("abcdef")             # encodes 6 characters
+        view = text.substring(1, 4)         # a view: nothing copied
+        view[0] = "X"                       # copy-on-write of 3 characters
+        joined = text + "gh"                # encodes "gh", joins 8 characters
+    stats = recorder.stats()
+    result   = [(name, stats[name]['calls'], stats[name]['copied'],
+                 stats[name]['buffers'], stats[name]['strings'])
+                for name in ('__init__', 'substring', '__setitem__', '__add__')]
+    expected = [('__init__', 1, 6, 1, 1), ('substring', 1, 0, 0, 1),
+                ('__setitem__', 1, 3, 1, 0), ('__add__', 1, 10, 2, 2)]
+    print_test('instrument.recording() stats', result = result, expected = expected)
+    assert(result == expected)
+
+def test_instrument_removed_when_stopped():
+    ''' pytest test that stopping the last Recorder puts back the original
+        methods and helpers, so that disabled instrumentation costs nothing
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    before = (String.__add__, String.__init__, String.__dict__['from_file'], string_module.encode)
+    recorder = instrument.start()
+    during = (String.__add__, String.__init__, string_module.encode)
+    instrument.stop(recorder)
+    after  = (String.__add__, String.__init__, String.__dict__['from_file'], string_module.encode)
+    result   = (instrument.is_enabled(), after == before, any(a is b for a, b in zip(during, before)))
+    expected = (False, True, False)
+    print_test('instrument.stop(recorder)', result = result, expected = expected)
+    assert(result == expected)
+
+def test_instrument_sites_and_dumps():
+    ''' pytest test that call sites are recorded and periodic dumps written
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    stream = io.StringIO()
+    with instrument.recording(sites = True, every = 0, stream = stream) as recorder:
+        for _ in range(3):
+            String("abc")
+    sites = recorder.stats(by_site = True)
+    result   = ([(method, "test_instrument.py:" in site) for method, site in sites],
+                list(sites.values())[0]['calls'], stream.getvalue().count("__init__ @"))
+    expected = ([('__init__', True)], 3, 3)
+    print_test('instrument.recording(sites = True, every = 0)', result = result, expected = expected)
+    assert(result == expected)
+
+def test_instrument_charges_helper_modules_and_generators():
+    ''' pytest test that copies made outside String.py (by distance.py and
+        RollingHash.py) are counted, and that the work of iterating over the
+        generator returned by split is charged to split, as a single call
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text = String("kitten,sitting," * 10)
+    view = text.substring(7, 14)              # "sitting", a view
+    with instrument.recording() as recorder:
+        text.edit_distance(view)              # copies both sides' code points
+        view.rolling_hash()                   # copies the view's 7 characters
+        pieces = text.split(",")
+        before = recorder.stats()['split']['strings']
+        count  = sum(1 for _ in pieces)       # 21 views made while iterating
+    stats = recorder.stats()
+    result   = (stats['edit_distance']['copied'], stats['rolling_hash']['copied'],
+                before, (stats['split']['calls'], stats['split']['strings'], count))
+    expected = (text.len() + view.len(), 7, 1, (1, 22, 21))
+    print_test('instrument.recording(): String("kitten,sitting,...").split(",")',
+               result = result, expected = expected)
+    assert(result == expected)
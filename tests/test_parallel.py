@@ -0,0 +1,90 @@
+'''Tests of the multi-process search and transform functions in parallel.py,
+   using tiny chunks so that many occurrences straddle chunk boundaries.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+import random
+
+from code_base.String import String
+from code_base import parallel
+from tests.test_String import print_test
+import pytest
+
+###############################################################################
+
+@pytest.fixture
+def chunked_text():
+    ''' pytest fixture that returns a random str over a small alphabet with
+        wide characters, long enough to span dozens of 7-character chunks
+
+    Returns:
+        an str of 500 characters
+    '''
+    return "".join(random.Random(19).choices("ab€😀", k = 500))
+
+def _non_overlapping(text: str, sub: str) -> list:
+    ''' returns the starts of the occurrences str.count counts '''
+    starts, found = [], text.find(sub)
+    while found >= 0:
+        starts.append(found)
+        found = text.find(sub, found + len(sub))
+    return starts
+
+###############################################################################
+
+def test_parallel_search(chunked_text):
+    ''' pytest test that searches split over worker processes agree with str,
+        for needles that straddle chunks or overlap themselves
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text = String(chunked_text)
+    result, expected = [], []
+    for sub in ("a", "ab€", "aa", "€😀€", "bab", "xyz"):
+        result.append((parallel.find(text, sub, 3, 7), parallel.rfind(text, sub, 3, 7),
+                       parallel.count(text, sub, 3, 7), parallel.find_all(text, sub, 3, 7)))
+        expected.append((chunked_text.find(sub), chunked_text.rfind(sub),
+                         chunked_text.count(sub), _non_overlapping(chunked_text, sub)))
+    print_test('parallel.count(String(text), "aa", workers = 3)', result = result[2][2],
+               expected = expected[2][2])
+    assert(result == expected)
+
+def test_parallel_transform(chunked_text):
+    ''' pytest test that chunk-wise transforms rebuild the whole text in
+        order, including transforms that change its length
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text  = String(chunked_text)
+    table = {ord("a"): "AA", ord("€"): None}
+    result   = (str(parallel.transform(text, str.swapcase, 2, 11)),
+                str(parallel.translate(text, table, 2, 11)))
+    expected = (chunked_text.swapcase(), chunked_text.translate(table))
+    print_test('parallel.translate(String(text), table, workers = 2)', result = result[1][:20],
+               expected = expected[1][:20])
+    assert(result == expected)
+
+def test_parallel_single_worker_and_edges():
+    ''' pytest test that one worker (in process), empty texts and empty needles
+        follow str
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    result   = (parallel.count("abcabc", "bc", 1, 2), parallel.find(String(""), "a", 2, 4),
+                parallel.count(String("abc"), "", 2, 2), parallel.rfind("abc", "", 2, 2),
+                str(parallel.transform(String(""), str.upper, 2)))
+    expected = (2, -1, 4, 3, "")
+    print_test('parallel.count("abcabc", "bc", workers = 1)', result = result, expected = expected)
+    with pytest.raises(ValueError):
+        parallel.find_all("abc", "")
+    assert(result == expected)
@@ -0,0 +1,86 @@
+'''Tests of the binary String files written by serialize.dump and mapped back
+   by serialize.load.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+from array import array
+import struct
+
+from code_base.String import String
+from code_base.MappedBuffer import MappedBuffer
+from code_base import serialize
+from tests.test_String import print_test
+import pytest
+
+###############################################################################
+
+def test_dump_and_load_batch(tmp_path):
+    ''' pytest test that a batch of strs, Strings, views and ropes of mixed
+        widths loads back equal, as views of the mapped file
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    path    = tmp_path / "batch.dcs"
+    strings = ["abc", "", String("h€llo"), "😀 x", String("ab") + String("cd" * 300),
+               String("a needle here").substring(2, 8)]
+    serialize.dump(strings, path)
+    batch   = serialize.load(path)
+    result   = (batch.to_list(), len(batch), isinstance(batch[2]._chars, MappedBuffer),
+                batch[-1].find("dle"), batch[4].count("cd"), batch[1:4].to_list(),
+                list(batch[2]), batch[3] == "😀 x")
+    expected = ([str(s) for s in strings], 6, True, 3, 300, ["", "h€llo", "😀 x"],
+                list("h€llo"), True)
+    print_test(f"serialize.load('{path.name}')", result = result[:2], expected = expected[:2])
+    assert(result == expected)
+
+def test_dump_and_load_single(tmp_path):
+    ''' pytest test that a single String loads back as a String, which copies
+        the mapped characters before being written to
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    path = tmp_path / "single.dcs"
+    text = "héllo wörld " * 500
+    serialize.dump(String(text), path)
+    loaded = serialize.load(path)
+    before = (type(loaded) is String, loaded == text, loaded.find("wör", 3000), loaded[-2])
+    loaded[0] = "H"
+    serialize.dump("", tmp_path / "empty.dcs")
+    result   = (before, str(loaded)[:5], str(serialize.load(path))[:5],
+                str(serialize.load(tmp_path / "empty.dcs")))
+    expected = ((True, True, 3006, "d"), "Héllo", "héllo", "")
+    print_test(f"serialize.load('{path.name}')[0] = 'H'", result = result, expected = expected)
+    assert(result == expected)
+
+def test_load_other_byte_order_and_bad_files(tmp_path):
+    ''' pytest test that a file written in the other byte order is swapped
+        on loading, and that files in another format are rejected
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    order   = b'>' if serialize._ORDER == b'<' else b'<'
+    offsets = array('Q', [0, 2, 5])
+    chars   = array('H', map(ord, "h€llo"))
+    offsets.byteswap(); chars.byteswap()
+    swapped = tmp_path / "swapped.dcs"
+    swapped.write_bytes(struct.pack(order.decode() + serialize._HEADER, serialize.MAGIC, 1,
+                                    order, 2, 0, 2, 5) + offsets.tobytes() + chars.tobytes())
+    result   = serialize.load(swapped).to_list()
+    expected = ["h€", "llo"]
+    print_test(f"serialize.load('{swapped.name}')", result = result, expected = expected)
+    (tmp_path / "text.txt").write_text("not a String file")
+    (tmp_path / "short.dcs").write_bytes(swapped.read_bytes()[:-1])
+    for name in ("text.txt", "short.dcs"):
+        with pytest.raises(ValueError):
+            serialize.load(tmp_path / name)
+    assert(result == expected)
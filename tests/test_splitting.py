@@ -0,0 +1,104 @@
+'''Tests of String.split, rsplit, splitlines and partition, which return views
+   of the String's buffer.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+import re
+
+from code_base.String import String
+from code_base import splitting
+from tests.test_String import print_test
+import pytest
+
+###############################################################################
+
+@pytest.fixture
+def messy_text():
+    ''' pytest fixture that returns an str with runs of mixed whitespace, empty
+        fields, wide characters and self-overlapping separators
+
+    Returns:
+        an str
+    '''
+    return "  alpha,beta;;gamma \t€uro\n\n😀 aaa,aaaa \r\n delta  "
+
+###############################################################################
+
+def test_split_and_rsplit(messy_text, monkeypatch):
+    ''' pytest test that split and rsplit (also on a rope, and with delimiters
+        straddling the 5-character windows searched) agree with str, with and
+        without maxsplit
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    monkeypatch.setattr(splitting, "CHUNK", 5)
+    strings = (String(messy_text), String(messy_text[:20]) + String(messy_text[20:]))
+    result, expected = [], []
+    for string in strings:
+        for sep in (None, ",", "aa", " \t", ";"):
+            for maxsplit in (-1, 0, 1, 3):
+                result.append(([str(piece) for piece in string.split(sep, maxsplit)],
+                               [str(piece) for piece in string.rsplit(sep, maxsplit)]))
+                expected.append((messy_text.split(sep, maxsplit), messy_text.rsplit(sep, maxsplit)))
+    print_test(f"String({messy_text!r}).rsplit('aa')", result = result[9][1],
+               expected = expected[9][1])
+    assert(result == expected)
+
+def test_split_any_of_splitlines_partition(messy_text):
+    ''' pytest test that any-of delimiters split like re.split, and that
+        splitlines and partition/rpartition agree with str
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    string = String(messy_text)
+    result   = ([str(piece) for piece in string.split(any_of = ",;\n")],
+                [str(piece) for piece in string.split(any_of = String(",;"), maxsplit = 2)],
+                [str(piece) for piece in string.rsplit(any_of = ",;", maxsplit = 2)],
+                [str(piece) for piece in string.splitlines()],
+                [str(piece) for piece in string.splitlines(keepends = True)],
+                [str(piece) for piece in String("").splitlines()],
+                tuple(map(str, string.partition("aa"))), tuple(map(str, string.rpartition("aa"))),
+                tuple(map(str, string.partition("zz"))), tuple(map(str, string.rpartition("zz"))))
+    expected = (re.split("[,;\n]", messy_text), re.split("[,;]", messy_text, maxsplit = 2),
+                ["  alpha,beta;", "gamma \t€uro\n\n😀 aaa", "aaaa \r\n delta  "],
+                messy_text.splitlines(), messy_text.splitlines(keepends = True), [],
+                messy_text.partition("aa"), messy_text.rpartition("aa"),
+                messy_text.partition("zz"), messy_text.rpartition("zz"))
+    print_test(f"String({messy_text!r}).split(any_of = ',;\\n')", result = result[0],
+               expected = expected[0])
+    assert(result == expected)
+
+def test_split_pieces_are_views():
+    ''' pytest test that the pieces share the String's buffer, are those of
+        the String as it was when splitting started, and that bad delimiters
+        are rejected at once
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    string = String("key=value; other=thing")
+    pieces = string.split("; ")
+    first  = next(pieces)
+    string[0] = "K"
+    rest   = list(pieces)
+    head, sep, tail = first.partition("=")
+    result   = (str(first), [str(piece) for piece in rest], str(string)[:3],
+                first._chars is rest[0]._chars, (str(head), str(sep), str(tail)),
+                tail._chars is first._chars)
+    expected = ("key=value", ["other=thing"], "Key", True, ("key", "=", "value"), True)
+    print_test('String("key=value; other=thing").split("; ")', result = result, expected = expected)
+    for bad in ({"sep": ""}, {"any_of": ""}, {"sep": ",", "any_of": ";"}):
+        with pytest.raises(ValueError):
+            string.split(**bad)
+    with pytest.raises(ValueError):
+        string.partition("")
+    assert(result == expected)
@@ -0,0 +1,87 @@
+'''Tests of the streaming readers in stream.py, which turn a file or binary
+   stream into String objects a bounded chunk at a time.
+
+Authors: Anh Than      (athan@bates.edu)
+         Thomas Costin (tcostin@bates.edu)
+         Max MacAvoy   (mmacavoy@bates.edu)
+
+'''
+
+import io
+
+from code_base.String import String
+from code_base.stream import read_chunks, read_lines, read_records
+from tests.test_String import print_test
+import pytest
+
+###############################################################################
+
+@pytest.fixture
+def wide_text():
+    ''' pytest fixture that returns an str of lines mixing 1-, 2-, 3- and
+        4-byte UTF-8 characters
+
+    Returns:
+        an str ending with a newline
+    '''
+    return "first line\ncafé €5\n\nsmile 😀😀\nlast\n"
+
+###############################################################################
+
+def test_read_chunks_split_characters(wide_text):
+    ''' pytest test that chunks which split multi-byte characters still decode
+        to the original text
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    chunks   = list(read_chunks(io.BytesIO(wide_text.encode('utf-8')), chunk_size = 3))
+    result   = (all(isinstance(c, String) for c in chunks), "".join(str(c) for c in chunks))
+    expected = (True, wide_text)
+    print_test('read_chunks(BytesIO, chunk_size = 3)', result = result, expected = expected)
+    assert(result == expected)
+
+def test_read_lines_across_chunks(wide_text):
+    ''' pytest test that lines straddling chunk boundaries are reassembled,
+        with and without their line endings
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    source = wide_text.encode('utf-16-le')
+    result   = ([str(s) for s in read_lines(io.BytesIO(source), 'utf-16-le', 5)],
+                [str(s) for s in read_lines(io.BytesIO(source), 'utf-16-le', 5, keepends = True)])
+    expected = (wide_text.split("\n")[:-1], wide_text.splitlines(keepends = True))
+    print_test('read_lines(BytesIO, chunk_size = 5)', result = result, expected = expected)
+    assert(result == expected)
+
+def test_read_records_long_delimiter(tmp_path):
+    ''' pytest test that a multi-character delimiter split across chunks is
+        found, and that a trailing partial record is yielded from a file
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    text = "alpha||beta|gamma||||delta"
+    path = tmp_path / "records.txt"
+    path.write_text(text, encoding = 'utf-8')
+    result   = [str(s) for s in read_records(path, "||", chunk_size = 2)]
+    expected = text.split("||")
+    print_test('read_records(path, "||", chunk_size = 2)', result = result, expected = expected)
+    assert(result == expected)
+
+def test_read_records_empty_delimiter():
+    ''' pytest test that an empty delimiter is rejected
+        (1) stores the actual and expected results
+        (2) calls print_test with string version of test, result of the actual
+            test, and expected result
+        (3) assert required by pytest
+    '''
+    with pytest.raises(ValueError):
+        next(read_records(io.BytesIO(b"abc"), ""))
+    result, expected = True, True
+    print_test('read_records(BytesIO, "")', result = result, expected = expected)
+    assert(result == expected)